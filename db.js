@@ -34,6 +34,19 @@ db.pragma('foreign_keys = ON');
 db.pragma('busy_timeout  = 5000');
 db.pragma('synchronous   = NORMAL');
 
+// Připravené statementy cachované podle SQL textu — logovací inserty běží na
+// každém requestu, db.prepare() by SQL parsoval pokaždé znovu. Příprava se
+// provede až při prvním volání (tabulky vznikají v initSchema).
+const _stmtCache = new Map();
+function cachedStmt(sql) {
+  let stmt = _stmtCache.get(sql);
+  if (!stmt) {
+    stmt = db.prepare(sql);
+    _stmtCache.set(sql, stmt);
+  }
+  return stmt;
+}
+
 // ── Schéma ────────────────────────────────────────────────────────────────────
 
 function initSchema() {
@@ -79,7 +92,10 @@ function initSchema() {
     );
     CREATE INDEX IF NOT EXISTS watchlist_active  ON watchlist (active, last_checked_at);
     CREATE INDEX IF NOT EXISTS watchlist_address ON watchlist (address);
-    CREATE INDEX IF NOT EXISTS watchlist_email   ON watchlist (notify_email, active);
+    -- getUserWatchlist: rovnost na email + active, řazení podle created_at bez sortu
+    CREATE INDEX IF NOT EXISTS watchlist_email_created ON watchlist (notify_email, active, created_at DESC);
+    DROP INDEX IF EXISTS watchlist_email; -- nahrazen watchlist_email_created (prefix)
+    CREATE INDEX IF NOT EXISTS watchlist_chat    ON watchlist (notify_telegram_chat, active, created_at);
 
     CREATE TABLE IF NOT EXISTS subscriptions (
       id                    INTEGER PRIMARY KEY,
@@ -94,8 +110,13 @@ function initSchema() {
       created_at            TEXT    NOT NULL DEFAULT (datetime('now')),
       updated_at            TEXT    NOT NULL DEFAULT (datetime('now'))
     );
-    CREATE INDEX IF NOT EXISTS subscriptions_email  ON subscriptions (email);
     CREATE INDEX IF NOT EXISTS subscriptions_status ON subscriptions (status, current_period_end);
+    -- getActiveSubscription*: rovnost na email/chat + status, řazení podle current_period_end
+    CREATE INDEX IF NOT EXISTS subscriptions_email_active ON subscriptions (email, status, current_period_end DESC);
+    CREATE INDEX IF NOT EXISTS subscriptions_chat_active  ON subscriptions (telegram_chat_id, status, current_period_end DESC);
+    -- nahrazeny *_active indexy (prefix) — na starších DB by zbytečně zdržovaly zápisy
+    DROP INDEX IF EXISTS subscriptions_email;
+    DROP INDEX IF EXISTS subscriptions_chat;
 
     CREATE TABLE IF NOT EXISTS api_keys (
       id            INTEGER PRIMARY KEY,
@@ -110,7 +131,8 @@ function initSchema() {
       revoked_at    TEXT,
       active        INTEGER NOT NULL DEFAULT 1
     );
-    CREATE INDEX IF NOT EXISTS api_keys_email ON api_keys (email, active);
+    CREATE INDEX IF NOT EXISTS api_keys_email_created ON api_keys (email, active, created_at DESC);
+    DROP INDEX IF EXISTS api_keys_email; -- nahrazen api_keys_email_created (prefix)
     CREATE INDEX IF NOT EXISTS api_keys_hash  ON api_keys (key_hash);
 
     CREATE TABLE IF NOT EXISTS scan_history (
@@ -125,7 +147,9 @@ function initSchema() {
       result_json TEXT,
       created_at  TEXT    NOT NULL DEFAULT (datetime('now'))
     );
-    CREATE INDEX IF NOT EXISTS scan_history_email     ON scan_history (email, created_at DESC);
+    CREATE INDEX IF NOT EXISTS scan_history_email_page ON scan_history (email, created_at DESC, id DESC);
+    -- nahrazen scan_history_email_page (prefix) — na starších DB by zbytečně zdržoval inserty
+    DROP INDEX IF EXISTS scan_history_email;
     CREATE INDEX IF NOT EXISTS scan_history_created   ON scan_history (created_at DESC);
     CREATE INDEX IF NOT EXISTS scan_history_addr_type ON scan_history (address, scan_type, created_at DESC);
 
@@ -440,6 +464,8 @@ function migrateAccuracySignalsSchema() {
     "CREATE INDEX IF NOT EXISTS known_scams_confidence ON known_scams (confidence DESC, scam_type)",
     // IP blacklist — pouze aktivní záznamy
     "CREATE INDEX IF NOT EXISTS ip_blacklist_active ON ip_blacklist (ip) WHERE expires_at IS NULL",
+    // Reset hesla — lookup podle tokenu bez full scanu tabulky users
+    "CREATE INDEX IF NOT EXISTS users_reset_token ON users (reset_token) WHERE reset_token IS NOT NULL",
   ];
   for (const sql of idxs) {
     try { db.exec(sql); } catch {}
@@ -516,7 +542,7 @@ const pool = {
 // ── Platby ────────────────────────────────────────────────────────────────────
 
 async function logPayment({ tx_sig, resource, required_micro_usdc, micro_usdc, verified, reason, ip }) {
-  db.prepare(`
+  cachedStmt(`
     INSERT INTO payments (tx_sig, resource, required_micro_usdc, micro_usdc, verified, reason, ip)
     VALUES (?, ?, ?, ?, ?, ?, ?)
     ON CONFLICT (tx_sig) DO NOTHING
@@ -525,7 +551,7 @@ async function logPayment({ tx_sig, resource, required_micro_usdc, micro_usdc, v
 
 // Anti-replay: check used_signatures table (dedicated, fast PRIMARY KEY lookup).
 async function isAlreadyUsed(sig) {
-  const row = db.prepare(
+  const row = cachedStmt(
     'SELECT 1 FROM used_signatures WHERE sig = ? LIMIT 1'
   ).get(sig);
   return !!row;
@@ -539,7 +565,7 @@ async function isAlreadyUsed(sig) {
 // KEY deduplicates under a single writer lock. Callers MUST check the return value and
 // reject the request when it is FALSE to prevent double-spend via parallel replays.
 function markSignatureUsed(sig) {
-  const r = db.prepare(
+  const r = cachedStmt(
     'INSERT OR IGNORE INTO used_signatures (sig) VALUES (?)'
   ).run(sig);
   return r.changes === 1; // true = atomic claim won, false = another racer beat us
@@ -547,13 +573,77 @@ function markSignatureUsed(sig) {
 
 // ── Events ────────────────────────────────────────────────────────────────────
 
+// Analytické eventy (page_view, scan_started, payment_*) chodí v dávkách s každým
+// requestem — místo samostatné autocommit transakce (= WAL commit) na každý event
+// je bufferujeme a zapíšeme jednou transakcí po EVENT_FLUSH_MS nebo EVENT_FLUSH_MAX
+// řádcích. created_at se bere při zařazení, takže čas eventu se bufferem neposune.
+// Promise z logEvent() se vyřeší až po zápisu dávky (nebo rejectne s chybou insertu)
+// a čtení z tabulky events si buffer nejdřív dopíše.
+const EVENT_FLUSH_MS  = 1000;
+const EVENT_FLUSH_MAX = 200;
+let _eventBuffer     = [];
+let _eventBatch      = null; // { promise, resolve, reject } pro řádky v _eventBuffer
+let _eventFlushTimer = null;
+let _insertEventsTx  = null;
+
+function flushEvents() {
+  if (_eventFlushTimer) { clearTimeout(_eventFlushTimer); _eventFlushTimer = null; }
+  if (!_eventBuffer.length) return;
+  const rows  = _eventBuffer;
+  const batch = _eventBatch;
+  _eventBuffer = [];
+  _eventBatch  = null;
+  if (!_insertEventsTx) {
+    const stmt = cachedStmt(
+      'INSERT INTO events (name, resource, ip, meta, created_at) VALUES (?, ?, ?, ?, ?)'
+    );
+    _insertEventsTx = db.transaction(list => { for (const r of list) stmt.run(r); });
+  }
+  try {
+    _insertEventsTx(rows);
+  } catch (e) {
+    console.error(`[db] logEvent flush error (${rows.length} events dropped):`, e.message);
+    batch.reject(e);
+    return;
+  }
+  batch.resolve();
+}
+
 async function logEvent({ name, resource, ip, meta }) {
-  db.prepare(
-    'INSERT INTO events (name, resource, ip, meta) VALUES (?, ?, ?, ?)'
-  ).run(name, resource || null, ip || null, meta ? JSON.stringify(meta) : null);
+  if (!_eventBatch) {
+    let resolve, reject;
+    const promise = new Promise((res, rej) => { resolve = res; reject = rej; });
+    _eventBatch = { promise, resolve, reject };
+  }
+  const { promise } = _eventBatch;
+  _eventBuffer.push([
+    name, resource || null, ip || null, meta ? JSON.stringify(meta) : null,
+    toSQLiteTimestamp(new Date()),
+  ]);
+  if (_eventBuffer.length >= EVENT_FLUSH_MAX) {
+    flushEvents();
+  } else if (!_eventFlushTimer) {
+    _eventFlushTimer = setTimeout(flushEvents, EVENT_FLUSH_MS);
+    _eventFlushTimer.unref();
+  }
+  return promise;
+}
+
+// Dopsat zbytek bufferu při ukončení: beforeExit (prázdná event loop), exit
+// (process.exit() v graceful shutdown) i SIGTERM/SIGINT. Pokud na signál nikdo
+// jiný neposlouchá (skripty bez graceful shutdown), po flushi ho pošleme znovu,
+// aby proces skončil výchozím způsobem.
+process.on('beforeExit', flushEvents);
+process.on('exit', flushEvents);
+for (const sig of ['SIGTERM', 'SIGINT']) {
+  process.once(sig, () => {
+    flushEvents();
+    if (process.listenerCount(sig) === 0) process.kill(process.pid, sig);
+  });
 }
 
 async function getFunnelStats(days = 30) {
+  flushEvents();
   const cutoff = toSQLiteTimestamp(new Date(Date.now() - days * 86400000));
   return db.prepare(`
     SELECT name,
@@ -585,6 +675,7 @@ async function getPaymentStats(days = 30) {
 }
 
 async function getPageviewStats(days = 30) {
+  flushEvents();
   const cutoff = toSQLiteTimestamp(new Date(Date.now() - days * 86400000));
   return db.prepare(`
     SELECT date(created_at)              AS day,
@@ -599,6 +690,7 @@ async function getPageviewStats(days = 30) {
 }
 
 async function countFreeScansToday(ip) {
+  flushEvents();
   const dayStart = new Date();
   dayStart.setUTCHours(0, 0, 0, 0);
   const row = db.prepare(`
@@ -611,20 +703,16 @@ async function countFreeScansToday(ip) {
 // ── Watchlist ─────────────────────────────────────────────────────────────────
 
 async function addWatchlistEntry({ address, label, notify_telegram_chat, notify_email }) {
-  try {
-    const result = db.prepare(`
-      INSERT INTO watchlist (address, label, notify_telegram_chat, notify_email)
-      VALUES (?, ?, ?, ?)
-      ON CONFLICT (address, notify_telegram_chat) DO UPDATE
-        SET active = 1, label = EXCLUDED.label
-    `).run(address, label || null, notify_telegram_chat || null, notify_email || null);
-    const id = result.lastInsertRowid || db.prepare(
-      'SELECT id FROM watchlist WHERE address = ? AND notify_telegram_chat IS ?'
-    ).get(address, notify_telegram_chat || null)?.id;
-    return db.prepare('SELECT id, address, label, created_at FROM watchlist WHERE id = ?').get(id);
-  } catch (e) {
-    throw e;
-  }
+  const result = db.prepare(`
+    INSERT INTO watchlist (address, label, notify_telegram_chat, notify_email)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT (address, notify_telegram_chat) DO UPDATE
+      SET active = 1, label = EXCLUDED.label
+  `).run(address, label || null, notify_telegram_chat || null, notify_email || null);
+  const id = result.lastInsertRowid || db.prepare(
+    'SELECT id FROM watchlist WHERE address = ? AND notify_telegram_chat IS ?'
+  ).get(address, notify_telegram_chat || null)?.id;
+  return db.prepare('SELECT id, address, label, created_at FROM watchlist WHERE id = ?').get(id);
 }
 
 async function removeWatchlistEntry(id, notify_telegram_chat) {
@@ -657,7 +745,7 @@ async function updateWatchlistRisk(id, { risk_level, risk_score, risk_summary })
 }
 
 async function listWatchlistForChat(notify_telegram_chat) {
-  return db.prepare(`
+  return cachedStmt(`
     SELECT id, address, label, last_risk_level, last_checked_at
     FROM watchlist
     WHERE notify_telegram_chat = ? AND active = 1
@@ -697,7 +785,7 @@ async function removeUserWatchlistEntry({ email, id }) {
 }
 
 async function getUserWatchlist(email) {
-  return db.prepare(`
+  return cachedStmt(`
     SELECT id, address, label, last_risk_level, last_risk_score, last_checked_at, created_at
     FROM watchlist
     WHERE notify_email = ? AND active = 1
@@ -724,7 +812,7 @@ async function upsertSubscription({ stripe_customer_id, stripe_sub_id, email, ti
 }
 
 async function getActiveSubscription(email) {
-  return db.prepare(`
+  return cachedStmt(`
     SELECT * FROM subscriptions
     WHERE email = ? AND status = 'active'
       AND (current_period_end IS NULL OR current_period_end > datetime('now'))
@@ -735,7 +823,7 @@ async function getActiveSubscription(email) {
 
 async function getActiveSubscriptionByChatId(telegram_chat_id) {
   if (!telegram_chat_id) return null;
-  return db.prepare(`
+  return cachedStmt(`
     SELECT * FROM subscriptions
     WHERE telegram_chat_id = ? AND status = 'active'
       AND (current_period_end IS NULL OR current_period_end > datetime('now'))
@@ -751,7 +839,7 @@ function countWatchlistForEmail(email) {
 }
 
 function countWatchlistForChat(telegram_chat_id) {
-  return db.prepare(
+  return cachedStmt(
     `SELECT COUNT(*) as n FROM watchlist WHERE notify_telegram_chat = ? AND active = 1`
   ).get(String(telegram_chat_id))?.n ?? 0;
 }
@@ -770,10 +858,40 @@ async function createApiKey({ email, tier, label }) {
   return { ...row, key: raw };
 }
 
+// Platné klíče cachované krátce podle hashe — requireApiKey běží na každém
+// placeném requestu předplatitele. Cachují se jen pole potřebná pro autorizaci
+// (id, email, tier, active), ne usage_count/last_used_at, které se mění s každým
+// requestem. Neplatné klíče se necachují; revokeApiKey záznam okamžitě zahodí
+// přes index id → hash.
+const API_KEY_CACHE_TTL_MS = 60_000;
+const API_KEY_CACHE_MAX    = 1000;
+const _apiKeyCache    = new Map(); // key_hash → { record, expiresAt }
+const _apiKeyHashById = new Map(); // id → key_hash
+
+function _dropApiKeyCache(hash) {
+  const hit = _apiKeyCache.get(hash);
+  if (!hit) return;
+  _apiKeyCache.delete(hash);
+  _apiKeyHashById.delete(hit.record.id);
+}
+
 async function validateApiKey(rawKey) {
   if (!rawKey || !rawKey.startsWith('im_')) return null;
   const hash = crypto.createHash('sha256').update(rawKey).digest('hex');
-  return db.prepare('SELECT * FROM api_keys WHERE key_hash = ? AND active = 1 LIMIT 1').get(hash) || null;
+  const now  = Date.now();
+  const hit  = _apiKeyCache.get(hash);
+  if (hit && hit.expiresAt > now) return hit.record;
+
+  const record = cachedStmt(
+    'SELECT id, email, tier, active FROM api_keys WHERE key_hash = ? AND active = 1 LIMIT 1'
+  ).get(hash) || null;
+  _dropApiKeyCache(hash);
+  if (record) {
+    if (_apiKeyCache.size >= API_KEY_CACHE_MAX) _dropApiKeyCache(_apiKeyCache.keys().next().value);
+    _apiKeyCache.set(hash, { record, expiresAt: now + API_KEY_CACHE_TTL_MS });
+    _apiKeyHashById.set(record.id, hash);
+  }
+  return record;
 }
 
 async function incrementApiKeyUsage(id) {
@@ -783,7 +901,7 @@ async function incrementApiKeyUsage(id) {
 }
 
 async function listApiKeys(email) {
-  return db.prepare(`
+  return cachedStmt(`
     SELECT id, key_prefix, email, tier, label, usage_count, last_used_at, created_at
     FROM api_keys WHERE email = ? AND active = 1 ORDER BY created_at DESC
   `).all(email);
@@ -793,13 +911,17 @@ async function revokeApiKey(id, email) {
   const result = db.prepare(
     "UPDATE api_keys SET active = 0, revoked_at = datetime('now') WHERE id = ? AND email = ?"
   ).run(id, email);
+  if (result.changes > 0) {
+    const hash = _apiKeyHashById.get(Number(id));
+    if (hash) _dropApiKeyCache(hash);
+  }
   return result.changes > 0;
 }
 
 // ── Scan history ──────────────────────────────────────────────────────────────
 
 async function logScanToHistory({ email, address, scan_type, risk_score, risk_level, summary, cached, result_json }) {
-  db.prepare(`
+  cachedStmt(`
     INSERT INTO scan_history
       (email, address, scan_type, risk_score, risk_level, summary, cached, result_json)
     VALUES (?, ?, ?, ?, ?, ?, ?, ?)
@@ -815,7 +937,7 @@ async function logScanToHistory({ email, address, scan_type, risk_score, risk_le
 async function getCachedScanFromDb(address, scan_type, maxAgeMs = 3_600_000) {
   // SQLite datetime format: 'YYYY-MM-DD HH:MM:SS' — toISOString() uses 'T' separator
   const cutoff = toSQLiteTimestamp(new Date(Date.now() - maxAgeMs));
-  const row = db.prepare(`
+  const row = cachedStmt(`
     SELECT result_json FROM scan_history
     WHERE address = ? AND scan_type = ? AND result_json IS NOT NULL
       AND created_at > ?
@@ -825,12 +947,21 @@ async function getCachedScanFromDb(address, scan_type, maxAgeMs = 3_600_000) {
   try { return JSON.parse(row.result_json); } catch { return null; }
 }
 
-async function getScanHistory(email, limit = 50) {
-  return db.prepare(`
+// `before` = { created_at, id } posledního řádku předchozí stránky (keyset
+// stránkování) — index scan_history_email_page vrací rovnou další stránku bez OFFSETu.
+async function getScanHistory(email, limit = 50, before = null) {
+  if (!before) {
+    return cachedStmt(`
+      SELECT id, address, scan_type, risk_score, risk_level, summary, cached, created_at
+      FROM scan_history WHERE email = ?
+      ORDER BY created_at DESC, id DESC LIMIT ?
+    `).all(email, limit);
+  }
+  return cachedStmt(`
     SELECT id, address, scan_type, risk_score, risk_level, summary, cached, created_at
-    FROM scan_history WHERE email = ?
-    ORDER BY created_at DESC LIMIT ?
-  `).all(email, limit);
+    FROM scan_history WHERE email = ? AND (created_at, id) < (?, ?)
+    ORDER BY created_at DESC, id DESC LIMIT ?
+  `).all(email, before.created_at, before.id, limit);
 }
 
 // ── Ads ───────────────────────────────────────────────────────────────────────
@@ -918,11 +1049,16 @@ async function findOrCreateUser({ email, name, avatar_url, provider, provider_id
 }
 
 async function findUserById(id) {
-  return db.prepare('SELECT * FROM users WHERE id = ?').get(id) || null;
+  // Volá se z passport deserializeUser při každém přihlášeném requestu — jen
+  // sloupce, které routy z req.user čtou (bez password_hash / reset_token)
+  return cachedStmt(`
+    SELECT id, email, name, avatar_url, provider, stripe_customer_id, created_at
+    FROM users WHERE id = ?
+  `).get(id) || null;
 }
 
 async function findUserByEmail(email) {
-  return db.prepare('SELECT * FROM users WHERE email = ?').get(email) || null;
+  return cachedStmt('SELECT * FROM users WHERE email = ?').get(email) || null;
 }
 
 async function createLocalUser({ email, password_hash, name }) {
@@ -1022,12 +1158,14 @@ async function getRecentHighRiskScans(email) {
 // ── Live stats (server.js /stats endpoint) ────────────────────────────────────
 
 async function getLiveStats() {
-  // created_at is stored as 'YYYY-MM-DD HH:MM:SS' (space, no timezone) — use strftime for date comparison
+  // created_at is stored as 'YYYY-MM-DD HH:MM:SS' (space, no timezone), which sorts
+  // lexically — compare the raw text against date bounds instead of strftime()-ing
+  // every row, so the filters stay plain string compares (and can use an index)
   const r = db.prepare(`
     SELECT
       (SELECT COUNT(*) FROM scan_history)                                                AS total_scans,
       (SELECT COUNT(*) FROM scan_history
-        WHERE strftime('%Y-%m-%d', created_at) = date('now'))                           AS scans_today,
+        WHERE created_at >= date('now') AND created_at < date('now', '+1 day'))         AS scans_today,
       (SELECT COUNT(*) FROM payments WHERE verified = 1)                                AS total_payments,
       (SELECT ROUND(100.0 * COUNT(CASE WHEN risk_score IS NOT NULL THEN 1 END)
               / NULLIF(COUNT(*), 0), 1)
@@ -1036,7 +1174,7 @@ async function getLiveStats() {
         FROM scan_history
         WHERE result_json IS NOT NULL
           AND json_extract(result_json, '$.scan_ms') IS NOT NULL
-          AND strftime('%Y-%m-%d', created_at) >= date('now', '-7 days'))               AS avg_scan_ms
+          AND created_at >= date('now', '-7 days'))                                     AS avg_scan_ms
   `).get();
   return {
     total_scans:             r?.total_scans        || 0,
@@ -1058,7 +1196,7 @@ function logAdvisorUsage(scanId, scanType, result) {
   const advisorOutputTokens = usage.advisor_output_tokens || 0;
   const advisorCost = (advisorInputTokens * 5 + advisorOutputTokens * 25) / 1_000_000;
 
-  db.prepare(`
+  cachedStmt(`
     INSERT INTO advisor_calls
       (scan_id, scan_type, advisor_invoked,
        executor_input_tokens, executor_output_tokens,
@@ -1101,7 +1239,7 @@ const MONTHLY_ADVERSARIAL_LIMITS = {
  */
 function getMonthlyScansForEmail(email) {
   if (!email) return 0;
-  const row = db.prepare(`
+  const row = cachedStmt(`
     SELECT COUNT(*) AS cnt FROM scan_history
     WHERE email = ?
       AND cached = 0
@@ -1115,7 +1253,7 @@ function getMonthlyScansForEmail(email) {
  */
 function getMonthlyAdversarialForEmail(email) {
   if (!email) return 0;
-  const row = db.prepare(`
+  const row = cachedStmt(`
     SELECT COUNT(*) AS cnt FROM scan_history
     WHERE email = ?
       AND scan_type = 'adversarial'
@@ -1147,6 +1285,11 @@ const session = require('express-session');
 class SqliteStore extends session.Store {
   constructor() {
     super();
+    // Prepared statements are created on first use (user_sessions only exists
+    // after initUsersSchema) and kept on the instance — get/set run per request.
+    this._stmtGet     = null;
+    this._stmtSet     = null;
+    this._stmtDestroy = null;
     // Periodické čištění prošlých sessions (každých 15 minut)
     setInterval(() => {
       db.prepare("DELETE FROM user_sessions WHERE expires IS NOT NULL AND expires < datetime('now')")
@@ -1154,12 +1297,20 @@ class SqliteStore extends session.Store {
     }, 15 * 60 * 1000).unref();
   }
 
+  _prepare() {
+    if (this._stmtGet) return;
+    this._stmtGet     = db.prepare('SELECT sess, expires FROM user_sessions WHERE sid = ?');
+    this._stmtSet     = db.prepare('INSERT OR REPLACE INTO user_sessions (sid, sess, expires) VALUES (?, ?, ?)');
+    this._stmtDestroy = db.prepare('DELETE FROM user_sessions WHERE sid = ?');
+  }
+
   get(sid, cb) {
     try {
-      const row = db.prepare('SELECT sess, expires FROM user_sessions WHERE sid = ?').get(sid);
+      this._prepare();
+      const row = this._stmtGet.get(sid);
       if (!row) return cb(null, null);
       if (row.expires && new Date(row.expires) < new Date()) {
-        db.prepare('DELETE FROM user_sessions WHERE sid = ?').run(sid);
+        this._stmtDestroy.run(sid);
         return cb(null, null);
       }
       cb(null, JSON.parse(row.sess));
@@ -1168,19 +1319,19 @@ class SqliteStore extends session.Store {
 
   set(sid, sess, cb) {
     try {
+      this._prepare();
       const expires = sess.cookie?.expires
         ? toSQLiteTimestamp(new Date(sess.cookie.expires))
         : toSQLiteTimestamp(new Date(Date.now() + 30 * 24 * 3600 * 1000));
-      db.prepare(
-        'INSERT OR REPLACE INTO user_sessions (sid, sess, expires) VALUES (?, ?, ?)'
-      ).run(sid, JSON.stringify(sess), expires);
+      this._stmtSet.run(sid, JSON.stringify(sess), expires);
       cb(null);
     } catch (e) { cb(e); }
   }
 
   destroy(sid, cb) {
     try {
-      db.prepare('DELETE FROM user_sessions WHERE sid = ?').run(sid);
+      this._prepare();
+      this._stmtDestroy.run(sid);
       cb(null);
     } catch (e) { cb(e); }
   }
@@ -1192,7 +1343,7 @@ class SqliteStore extends session.Store {
 
 function logAccuracySignal({ scanId, mint, scanType, rawScore, llmScore, finalScore, finalCategory, validationFlags }) {
   const flags = Array.isArray(validationFlags) ? validationFlags : [];
-  db.prepare(`
+  cachedStmt(`
     INSERT INTO scan_accuracy_signals
       (scan_id, mint, scan_type, raw_score, llm_score, final_score, final_category, validation_flags, corrections_count)
     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
@@ -1212,7 +1363,7 @@ function logAccuracySignal({ scanId, mint, scanType, rawScore, llmScore, finalSc
 function logValidationIssues({ mint, scanType, valid, issues, correctionsCount }) {
   const issuesArr = Array.isArray(issues) ? issues : [];
   const escalations = issuesArr.filter(i => i.action === 'escalate').length;
-  db.prepare(`
+  cachedStmt(`
     INSERT INTO validation_log
       (mint, scan_type, valid, issues_json, corrections_count, escalations_count)
     VALUES (?, ?, ?, ?, ?, ?)
@@ -1331,7 +1482,7 @@ function getReceiptFeedbackSummary() {
 // ── Abuse events ──────────────────────────────────────────────────────────────
 
 function logAbuseEvent(ip, eventType, details) {
-  db.prepare(`
+  cachedStmt(`
     INSERT INTO abuse_events (ip, event_type, details, occurred_at)
     VALUES (?, ?, ?, datetime('now'))
   `).run(ip, eventType, details ? JSON.stringify(details) : null);
@@ -1406,35 +1557,37 @@ function getIrisEnrichment(mint) {
 // ── Known scams databáze ──────────────────────────────────────────────────────
 
 function lookupKnownScam(mint) {
-  const row = db.prepare('SELECT * FROM known_scams WHERE mint = ?').get(mint);
+  const row = cachedStmt('SELECT * FROM known_scams WHERE mint = ?').get(mint);
   if (!row) return null;
   try { row.raw_data = row.raw_data ? JSON.parse(row.raw_data) : null; } catch {}
   return row;
 }
 
-function upsertKnownScam({
+const UPSERT_KNOWN_SCAM_SQL = `
+  INSERT INTO known_scams
+    (mint, source, scam_type, confidence, label, raw_data,
+     creator, first_seen_at, first_seen_slot, rug_pattern, confidence_score,
+     updated_at)
+  VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
+  ON CONFLICT(mint) DO UPDATE SET
+    source           = excluded.source,
+    scam_type        = excluded.scam_type,
+    confidence       = excluded.confidence,
+    label            = excluded.label,
+    raw_data         = excluded.raw_data,
+    creator          = COALESCE(excluded.creator, known_scams.creator),
+    first_seen_at    = COALESCE(excluded.first_seen_at, known_scams.first_seen_at),
+    first_seen_slot  = COALESCE(excluded.first_seen_slot, known_scams.first_seen_slot),
+    rug_pattern      = COALESCE(excluded.rug_pattern, known_scams.rug_pattern),
+    confidence_score = COALESCE(excluded.confidence_score, known_scams.confidence_score),
+    updated_at       = datetime('now')
+`;
+
+function knownScamParams({
   mint, source, scam_type, confidence, label, raw_data,
   creator, first_seen_at, first_seen_slot, rug_pattern, confidence_score
 }) {
-  db.prepare(`
-    INSERT INTO known_scams
-      (mint, source, scam_type, confidence, label, raw_data,
-       creator, first_seen_at, first_seen_slot, rug_pattern, confidence_score,
-       updated_at)
-    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
-    ON CONFLICT(mint) DO UPDATE SET
-      source           = excluded.source,
-      scam_type        = excluded.scam_type,
-      confidence       = excluded.confidence,
-      label            = excluded.label,
-      raw_data         = excluded.raw_data,
-      creator          = COALESCE(excluded.creator, known_scams.creator),
-      first_seen_at    = COALESCE(excluded.first_seen_at, known_scams.first_seen_at),
-      first_seen_slot  = COALESCE(excluded.first_seen_slot, known_scams.first_seen_slot),
-      rug_pattern      = COALESCE(excluded.rug_pattern, known_scams.rug_pattern),
-      confidence_score = COALESCE(excluded.confidence_score, known_scams.confidence_score),
-      updated_at       = datetime('now')
-  `).run(
+  return [
     mint,
     source,
     scam_type      || null,
@@ -1445,8 +1598,26 @@ function upsertKnownScam({
     first_seen_at  || null,
     first_seen_slot != null ? first_seen_slot : null,
     rug_pattern    || null,
-    confidence_score != null ? confidence_score : null
-  );
+    confidence_score != null ? confidence_score : null,
+  ];
+}
+
+function upsertKnownScam(record) {
+  cachedStmt(UPSERT_KNOWN_SCAM_SQL).run(...knownScamParams(record));
+}
+
+// Hromadný import (scripts/import-scam-db.js) — všechny řádky v jedné transakci,
+// takže datasety o desítkách tisíc tokenů nedělají commit (a WAL fsync) per řádek.
+let _upsertKnownScamsTx = null;
+function upsertKnownScams(records) {
+  if (!_upsertKnownScamsTx) {
+    _upsertKnownScamsTx = db.transaction((rows) => {
+      const stmt = cachedStmt(UPSERT_KNOWN_SCAM_SQL);
+      for (const r of rows) stmt.run(...knownScamParams(r));
+      return rows.length;
+    });
+  }
+  return _upsertKnownScamsTx(records);
 }
 
 function getKnownScamsCount() {
@@ -1499,10 +1670,11 @@ function rebuildScamCreators() {
 const RUGCHECK_CACHE_TTL_MS = 24 * 3_600_000; // 24 hodin
 
 function getRugcheckCache(mint) {
-  const row = db.prepare('SELECT * FROM rugcheck_cache WHERE mint = ?').get(mint);
-  if (!row) return null;
-  const age = Date.now() - new Date(row.fetched_at).getTime();
-  if (age > RUGCHECK_CACHE_TTL_MS) return null; // expirovaná cache
+  // TTL se porovná v SQL jako text (fetched_at je datetime('now') formát) —
+  // žádné parsování data per řádek a žádná záměna UTC za lokální čas
+  const cutoff = toSQLiteTimestamp(new Date(Date.now() - RUGCHECK_CACHE_TTL_MS));
+  const row = cachedStmt('SELECT * FROM rugcheck_cache WHERE mint = ? AND fetched_at >= ?').get(mint, cutoff);
+  if (!row) return null; // chybí nebo expirovaná cache
   try { row.risks_json = row.risks_json ? JSON.parse(row.risks_json) : []; } catch { row.risks_json = []; }
   try { row.raw_json   = row.raw_json   ? JSON.parse(row.raw_json)   : {}; } catch { row.raw_json   = {}; }
   return row;
@@ -1533,7 +1705,7 @@ function setRugcheckCache({ mint, risk_level, score, score_norm, rugged, risks,
 
 module.exports = {
   db, pool, initSchema, initUsersSchema, initAdsSchema,
-  logPayment, isAlreadyUsed, markSignatureUsed, logEvent,
+  logPayment, isAlreadyUsed, markSignatureUsed, logEvent, flushEvents,
   getFunnelStats, getPaymentStats, getPageviewStats,
   countFreeScansToday,
   addWatchlistEntry, removeWatchlistEntry, getActiveWatchlist,
@@ -1565,7 +1737,7 @@ module.exports = {
   // Validation log
   logValidationIssues,
   // Scam database
-  lookupKnownScam, upsertKnownScam, getKnownScamsCount,
+  lookupKnownScam, upsertKnownScam, upsertKnownScams, getKnownScamsCount,
   lookupScamCreator, rebuildScamCreators,
   // RugCheck cache
   getRugcheckCache, setRugcheckCache,
@@ -9,7 +9,6 @@
  *   - Reminder na nevyužité deep audity
  */
 
-const nodemailer = require('nodemailer');
 const {
   getActiveSubscribers, getSubscriberWatchlist, getWeeklyScanSummary,
   getDigestAd, getRecentHighRiskScans, trackAdImpression
@@ -22,6 +21,7 @@ function getTransporter() {
   const user = process.env.SMTP_USER;
   const pass = process.env.SMTP_PASS;
   if (!host || !user || !pass) return null;
+  const nodemailer = require('nodemailer');
   return nodemailer.createTransport({
     host,
     port: parseInt(process.env.SMTP_PORT || '587'),
@@ -9,7 +9,7 @@
 // Price: 0.15 USDC (150_000 micro-units)
 
 const fs     = require('fs');
-const crypto = require('crypto');
+const { sha256 } = require('../src/crypto/sha256');
 const { enrichScanResult, combineScores } = require('../src/enrichment');
 
 const _bs58raw = require('bs58');
@@ -100,10 +100,6 @@ function b58decode(addr) {
   return Buffer.from(bs58.decode(addr));
 }
 
-function sha256(data) {
-  return crypto.createHash('sha256').update(data).digest();
-}
-
 // Derive Asset Signer PDA for Metaplex Core
 // Seeds: ["asset_signer", asset_pubkey_bytes]
 // Program: CoREENxT6tW1HoK8ypY1SxRMZTcVPm7R94rH4PZNhX7d
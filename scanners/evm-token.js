@@ -119,12 +119,16 @@ const DANGEROUS_SELECTORS = [
   { hex: '8456cb59', label: 'pause() selector in bytecode',         severity: 'high',     category: 'access-control' },
   { hex: '044df020', label: 'blacklist(address) in bytecode',       severity: 'critical', category: 'access-control' }
 ];
+// All selectors in one pass over the bytecode. The lookahead keeps matches
+// zero-width so overlapping selectors are still found, same as per-selector includes().
+const DANGEROUS_SELECTOR_RE = new RegExp(`(?=(${DANGEROUS_SELECTORS.map(s => s.hex).join('|')}))`, 'gi');
 
 // ── Impersonation keywords ────────────────────────────────────────────────────
 const IMPERSONATION_KEYWORDS = [
   'uniswap', 'pancake', 'sushi', 'weth', 'usdc', 'usdt', 'wbtc',
   'ethereum', 'bitcoin', 'binance', 'safemoon', 'shiba', 'pepe'
 ];
+const IMPERSONATION_RE = new RegExp(IMPERSONATION_KEYWORDS.join('|'), 'i');
 
 // ── Source code risk patterns ─────────────────────────────────────────────────
 const PATTERNS = [
@@ -498,17 +502,18 @@ async function scanEVMToken(contractAddress, chain = 'ethereum') {
   // SELFDESTRUCT and DELEGATECALL are detected via source code pattern analysis (section f).
   // Only 4-byte function selectors are scanned here — they are embedded as-is in bytecode.
   {
-    const bytecode = code.toLowerCase().slice(2);
+    const present = new Set();
+    for (const m of code.slice(2).matchAll(DANGEROUS_SELECTOR_RE)) present.add(m[1].toLowerCase());
     for (const sel of DANGEROUS_SELECTORS) {
-      if (bytecode.includes(sel.hex))
+      if (present.has(sel.hex))
         findings.push({ label: sel.label, severity: sel.severity, category: sel.category });
     }
   }
 
   // ── (e) Impersonation check ───────────────────────────────────────────────
   if (!meta.verified) {
-    const nameSymbol = `${meta.name || ''} ${meta.symbol || ''}`.toLowerCase();
-    if (IMPERSONATION_KEYWORDS.some(kw => nameSymbol.includes(kw)))
+    const nameSymbol = `${meta.name || ''} ${meta.symbol || ''}`;
+    if (IMPERSONATION_RE.test(nameSymbol))
       findings.push({
         label:    `Impersonation: unverified token uses known brand name/symbol ("${meta.name || meta.symbol}")`,
         severity: 'critical',
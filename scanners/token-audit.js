@@ -4,7 +4,7 @@
 // Token-2022 extensions, and "Beggars Allocation" treasury patterns.
 
 const fs = require('fs');
-const crypto = require('crypto');
+const { sha256 } = require('../src/crypto/sha256');
 const { validateLLMScore } = require('../src/llm/scan-validator');
 const { lookupScamDb, lookupScamCreator } = require('../src/scam-db/lookup');
 // bs58 v6+ exports via .default in CommonJS interop
@@ -57,11 +57,6 @@ function b58decode(addr) {
   return Buffer.from(bs58.decode(addr));
 }
 
-// SHA256d used in Solana PDA derivation
-function sha256(data) {
-  return crypto.createHash('sha256').update(data).digest();
-}
-
 // Derive Metaplex metadata PDA: ["metadata", metaplex_program_id, mint_address]
 // Uses the same bump-search as the Solana SDK but just needs the canonical PDA.
 function deriveMetadataPda(mintAddress) {
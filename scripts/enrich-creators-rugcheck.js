@@ -101,12 +101,14 @@ async function main() {
     ${LIMIT === Infinity ? '' : `LIMIT ${LIMIT}`}
   `).all();
 
-  console.log(`\nenrich-creators-rugcheck.js`);
-  console.log(`══════════════════════════════════════════`);
-  console.log(`Mints ke zpracování : ${mints.length}`);
-  console.log(`Prodleva mezi req   : ${DELAY_MS} ms`);
-  console.log(`Batch size          : ${BATCH_SIZE}`);
-  console.log(`\nSpouštím obohacení...\n`);
+  process.stdout.write([
+    `\nenrich-creators-rugcheck.js`,
+    `══════════════════════════════════════════`,
+    `Mints ke zpracování : ${mints.length}`,
+    `Prodleva mezi req   : ${DELAY_MS} ms`,
+    `Batch size          : ${BATCH_SIZE}`,
+    `\nSpouštím obohacení...\n`,
+  ].join('\n') + '\n');
 
   let processed  = 0;
   let enriched   = 0;
@@ -168,14 +170,16 @@ async function main() {
 
   // ── Závěrečná statistika ──────────────────────────────────────────────────
 
-  console.log(`\n══════════════════════════════════════════`);
-  console.log(`Hotovo!`);
-  console.log(`  Zpracováno    : ${processed}`);
-  console.log(`  Obohaceno     : ${enriched} (creator nalezen)`);
-  console.log(`  Nenalezeno    : ${notFound} (RugCheck 404)`);
-  console.log(`  Bez creator   : ${noCreator} (API vrátilo prázdný creator)`);
-  console.log(`  Chyby         : ${errors}`);
-  console.log(`  Rate limity   : ${rateLimited}`);
+  process.stdout.write([
+    `\n══════════════════════════════════════════`,
+    `Hotovo!`,
+    `  Zpracováno    : ${processed}`,
+    `  Obohaceno     : ${enriched} (creator nalezen)`,
+    `  Nenalezeno    : ${notFound} (RugCheck 404)`,
+    `  Bez creator   : ${noCreator} (API vrátilo prázdný creator)`,
+    `  Chyby         : ${errors}`,
+    `  Rate limity   : ${rateLimited}`,
+  ].join('\n') + '\n');
 
   // Přepočítej scam_creators tabulku
   console.log(`\nPřepočítávám scam_creators...`);
@@ -28,9 +28,6 @@ const path = require('path');
 
 const DATA_DIR = path.join(__dirname, '../data/scam-datasets');
 
-// Lazy load db — pouze pokud běží z CLI
-const db = require('../db');
-
 // ── CSV parser (bez externích závislostí) ─────────────────────────────────────
 
 function parseCsv(content) {
@@ -71,21 +68,24 @@ function importSolRPDS(filePath) {
   // Fallback: pokud CSV nemá MINT sloupec, zkus generický parser
   if (mintIdx === -1) {
     const rows = parseCsv(content);
+    const batch = [];
     let imported = 0, skipped = 0;
     for (const row of rows) {
       const mint = row.mint || row.MINT || row.token_address || row.address;
       if (!mint || mint.length < 32 || mint.length > 44) { skipped++; continue; }
-      db.upsertKnownScam({
+      batch.push({
         mint, source: 'solrpds', scam_type: 'rug_pull', confidence: 0.75,
         label: 'SolRPDS dataset', raw_data: null,
       });
       imported++;
     }
+    db.upsertKnownScams(batch);
     return { imported, skipped };
   }
 
   let imported = 0, skipped = 0;
   const seen = new Set();
+  const batch = [];
 
   for (let i = 1; i < lines.length; i++) {
     const cols   = lines[i].split(',');
@@ -118,7 +118,7 @@ function importSolRPDS(filePath) {
       ? 'SolRPDS: inactive liquidity pool (rug pull pattern)'
       : `SolRPDS: active pool (suspicious — rug_pattern: ${rug_pattern})`;
 
-    db.upsertKnownScam({
+    batch.push({
       mint,
       source:     'solrpds',
       scam_type:  'rug_pull',
@@ -133,6 +133,7 @@ function importSolRPDS(filePath) {
     });
     imported++;
   }
+  db.upsertKnownScams(batch);
   return { imported, skipped };
 }
 
@@ -164,6 +165,7 @@ function importSolRugDetector(filePath) {
   let imported  = 0;
   let skipped   = 0;
   let withCreator = 0;
+  const batch = [];
 
   for (const row of rows) {
     const mint = row.mint || row.address || row.token;
@@ -178,7 +180,7 @@ function importSolRugDetector(filePath) {
       ? firstSeenRaw.replace(' ', 'T').replace(/\.000$/, 'Z')
       : null;
 
-    db.upsertKnownScam({
+    batch.push({
       mint,
       source:           'solrugdetector',
       scam_type:        row.type || row.scam_type || 'rug_pull',
@@ -194,6 +196,7 @@ function importSolRugDetector(filePath) {
     imported++;
     if (creator && isValidSolanaAddr(creator)) withCreator++;
   }
+  db.upsertKnownScams(batch);
 
   console.log(`  SolRugDetector: ${imported} tokenů, z toho ${withCreator} má creator wallet`);
   return { imported, skipped, withCreator };
@@ -202,6 +205,7 @@ function importSolRugDetector(filePath) {
 function importGenericCsv(filePath) {
   const content = fs.readFileSync(filePath, 'utf-8');
   const rows    = parseCsv(content);
+  const batch   = [];
   let imported  = 0;
   let skipped   = 0;
 
@@ -209,7 +213,7 @@ function importGenericCsv(filePath) {
     const mint = row.mint || row.address;
     if (!mint || mint.length < 32 || mint.length > 44) { skipped++; continue; }
 
-    db.upsertKnownScam({
+    batch.push({
       mint,
       source:     'manual',
       scam_type:  row.scam_type || row.type || null,
@@ -219,6 +223,7 @@ function importGenericCsv(filePath) {
     });
     imported++;
   }
+  db.upsertKnownScams(batch);
   return { imported, skipped };
 }
 
@@ -228,18 +233,22 @@ const args   = process.argv.slice(2);
 const source = args[0] === '--source' ? args[1] : null;
 const doStats = args[0] === '--stats';
 
+// Chybné argumenty vrať dřív, než se otevře DB (pragmy, WAL, mkdir data/)
+if (!doStats && !source) {
+  console.error('Použití: node scripts/import-scam-db.js --source <solrpds|solrugdet|csv> [file]');
+  console.error('         node scripts/import-scam-db.js --stats');
+  process.exit(1);
+}
+
+// Lazy load db — až po validaci argumentů
+const db = require('../db');
+
 if (doStats) {
   const count = db.getKnownScamsCount();
   console.log(`known_scams tabulka: ${count} tokenů`);
   process.exit(0);
 }
 
-if (!source) {
-  console.error('Použití: node scripts/import-scam-db.js --source <solrpds|solrugdet|csv> [file]');
-  console.error('         node scripts/import-scam-db.js --stats');
-  process.exit(1);
-}
-
 // Inicializuj schéma (tabulky musí existovat)
 db.initSchema().then(() => {
   let result;
@@ -26,18 +26,31 @@ const { generateOpenApi }          = require('../src/docs/generate-openapi');
 let errors  = 0;
 let warnings = 0;
 
+// Per-section line buffers — flushed with one console call per stream instead
+// of one call per checked endpoint.
+let okLines   = [];
+let warnLines = [];
+let failLines = [];
+
 function fail(msg) {
-  console.error(`[FAIL] ${msg}`);
+  failLines.push(`[FAIL] ${msg}`);
   errors++;
 }
 
 function warn(msg) {
-  console.warn(`[WARN] ${msg}`);
+  warnLines.push(`[WARN] ${msg}`);
   warnings++;
 }
 
 function pass(msg) {
-  console.log(`[OK]   ${msg}`);
+  okLines.push(`[OK]   ${msg}`);
+}
+
+function flush() {
+  if (okLines.length)   console.log(okLines.join('\n'));
+  if (warnLines.length) console.warn(warnLines.join('\n'));
+  if (failLines.length) console.error(failLines.join('\n'));
+  okLines = []; warnLines = []; failLines = [];
 }
 
 // ── 1. Check all pricingKeys in ENDPOINT_SPEC resolve ────────────────────────
@@ -52,6 +65,8 @@ for (const spec of ENDPOINT_SPEC) {
   }
 }
 
+flush();
+
 // ── 2. Check generated OpenAPI contains every ENDPOINT_SPEC path ─────────────
 console.log('\n=== 2. OpenAPI path coverage ===');
 let spec;
@@ -59,6 +74,7 @@ try {
   spec = generateOpenApi(DUMMY_ATA);
 } catch (e) {
   fail(`generateOpenApi() threw: ${e.message}`);
+  flush();
   process.exit(1);
 }
 
@@ -76,6 +92,8 @@ for (const endpoint of ENDPOINT_SPEC) {
   }
 }
 
+flush();
+
 // ── 3. Check for orphan pricing keys (in pricing.js but no endpoint spec) ────
 console.log('\n=== 3. Orphan pricing keys ===');
 for (const key of Object.keys(PRICING)) {
@@ -84,6 +102,8 @@ for (const key of Object.keys(PRICING)) {
   }
 }
 
+flush();
+
 // ── 4. Check x-payment.payTo is populated for all paid paths ─────────────────
 console.log('\n=== 4. x-payment.payTo populated ===');
 for (const [path, item] of Object.entries(spec.paths)) {
@@ -98,6 +118,8 @@ for (const [path, item] of Object.entries(spec.paths)) {
   }
 }
 
+flush();
+
 // ── Summary ───────────────────────────────────────────────────────────────────
 console.log('\n=== Summary ===');
 if (errors > 0) {
@@ -8,7 +8,8 @@ const db = require('./db');
 const { PRICING, PRICING_DISPLAY } = require('./config/pricing');
 const { getAssociatedTokenAddressSync, TOKEN_PROGRAM_ID } = require('@solana/spl-token');
 const { PublicKey } = require('@solana/web3.js');
-const Stripe = require('stripe');
+// Stripe SDK se načítá až při prvním platebním požadavku, ne při startu serveru
+const Stripe = (key) => require('stripe')(key);
 const { scanEVMToken, SUPPORTED_CHAINS: EVM_CHAINS, getExplorerKey: evmGetKey, hasExplorerKey: evmHasKey } = require('./scanners/evm-token');
 const { auditToken, getShowcaseReport } = require('./scanners/token-audit');
 const { scanAgentToken }               = require('./scanners/agent-token-scanner');
@@ -48,7 +49,6 @@ const {
 } = require('./src/validation/report-validator');
 
 const https = require('https');
-const nodemailer = require('nodemailer');
 
 // ── Async Ed25519 signer — shared utility (src/crypto/sign.js) ───────────────
 // Neblokuje event loop. Použij asyncSign() všude místo execSync sign-report.py.
@@ -57,6 +57,8 @@ const { asyncSign } = require('./src/crypto/sign');
 // ── Async scan runner — nahrazuje execSync, neblokuje event loop ──────────────
 // Spustí shell skript jako child_process, vrátí Promise<{ stdout, stderr }>.
 // Timeout v ms; při překročení proces ukončí a rejectuje.
+// Ze stderr se všude čte jen začátek (slice(0, 300)) — drží se max prvních N znaků.
+const SCRIPT_STDERR_MAX = 4096;
 function runScript(cmd, args, timeoutMs) {
   return new Promise((resolve, reject) => {
     const child = spawn(cmd, args, { env: process.env });
@@ -71,7 +73,7 @@ function runScript(cmd, args, timeoutMs) {
     }, timeoutMs);
 
     child.stdout.on('data', d => { stdout += d; });
-    child.stderr.on('data', d => { stderr += d; });
+    child.stderr.on('data', d => { if (stderr.length < SCRIPT_STDERR_MAX) stderr += d; });
 
     child.on('close', code => {
       clearTimeout(timer);
@@ -90,9 +92,34 @@ function runScript(cmd, args, timeoutMs) {
   });
 }
 
+// Souběžné free scany stejné adresy (typicky trending token skenovaný několika lidmi
+// zároveň) sdílí jeden běh scanneru i advisoru místo N paralelních scanner + LLM
+// pipeline. Záznam žije jen do dokončení — výsledky pak cachuje freeScanCache.
+const _freeScansInFlight = new Map(); // `${type}\0${address}` → Promise<{ stdout, data, adv }>
+function runFreeScanShared(type, address, script, timeoutMs) {
+  const key = `${type}\0${address}`;
+  let p = _freeScansInFlight.get(key);
+  if (!p) {
+    p = (async () => {
+      const { stdout } = await runScript(script, [address], timeoutMs);
+      let data = null;
+      try { data = JSON.parse(stdout.trim()); } catch {}
+      if (data?.error) return { stdout, data, adv: null };
+      // Advisor — šedá zóna 40-70
+      const ctx = () => `${type} scan pro adresu ${address}:\n${JSON.stringify(data || { raw: stdout.slice(0, 2000) }, null, 2)}`;
+      const adv = await runAdvisorIfGreyZone({ score: data?.risk_score, context: ctx, scanType: `free-${type}` });
+      return { stdout, data, adv };
+    })().finally(() => _freeScansInFlight.delete(key));
+    _freeScansInFlight.set(key, p);
+  }
+  return p;
+}
+
 // ── Advisor helper — spustí LLM jen pokud score v šedé zóně (40-70) ──────────
 // alwaysRun=true: ignoruje zónu (pro /scan/quick kde LLM nahrazuje celý report)
 // Vrátí { text, advisorUsed, provider, signed } nebo null při skip/chybě.
+// `context` může být funkce — kontext (často JSON.stringify celého výsledku scanu)
+// se pak sestaví jen když advisor opravdu poběží, ne u každého scanu mimo šedou zónu.
 async function runAdvisorIfGreyZone({ score, context, scanType, alwaysRun = false }) {
   const inGrey = typeof score === 'number' && score >= 40 && score <= 70;
   if (!alwaysRun && !inGrey) {
@@ -101,7 +128,8 @@ async function runAdvisorIfGreyZone({ score, context, scanType, alwaysRun = fals
     return null;
   }
   try {
-    const result = await runWithAdvisor({ systemPrompt: SECURITY_ANALYST_SYSTEM, userMessage: context });
+    const userMessage = typeof context === 'function' ? context() : context;
+    const result = await runWithAdvisor({ systemPrompt: SECURITY_ANALYST_SYSTEM, userMessage });
     let signed = null;
     try { signed = await asyncSign(result.text); } catch {}
     db.logAdvisorUsage(null, scanType, result);
@@ -113,32 +141,54 @@ async function runAdvisorIfGreyZone({ score, context, scanType, alwaysRun = fals
 }
 
 // ── In-memory job store pro async bot advisor (TTL 10 min, max 100 jobů) ────────
+// Joby se vkládají s ts = Date.now(), takže pořadí Map je zároveň pořadí podle ts:
+// prošlé i nejstarší joby jsou vždy na začátku a úklid končí u prvního živého.
 const _botJobs = new Map(); // jobId → { chat_id, ts, endpoint }
 function _botJobCleanup() {
   const now = Date.now();
   for (const [id, j] of _botJobs) {
-    if (now - j.ts > 600_000) _botJobs.delete(id);
+    if (now - j.ts <= 600_000) break;
+    _botJobs.delete(id);
   }
   // FIFO eviction pokud přesáhne 100 záznamů
-  if (_botJobs.size > 100) {
-    const oldest = [..._botJobs.entries()].sort((a, b) => a[1].ts - b[1].ts);
-    for (const [id] of oldest.slice(0, _botJobs.size - 100)) _botJobs.delete(id);
+  while (_botJobs.size > 100) {
+    _botJobs.delete(_botJobs.keys().next().value);
   }
 }
 
+// Nejnovější txt + signed.json pro (prefix, slug). Adresář se listuje při každém
+// volání: skenery zapisují .txt a .signed.json těsně po sobě a mtime adresáře má
+// hrubou granularitu, takže listing cachovaný podle mtime mohl vrátit txt nového
+// reportu s podpisem starého. Obě jména se hledají jedním průchodem.
+async function findLatestReportFiles(reportsDir, slug, prefix) {
+  const files = (await fs.promises.readdir(reportsDir)).sort().reverse();
+  let txt, signed;
+  for (const f of files) {
+    if (prefix && !f.includes(prefix)) continue;
+    if (!f.includes(slug)) continue;
+    if (!txt && f.endsWith('.txt')) txt = f;
+    else if (!signed && f.endsWith('.signed.json')) signed = f;
+    if (txt && signed) break;
+  }
+  return { txt, signed };
+}
+
 // Načte nejnovější report soubory pro danou adresu (txt + signed.json).
 // prefix = '' pro quick/deep, 'token-audit', 'wallet-profile', 'defi-pool', 'swarm'
-function loadLatestReport(reportsDir, slug, prefix) {
-  let files;
-  try { files = fs.readdirSync(reportsDir).sort().reverse(); } catch { return {}; }
-  const match = f => (!prefix || f.includes(prefix)) && f.includes(slug);
-  const latestTxt    = files.find(f => match(f) && f.endsWith('.txt'));
-  const latestSigned = files.find(f => match(f) && f.endsWith('.signed.json'));
-  const reportText   = latestTxt    ? fs.readFileSync(path.join(reportsDir, latestTxt),    'utf-8') : null;
-  let signedEnvelope = null;
-  if (latestSigned) {
-    try { signedEnvelope = JSON.parse(fs.readFileSync(path.join(reportsDir, latestSigned), 'utf-8')); } catch {}
-  }
+// Listing adresáře i soubory reportů se čtou asynchronně (volá se z async
+// handlerů po doběhnutí scanu) — txt a signed.json paralelně, bez blokování
+// event loopu.
+async function loadLatestReport(reportsDir, slug, prefix) {
+  let latestTxt, latestSigned;
+  try {
+    ({ txt: latestTxt, signed: latestSigned } = await findLatestReportFiles(reportsDir, slug, prefix));
+  } catch { return {}; }
+  const [reportText, signedEnvelope] = await Promise.all([
+    latestTxt ? fs.promises.readFile(path.join(reportsDir, latestTxt), 'utf-8') : null,
+    latestSigned
+      ? fs.promises.readFile(path.join(reportsDir, latestSigned), 'utf-8').then(JSON.parse).catch(() => null)
+      : null,
+  ]);
   return { reportText, signedEnvelope };
 }
 
@@ -470,8 +520,15 @@ async function quickScanRpcOnly(address) {
   };
 }
 
+// Verify key se čte z disku jen jednou (po prvním úspěšném čtení) — ne per request.
+let _verifyKeyBytes = null;
+function getVerifyKeyBytes() {
+  if (!_verifyKeyBytes) _verifyKeyBytes = fs.readFileSync(VERIFY_KEY_PATH);
+  return _verifyKeyBytes;
+}
+
 function getVerifyKeyBase64() {
-  try { return fs.readFileSync(VERIFY_KEY_PATH).toString('base64'); } catch { return null; }
+  try { return getVerifyKeyBytes().toString('base64'); } catch { return null; }
 }
 
 // ── RPC rate limiter — token bucket, max 50 req/s, burst 100 ─────────────────
@@ -487,12 +544,17 @@ function _rpcAcquire() {
   return Math.ceil((1 - _rpcBucket.tokens) / _rpcBucket.refillRate * 1000);
 }
 
+// Sdílený keep-alive agent pro RPC — globalAgent zavírá nečinné sockety po 5 s,
+// takže mezi dávkami scanů bychom platili nový TLS handshake na každý dotaz.
+const _rpcAgent = new https.Agent({ keepAlive: true, maxSockets: 64, maxFreeSockets: 16, timeout: 60000 });
+
 function rpcPost(body) {
   return new Promise((resolve, reject) => {
     const wait = _rpcAcquire();
     const doRequest = () => {
       const data = JSON.stringify(body);
       const req = https.request(SOLANA_RPC, {
+        agent:  _rpcAgent,
         method: 'POST',
         headers: { 'Content-Type': 'application/json', 'Content-Length': Buffer.byteLength(data) }
       }, res => {
@@ -607,6 +669,12 @@ if (!WALLET) {
   console.error('FATAL: SOLANA_WALLET_ADDRESS env var is not set');
   process.exit(1);
 }
+// Env hodnoty čtené v request handlerech — process.env je getter přes getenv(),
+// proto je rozlišíme jednou při startu (.env se načítá výše, za běhu se nemění).
+const APP_URL               = process.env.APP_URL || 'https://intmolt.org';
+const APP_URL_ENV           = process.env.APP_URL || null; // agent card: bez APP_URL z hostu requestu
+const STRIPE_SECRET_KEY     = process.env.STRIPE_SECRET_KEY;
+const STRIPE_WEBHOOK_SECRET = process.env.STRIPE_WEBHOOK_SECRET;
 
 // Derive the ATA (Associated Token Account) for USDC payments to our wallet.
 // SPL token transfers must go to the ATA, not directly to the wallet address.
@@ -672,6 +740,9 @@ async function requireApiKey(req, res, next) {
 }
 
 function requirePayment(accepts, requiredMicroUsdc = 0) {
+  // 402 tělo je pro daný endpoint vždy stejné (statické accepts) — serializuje se
+  // jednou při první odpovědi, ne při každém discovery/probe requestu bez platby
+  let paymentRequiredJson = null;
   return async (req, res, next) => {
     // Subscribers s platným API klíčem přeskočí x402 platební bránu
     if (req.apiKey) {
@@ -684,7 +755,8 @@ function requirePayment(accepts, requiredMicroUsdc = 0) {
     if (!xPayment) {
       db.logEvent({ name: 'payment_required', resource, ip: req.ip })
         .catch(e => console.error('[db] logEvent error:', e.message));
-      return res.status(402).json({ x402Version: 1, error: 'X-PAYMENT header is required', accepts });
+      paymentRequiredJson ??= JSON.stringify({ x402Version: 1, error: 'X-PAYMENT header is required', accepts });
+      return res.status(402).type('application/json').send(paymentRequiredJson);
     }
 
     const result = await verifyPayment(xPayment, requiredMicroUsdc, resource);
@@ -1020,9 +1092,15 @@ app.get('/logo.svg', (req, res) => { res.sendFile('/root/x402-ecosystem-submissi
 const { generateOpenApi }         = require('./src/docs/generate-openapi');
 const { generateX402Discovery }   = require('./src/docs/generate-x402-discovery');
 
+// Vstupy (pricing, endpoint-spec, USDC_ATA, verify key) se za běhu nemění —
+// dokumenty se generují jednou při prvním requestu. Chyba se necachuje.
+let _openApiDoc = null;
+let _x402Doc    = null;
+
 app.get('/openapi.json', (req, res) => {
   try {
-    res.json(generateOpenApi(USDC_ATA));
+    _openApiDoc = _openApiDoc || generateOpenApi(USDC_ATA);
+    res.json(_openApiDoc);
   } catch (e) {
     console.error('[openapi] generation failed:', e.message);
     res.status(500).json({ error: 'Failed to generate OpenAPI spec' });
@@ -1032,7 +1110,8 @@ app.get('/openapi.json', (req, res) => {
 // x402 discovery - runtime generated
 app.get('/.well-known/x402.json', (req, res) => {
   try {
-    res.json(generateX402Discovery(USDC_ATA));
+    _x402Doc = _x402Doc || generateX402Discovery(USDC_ATA);
+    res.json(_x402Doc);
   } catch (e) {
     console.error('[x402-discovery] generation failed:', e.message);
     res.status(500).json({ error: 'Failed to generate x402 discovery document' });
@@ -1046,7 +1125,7 @@ const { handleA2ARequest, handleA2ASubscribe, buildAgentCard } = require('./src/
 // Agent card — machine-readable capability description for A2A discovery
 // Three paths: canonical (A2A 0.4+), legacy alias (A2A 0.2), root alias (ElizaOS/MCP discovery)
 const _buildAgentCardResponse = (req) => {
-  const baseUrl = process.env.APP_URL || `${req.protocol}://${req.get('host')}`;
+  const baseUrl = APP_URL_ENV || `${req.protocol}://${req.get('host')}`;
   return buildAgentCard(baseUrl);
 };
 app.get('/.well-known/agent.json',      (req, res) => res.json(_buildAgentCardResponse(req)));
@@ -1055,27 +1134,48 @@ app.get('/agent.json',                  (req, res) => res.json(_buildAgentCardRe
 
 // JWKS endpoint — Ed25519 public key in JWK Set format (RFC 8037)
 const _b64url = (buf) => buf.toString('base64').replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '');
+// JWK Set se serializuje jednou po prvním úspěšném načtení klíče
+let _jwksJson = null;
 app.get('/.well-known/jwks.json', (req, res) => {
   try {
-    const keyBytes = fs.readFileSync(VERIFY_KEY_PATH);
-    res.set('Content-Type', 'application/jwk-set+json');
+    if (!_jwksJson) {
+      _jwksJson = JSON.stringify({
+        keys: [{
+          kty: 'OKP',
+          crv: 'Ed25519',
+          use: 'sig',
+          alg: 'EdDSA',
+          kid: 'integrity-molt-primary-2026',
+          x:   _b64url(getVerifyKeyBytes())
+        }]
+      });
+    }
     res.set('Cache-Control', 'public, max-age=3600, must-revalidate');
-    res.json({
-      keys: [{
-        kty: 'OKP',
-        crv: 'Ed25519',
-        use: 'sig',
-        alg: 'EdDSA',
-        kid: 'integrity-molt-primary-2026',
-        x:   _b64url(keyBytes)
-      }]
-    });
+    res.type('application/jwk-set+json').send(_jwksJson);
   } catch (e) {
     console.error('[jwks] failed to read verify key:', e.message);
     res.status(500).json({ error: 'JWKS unavailable' });
   }
 });
 
+// Rate-limit okna (IP → { count, windowStart }) se jinak nikdy nemažou.
+// Nad RL_MAP_MAX se vypršelá okna projdou nejvýš jednou za minutu (při floodu
+// z mnoha IP by jinak každý request procházel celou mapu) a zbytek nad stropem
+// se vyhodí podle pořadí vložení.
+const RL_MAP_MAX     = 10_000;
+const RL_WINDOW_MS   = 60_000;
+const _rlPrunedAt    = new WeakMap(); // map → čas posledního průchodu
+function pruneRateWindows(map, now) {
+  if (map.size <= RL_MAP_MAX) return;
+  if (now - (_rlPrunedAt.get(map) || 0) >= RL_WINDOW_MS) {
+    _rlPrunedAt.set(map, now);
+    for (const [ip, entry] of map) {
+      if (now - entry.windowStart >= RL_WINDOW_MS) map.delete(ip);
+    }
+  }
+  while (map.size > RL_MAP_MAX) map.delete(map.keys().next().value);
+}
+
 // A2A JSON-RPC 2.0 endpoint — tasks/send, tasks/get, tasks/cancel
 const _a2aRL = new Map();
 const _a2aRLMiddleware = (req, res, next) => {
@@ -1087,6 +1187,7 @@ const _a2aRLMiddleware = (req, res, next) => {
   if (now - entry.windowStart >= 60_000) { entry.count = 0; entry.windowStart = now; }
   entry.count++;
   _a2aRL.set(ip, entry);
+  pruneRateWindows(_a2aRL, now);
   if (entry.count > 20) return res.status(429).json({ error: 'Rate limit exceeded (20 req/min per IP)' });
   next();
 };
@@ -1128,115 +1229,116 @@ app.post(
 app.use(a2aOracleRouter);
 
 // /.well-known/receipts-schema.json — static JSON Schema for oracle envelope format
-app.get('/.well-known/receipts-schema.json', (req, res) => {
-  res.set('Content-Type', 'application/schema+json');
-  res.set('Cache-Control', 'public, max-age=3600');
-  res.json({
-    '$schema': 'http://json-schema.org/draft-07/schema#',
-    '$id': 'https://intmolt.org/.well-known/receipts-schema.json',
-    title: 'integrity.molt Oracle Envelope (Flat Format)',
-    description: [
-      'Ed25519-signed oracle report in flat envelope format.',
-      'All report fields and signing metadata appear at the top level of the response object.',
-      'The signature covers UTF-8 bytes of JSON.stringify(reportData),',
-      'where reportData = all response fields EXCEPT: signature, verify_key, key_id, signed_at, signer, algorithm, report.',
-      'Verify using POST /verify/v1/signed-receipt — the server supports both flat and wrapped envelope formats.',
-    ].join(' '),
-    type: 'object',
-    required: ['signature', 'verify_key', 'key_id', 'signed_at', 'signer', 'algorithm'],
-    properties: {
-      // ── Signing metadata (always present) ──────────────────────────────────
-      signature: {
-        type: 'string',
-        description: 'Base64-encoded Ed25519 signature (64 bytes) over UTF-8 bytes of JSON.stringify(report data).'
-      },
-      verify_key: {
-        type: 'string',
-        description: 'Base64-encoded Ed25519 public key (32 bytes). Verify against /.well-known/jwks.json kid=integrity-molt-primary-2026.'
-      },
-      key_id: {
-        type: 'string',
-        description: 'First 16 characters of the base64-encoded verify_key. Key fingerprint.'
-      },
-      signed_at: {
-        type: 'string',
-        format: 'date-time',
-        description: 'ISO8601 UTC timestamp when the signature was created.'
-      },
-      signer: {
-        type: 'string',
-        description: 'Signer identity string, e.g. "integrity.molt".'
-      },
-      algorithm: {
-        type: 'string',
-        enum: ['Ed25519'],
-        description: 'Signing algorithm.'
-      },
-      // ── Typical report fields (endpoint-dependent, all included in signed bytes) ─
-      address: {
-        type: 'string',
-        description: 'Solana or EVM address that was scanned (present on scan endpoints).'
-      },
-      iris_score: {
-        type: 'number',
-        description: 'IRIS risk score 0-100 (present on /scan/v1/:address).'
-      },
-      risk_level: {
-        type: 'string',
-        description: 'Risk classification: low | medium | high | critical (present on scan endpoints).'
-      },
-      risk_factors: {
-        type: 'array',
-        items: { type: 'string' },
-        description: 'List of detected risk factors.'
-      },
-      mints: {
-        type: 'array',
-        description: 'New SPL token mint events (present on /feed/v1/new-spl-tokens).'
-      },
-      findings: {
-        type: 'array',
-        description: 'Governance change findings (present on /monitor/v1/governance-change).'
-      },
-      verdict: {
-        type: 'string',
-        description: 'Governance verdict: clean | suspicious | critical.'
+// Statický JSON Schema dokument — serializuje se jednou při startu.
+const RECEIPTS_SCHEMA_JSON = JSON.stringify({
+  '$schema': 'http://json-schema.org/draft-07/schema#',
+  '$id': 'https://intmolt.org/.well-known/receipts-schema.json',
+  title: 'integrity.molt Oracle Envelope (Flat Format)',
+  description: [
+    'Ed25519-signed oracle report in flat envelope format.',
+    'All report fields and signing metadata appear at the top level of the response object.',
+    'The signature covers UTF-8 bytes of JSON.stringify(reportData),',
+    'where reportData = all response fields EXCEPT: signature, verify_key, key_id, signed_at, signer, algorithm, report.',
+    'Verify using POST /verify/v1/signed-receipt — the server supports both flat and wrapped envelope formats.',
+  ].join(' '),
+  type: 'object',
+  required: ['signature', 'verify_key', 'key_id', 'signed_at', 'signer', 'algorithm'],
+  properties: {
+    // ── Signing metadata (always present) ──────────────────────────────────
+    signature: {
+      type: 'string',
+      description: 'Base64-encoded Ed25519 signature (64 bytes) over UTF-8 bytes of JSON.stringify(report data).'
+    },
+    verify_key: {
+      type: 'string',
+      description: 'Base64-encoded Ed25519 public key (32 bytes). Verify against /.well-known/jwks.json kid=integrity-molt-primary-2026.'
+    },
+    key_id: {
+      type: 'string',
+      description: 'First 16 characters of the base64-encoded verify_key. Key fingerprint.'
+    },
+    signed_at: {
+      type: 'string',
+      format: 'date-time',
+      description: 'ISO8601 UTC timestamp when the signature was created.'
+    },
+    signer: {
+      type: 'string',
+      description: 'Signer identity string, e.g. "integrity.molt".'
+    },
+    algorithm: {
+      type: 'string',
+      enum: ['Ed25519'],
+      description: 'Signing algorithm.'
+    },
+    // ── Typical report fields (endpoint-dependent, all included in signed bytes) ─
+    address: {
+      type: 'string',
+      description: 'Solana or EVM address that was scanned (present on scan endpoints).'
+    },
+    iris_score: {
+      type: 'number',
+      description: 'IRIS risk score 0-100 (present on /scan/v1/:address).'
+    },
+    risk_level: {
+      type: 'string',
+      description: 'Risk classification: low | medium | high | critical (present on scan endpoints).'
+    },
+    risk_factors: {
+      type: 'array',
+      items: { type: 'string' },
+      description: 'List of detected risk factors.'
+    },
+    mints: {
+      type: 'array',
+      description: 'New SPL token mint events (present on /feed/v1/new-spl-tokens).'
+    },
+    findings: {
+      type: 'array',
+      description: 'Governance change findings (present on /monitor/v1/governance-change).'
+    },
+    verdict: {
+      type: 'string',
+      description: 'Governance verdict: clean | suspicious | critical.'
+    }
+  },
+  examples: [
+    {
+      description: 'GET /scan/v1/:address response',
+      value: {
+        address:      'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA',
+        iris_score:   12,
+        risk_level:   'low',
+        risk_factors: [],
+        signed_at:    '2026-04-24T12:00:00Z',
+        signature:    '<base64_64_bytes>',
+        verify_key:   '<base64_32_bytes>',
+        key_id:       '<first_16_chars>',
+        signer:       'integrity.molt',
+        algorithm:    'Ed25519',
       }
     },
-    examples: [
-      {
-        description: 'GET /scan/v1/:address response',
-        value: {
-          address:      'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA',
-          iris_score:   12,
-          risk_level:   'low',
-          risk_factors: [],
-          signed_at:    '2026-04-24T12:00:00Z',
-          signature:    '<base64_64_bytes>',
-          verify_key:   '<base64_32_bytes>',
-          key_id:       '<first_16_chars>',
-          signer:       'integrity.molt',
-          algorithm:    'Ed25519',
-        }
-      },
-      {
-        description: 'POST /verify/v1/signed-receipt — flat envelope input',
-        value: {
-          envelope: {
-            address:    'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA',
-            iris_score: 12,
-            risk_level: 'low',
-            signature:  '<base64_64_bytes>',
-            verify_key: '<base64_32_bytes>',
-            key_id:     '<first_16_chars>',
-            signed_at:  '2026-04-24T12:00:00Z',
-            signer:     'integrity.molt',
-            algorithm:  'Ed25519',
-          }
+    {
+      description: 'POST /verify/v1/signed-receipt — flat envelope input',
+      value: {
+        envelope: {
+          address:    'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA',
+          iris_score: 12,
+          risk_level: 'low',
+          signature:  '<base64_64_bytes>',
+          verify_key: '<base64_32_bytes>',
+          key_id:     '<first_16_chars>',
+          signed_at:  '2026-04-24T12:00:00Z',
+          signer:     'integrity.molt',
+          algorithm:  'Ed25519',
         }
       }
-    ]
-  });
+    }
+  ]
+});
+app.get('/.well-known/receipts-schema.json', (req, res) => {
+  res.set('Cache-Control', 'public, max-age=3600');
+  res.type('application/schema+json').send(RECEIPTS_SCHEMA_JSON);
 });
 
 // Health check - free
@@ -1245,8 +1347,7 @@ app.get('/health', (req, res) => {
 });
 
 // skill.md — frames.ag / registry.frames.ag service descriptor
-app.get('/skill.md', (req, res) => {
-  res.type('text/markdown').send(`---
+const SKILL_MD = `---
 name: integrity-molt
 version: 1.0.0
 description: Solana security oracle — IRIS risk scores, rug detection, and Ed25519-signed receipts for AI agents. Pay-per-call via x402 USDC.
@@ -1351,133 +1452,139 @@ Same JSON-RPC 2.0 envelope as the direct endpoint.
 - \`GET /offer\` — machine-readable skill offer (JSON)
 - **moltbook profile:** https://app.molt.id/integrity
 - **Metaplex core asset:** \`2tWPw22bqgLaLdYCwe7599f7guQudwKpCCta4gvhgZZy\`
-`);
+`;
+
+app.get('/skill.md', (req, res) => {
+  res.type('text/markdown').send(SKILL_MD);
 });
 
 // offer — frames.ag machine-readable service offer
-app.get('/offer', (req, res) => {
-  const SOLANA_MAINNET = { network: 'solana:5eykt4UsFv8P8NJdTREpY1vzqKqZKvdp', networkName: 'Solana Mainnet', type: 'solana' };
-  res.json({
-    version: '1.0.0',
-    service: {
-      slug:        'integrity-molt',
-      title:       'integrity.molt Security Oracle',
-      description: 'Solana security oracle — IRIS risk scores, rug detection, and Ed25519-signed receipts for AI agents. Pay-per-call via x402 USDC.',
-      version:     '1.0.0',
-      tags:        ['security', 'solana', 'oracle', 'ai-agents', 'signed-receipts', 'rug-detection', 'x402', 'iris-score'],
-      homepage:    'https://intmolt.org',
-      x402:        { supported: true, chains: ['solana'], tokens: ['USDC'], priceRange: { min: '0.15', max: '5.00', currency: 'USDC' } },
+const OFFER_SOLANA_MAINNET = { network: 'solana:5eykt4UsFv8P8NJdTREpY1vzqKqZKvdp', networkName: 'Solana Mainnet', type: 'solana' };
+// Statický dokument — serializuje se jednou při startu, ne při každém requestu.
+const OFFER_JSON = JSON.stringify({
+  version: '1.0.0',
+  service: {
+    slug:        'integrity-molt',
+    title:       'integrity.molt Security Oracle',
+    description: 'Solana security oracle — IRIS risk scores, rug detection, and Ed25519-signed receipts for AI agents. Pay-per-call via x402 USDC.',
+    version:     '1.0.0',
+    tags:        ['security', 'solana', 'oracle', 'ai-agents', 'signed-receipts', 'rug-detection', 'x402', 'iris-score'],
+    homepage:    'https://intmolt.org',
+    x402:        { supported: true, chains: ['solana'], tokens: ['USDC'], priceRange: { min: '0.15', max: '5.00', currency: 'USDC' } },
+  },
+  tools: [
+    // --- free skills ---
+    {
+      route:       'POST /a2a',
+      skill:       'quick_scan',
+      description: 'Quick IRIS risk score for a Solana address — sub-second, no auth required',
+      price:       'free',
+      mimeType:    'application/json',
+      networks:    [OFFER_SOLANA_MAINNET],
     },
-    tools: [
-      // --- free skills ---
-      {
-        route:       'POST /a2a',
-        skill:       'quick_scan',
-        description: 'Quick IRIS risk score for a Solana address — sub-second, no auth required',
-        price:       'free',
-        mimeType:    'application/json',
-        networks:    [SOLANA_MAINNET],
-      },
-      {
-        route:       'POST /a2a',
-        skill:       'scan_address',
-        description: 'Full address scan with IRIS score, risk factors, and signed receipt',
-        price:       'free',
-        mimeType:    'application/json',
-        networks:    [SOLANA_MAINNET],
-      },
-      {
-        route:       'POST /a2a',
-        skill:       'new_spl_feed',
-        description: 'Feed of new SPL token mints on Solana (last 24h)',
-        price:       'free',
-        mimeType:    'application/json',
-        networks:    [SOLANA_MAINNET],
-      },
-      {
-        route:       'POST /a2a',
-        skill:       'verify_receipt',
-        description: 'Verify an Ed25519-signed oracle receipt issued by integrity.molt',
-        price:       'free',
-        mimeType:    'application/json',
-        networks:    [],
-      },
-      {
-        route:       'POST /a2a',
-        skill:       'program_verification_status',
-        description: 'Check if a Solana program is verified on-chain (source-matched deployment)',
-        price:       'free',
-        mimeType:    'application/json',
-        networks:    [SOLANA_MAINNET],
-      },
-      // --- paid skills ($0.15 USDC) ---
-      {
-        route:       'POST /a2a',
-        skill:       'agent_token_scan',
-        description: 'Token security scan optimized for AI agents — IRIS score + risk factors + signed receipt',
-        price:       '$0.15 USDC',
-        mimeType:    'application/json',
-        networks:    [SOLANA_MAINNET],
-      },
-      {
-        route:       'POST /a2a',
-        skill:       'governance_change',
-        description: 'Detect authority transfers, upgrade events, and suspicious governance patterns in a Solana program',
-        price:       '$0.15 USDC',
-        mimeType:    'application/json',
-        networks:    [SOLANA_MAINNET],
-      },
-      // --- paid skills ($0.75 USDC) ---
-      {
-        route:       'POST /a2a',
-        skill:       'token_audit',
-        description: 'Detailed token audit report — liquidity, holder distribution, creator history, mint authority',
-        price:       '$0.75 USDC',
-        mimeType:    'application/json',
-        networks:    [SOLANA_MAINNET],
-      },
-      {
-        route:       'POST /a2a',
-        skill:       'wallet_profile',
-        description: 'Wallet risk profile — behavioral analysis, counterparty risk, historical activity',
-        price:       '$0.75 USDC',
-        mimeType:    'application/json',
-        networks:    [SOLANA_MAINNET],
-      },
-      // --- paid skills ($4.00 USDC) ---
-      {
-        route:       'POST /a2a',
-        skill:       'adversarial_sim',
-        description: 'Adversarial simulation — stress test a token or program against known attack vectors',
-        price:       '$4.00 USDC',
-        mimeType:    'application/json',
-        networks:    [SOLANA_MAINNET],
-      },
-      // --- paid skills ($5.00 USDC) ---
-      {
-        route:       'POST /a2a',
-        skill:       'deep_audit',
-        description: 'Deep security audit — full on-chain + off-chain analysis with Ed25519-signed findings report',
-        price:       '$5.00 USDC',
-        mimeType:    'application/json',
-        networks:    [SOLANA_MAINNET],
-      },
-    ],
-    links: {
-      base:         'https://intmolt.org',
-      docs:         'https://intmolt.org/openapi.json',
-      openapi:      'https://intmolt.org/openapi.json',
-      health:       'https://intmolt.org/health',
-      skill:        'https://intmolt.org/skill.md',
-      offer:        'https://intmolt.org/offer',
-      jwks:         'https://intmolt.org/jwks.json',
-      agent:        'https://intmolt.org/agent.json',
-      x402:         'https://intmolt.org/x402.json',
-      moltbook:     'https://app.molt.id/integrity',
-      a2a_relay:    'https://multiclaw.moltid.workers.dev/c/integrity/a2a',
-      metaplex:     'https://www.metaplex.com/agents/2tWPw22bqgLaLdYCwe7599f7guQudwKpCCta4gvhgZZy',
+    {
+      route:       'POST /a2a',
+      skill:       'scan_address',
+      description: 'Full address scan with IRIS score, risk factors, and signed receipt',
+      price:       'free',
+      mimeType:    'application/json',
+      networks:    [OFFER_SOLANA_MAINNET],
     },
-  });
+    {
+      route:       'POST /a2a',
+      skill:       'new_spl_feed',
+      description: 'Feed of new SPL token mints on Solana (last 24h)',
+      price:       'free',
+      mimeType:    'application/json',
+      networks:    [OFFER_SOLANA_MAINNET],
+    },
+    {
+      route:       'POST /a2a',
+      skill:       'verify_receipt',
+      description: 'Verify an Ed25519-signed oracle receipt issued by integrity.molt',
+      price:       'free',
+      mimeType:    'application/json',
+      networks:    [],
+    },
+    {
+      route:       'POST /a2a',
+      skill:       'program_verification_status',
+      description: 'Check if a Solana program is verified on-chain (source-matched deployment)',
+      price:       'free',
+      mimeType:    'application/json',
+      networks:    [OFFER_SOLANA_MAINNET],
+    },
+    // --- paid skills ($0.15 USDC) ---
+    {
+      route:       'POST /a2a',
+      skill:       'agent_token_scan',
+      description: 'Token security scan optimized for AI agents — IRIS score + risk factors + signed receipt',
+      price:       '$0.15 USDC',
+      mimeType:    'application/json',
+      networks:    [OFFER_SOLANA_MAINNET],
+    },
+    {
+      route:       'POST /a2a',
+      skill:       'governance_change',
+      description: 'Detect authority transfers, upgrade events, and suspicious governance patterns in a Solana program',
+      price:       '$0.15 USDC',
+      mimeType:    'application/json',
+      networks:    [OFFER_SOLANA_MAINNET],
+    },
+    // --- paid skills ($0.75 USDC) ---
+    {
+      route:       'POST /a2a',
+      skill:       'token_audit',
+      description: 'Detailed token audit report — liquidity, holder distribution, creator history, mint authority',
+      price:       '$0.75 USDC',
+      mimeType:    'application/json',
+      networks:    [OFFER_SOLANA_MAINNET],
+    },
+    {
+      route:       'POST /a2a',
+      skill:       'wallet_profile',
+      description: 'Wallet risk profile — behavioral analysis, counterparty risk, historical activity',
+      price:       '$0.75 USDC',
+      mimeType:    'application/json',
+      networks:    [OFFER_SOLANA_MAINNET],
+    },
+    // --- paid skills ($4.00 USDC) ---
+    {
+      route:       'POST /a2a',
+      skill:       'adversarial_sim',
+      description: 'Adversarial simulation — stress test a token or program against known attack vectors',
+      price:       '$4.00 USDC',
+      mimeType:    'application/json',
+      networks:    [OFFER_SOLANA_MAINNET],
+    },
+    // --- paid skills ($5.00 USDC) ---
+    {
+      route:       'POST /a2a',
+      skill:       'deep_audit',
+      description: 'Deep security audit — full on-chain + off-chain analysis with Ed25519-signed findings report',
+      price:       '$5.00 USDC',
+      mimeType:    'application/json',
+      networks:    [OFFER_SOLANA_MAINNET],
+    },
+  ],
+  links: {
+    base:         'https://intmolt.org',
+    docs:         'https://intmolt.org/openapi.json',
+    openapi:      'https://intmolt.org/openapi.json',
+    health:       'https://intmolt.org/health',
+    skill:        'https://intmolt.org/skill.md',
+    offer:        'https://intmolt.org/offer',
+    jwks:         'https://intmolt.org/jwks.json',
+    agent:        'https://intmolt.org/agent.json',
+    x402:         'https://intmolt.org/x402.json',
+    moltbook:     'https://app.molt.id/integrity',
+    a2a_relay:    'https://multiclaw.moltid.workers.dev/c/integrity/a2a',
+    metaplex:     'https://www.metaplex.com/agents/2tWPw22bqgLaLdYCwe7599f7guQudwKpCCta4gvhgZZy',
+  },
+});
+
+app.get('/offer', (req, res) => {
+  res.type('application/json').send(OFFER_JSON);
 });
 
 // Service discovery - free
@@ -1564,9 +1671,15 @@ app.get('/services', (req, res) => {
 });
 
 // Public reputation stats - free
+// getLiveStats() prochází celou scan_history; /stats volá každé načtení scan.html,
+// takže výsledek držíme krátce v paměti (agregáty nepotřebují sekundovou čerstvost).
+const STATS_CACHE_TTL = 10_000; // 10 s
+let _statsCache = null; // { at, value }
+
 async function buildStatsResponse() {
+  if (_statsCache && Date.now() - _statsCache.at < STATS_CACHE_TTL) return _statsCache.value;
   const stats = await db.getLiveStats();
-  return {
+  const value = {
     total_scans:             stats.total_scans,
     scans_today:             stats.scans_today,
     success_rate_pct:        stats.success_rate_pct,
@@ -1577,6 +1690,8 @@ async function buildStatsResponse() {
     successRate:      stats.success_rate_pct,
     avgResponseTime:  stats.average_response_time_ms || 0,
   };
+  _statsCache = { at: Date.now(), value };
+  return value;
 }
 
 app.get('/stats/advisor', (req, res) => {
@@ -1672,14 +1787,10 @@ app.get('/api/v1/admin/accuracy', (req, res) => {
 // Helius webhook status — internal monitoring dashboard
 app.get('/api/v1/admin/helius', (req, res) => {
   try {
-    const fs   = require('fs');
-    const path = require('path');
-
-    const configPath  = path.join(__dirname, 'data/monitor/webhook-config.json');
+    const { loadConfig: loadWebhookConfig } = require('./src/monitor/webhook-manager');
     const backoffPath = path.join(__dirname, 'data/monitor/helius-backoff.json');
 
-    let webhookConfig = {};
-    try { webhookConfig = JSON.parse(fs.readFileSync(configPath, 'utf8')); } catch {}
+    const webhookConfig = loadWebhookConfig();
 
     let backoff = null;
     try {
@@ -1691,6 +1802,7 @@ app.get('/api/v1/admin/helius', (req, res) => {
     let webhookEvents24h = 0;
     try {
       const since = new Date(Date.now() - 24 * 60 * 60 * 1000).toISOString();
+      db.flushEvents();
       webhookEvents24h = db.db.prepare(
         `SELECT COUNT(*) as n FROM events WHERE name = 'helius_webhook' AND created_at > ?`
       ).get(since)?.n ?? 0;
@@ -1765,6 +1877,7 @@ app.post('/scan/iris', express.json(), checkBlacklist, validateSolanaAddress, as
     if (now - entry.windowStart >= 60_000) { entry.count = 0; entry.windowStart = now; }
     entry.count++;
     _freeScanRL.set(ip, entry);
+    pruneRateWindows(_freeScanRL, now);
     if (entry.count > 10) {
       return res.status(429).json({ error: 'Rate limit exceeded (10 req/min)' });
     }
@@ -1887,7 +2000,7 @@ app.post('/scan/quick', trackFunnel('quick'), requireApiKey, express.json(), val
     ]);
     const scriptMs = Date.now() - _t0;
     const slug = safeAddress.substring(0, 10).toLowerCase();
-    const { reportText: shellReport, signedEnvelope: shellSigned } = loadLatestReport('/root/scanner/reports', slug, '');
+    const { reportText: shellReport, signedEnvelope: shellSigned } = await loadLatestReport('/root/scanner/reports', slug, '');
     const rawReport = shellReport || stdout;
 
     // IRIS score
@@ -1999,7 +2112,7 @@ app.post('/scan/deep', trackFunnel('deep'), requireApiKey, express.json(), valid
     // Fallback: nejnovější swarm report pro tuto adresu
     if (!reportText) {
       const slug = safeAddress.substring(0, 10).toLowerCase();
-      const { reportText: ft, signedEnvelope: fs2 } = loadLatestReport('/root/scanner/reports', slug, 'swarm');
+      const { reportText: ft, signedEnvelope: fs2 } = await loadLatestReport('/root/scanner/reports', slug, 'swarm');
       reportText     = ft;
       signedEnvelope = signedEnvelope || fs2;
     }
@@ -2073,7 +2186,7 @@ app.post('/scan/token', trackFunnel('token'), requireApiKey, express.json(), val
     const slug = safeAddress.substring(0, 10).toLowerCase();
     let data = null;
     try { data = JSON.parse(stdout.trim()); } catch {}
-    const { reportText, signedEnvelope: shellSigned } = loadLatestReport('/root/scanner/reports', slug, 'enhanced-token');
+    const { reportText, signedEnvelope: shellSigned } = await loadLatestReport('/root/scanner/reports', slug, 'enhanced-token');
 
     // Combine enrichment score with script score if both available
     let finalScore = data?.risk_score ?? null;
@@ -2095,7 +2208,7 @@ app.post('/scan/token', trackFunnel('token'), requireApiKey, express.json(), val
     const irisSection = `\n${formatIrisForLLM(irisResult)}\n`;
 
     // Advisor — šedá zóna 40-70
-    const advisorCtx = `Token audit pro adresu ${safeAddress}:\n${JSON.stringify(data || { raw: stdout.slice(0, 2000) }, null, 2)}${irisSection}`;
+    const advisorCtx = () => `Token audit pro adresu ${safeAddress}:\n${JSON.stringify(data || { raw: stdout.slice(0, 2000) }, null, 2)}${irisSection}`;
     const adv = await runAdvisorIfGreyZone({ score: finalScore, context: advisorCtx, scanType: 'token' });
 
     db.logScanToHistory({
@@ -2156,7 +2269,7 @@ app.post('/scan/wallet', trackFunnel('wallet'), requireApiKey, express.json(), v
     const slug = safeAddress.substring(0, 10).toLowerCase();
     let data = null;
     try { data = JSON.parse(stdout.trim()); } catch {}
-    const { reportText, signedEnvelope: shellSigned } = loadLatestReport('/root/scanner/reports', slug, 'wallet-deep');
+    const { reportText, signedEnvelope: shellSigned } = await loadLatestReport('/root/scanner/reports', slug, 'wallet-deep');
 
     // IRIS scoring with whitelist isolation
     const isWhitelisted   = _legitTokens.has(safeAddress);
@@ -2176,7 +2289,7 @@ app.post('/scan/wallet', trackFunnel('wallet'), requireApiKey, express.json(), v
       if (data) data = { ...data, risk_score: finalScore, risk_level: irisResult.grade.toLowerCase() };
     }
 
-    const advisorCtx = `Wallet profiling pro adresu ${safeAddress}:\n${JSON.stringify(data || { raw: stdout.slice(0, 2000) }, null, 2)}`;
+    const advisorCtx = () => `Wallet profiling pro adresu ${safeAddress}:\n${JSON.stringify(data || { raw: stdout.slice(0, 2000) }, null, 2)}`;
     const adv = await runAdvisorIfGreyZone({ score: finalScore, context: advisorCtx, scanType: 'wallet' });
 
     const signed = adv?.signed || (data?.signed ? { signature: data.signature, key_id: data.key_id, algorithm: 'Ed25519' } : shellSigned);
@@ -2228,7 +2341,7 @@ app.post('/scan/pool', trackFunnel('pool'), requireApiKey, express.json(), valid
     const slug = safeAddress.substring(0, 10).toLowerCase();
     let data = null;
     try { data = JSON.parse(stdout.trim()); } catch {}
-    const { reportText, signedEnvelope: shellSigned } = loadLatestReport('/root/scanner/reports', slug, 'pool-deep');
+    const { reportText, signedEnvelope: shellSigned } = await loadLatestReport('/root/scanner/reports', slug, 'pool-deep');
 
     // IRIS scoring with whitelist isolation
     const isWhitelisted   = _legitTokens.has(safeAddress);
@@ -2248,7 +2361,7 @@ app.post('/scan/pool', trackFunnel('pool'), requireApiKey, express.json(), valid
       if (data) data = { ...data, risk_score: finalScore, risk_level: irisResult.grade.toLowerCase() };
     }
 
-    const advisorCtx = `Pool scan pro adresu ${safeAddress}:\n${JSON.stringify(data || { raw: stdout.slice(0, 2000) }, null, 2)}`;
+    const advisorCtx = () => `Pool scan pro adresu ${safeAddress}:\n${JSON.stringify(data || { raw: stdout.slice(0, 2000) }, null, 2)}`;
     const adv = await runAdvisorIfGreyZone({ score: finalScore, context: advisorCtx, scanType: 'pool' });
 
     const signed = adv?.signed || (data?.signed ? { signature: data.signature, key_id: data.key_id, algorithm: 'Ed25519' } : shellSigned);
@@ -2291,9 +2404,11 @@ app.post('/scan/evm-token', trackFunnel('evm-token'), requireApiKey, requirePaym
   }
 
   // Build text report for signing
+  // Jeden okamžik pro podepsaný report i timestamp odpovědi
+  const scannedAt = new Date().toISOString();
   const reportLines = [
     '=== integrity.molt EVM Token Scan ===',
-    `Date:     ${new Date().toISOString()}`,
+    `Date:     ${scannedAt}`,
     `Chain:    ${chain}`,
     `Address:  ${address}`,
     '',
@@ -2324,7 +2439,7 @@ app.post('/scan/evm-token', trackFunnel('evm-token'), requireApiKey, requirePaym
   const reportText = reportLines.join('\n');
 
   // Advisor — šedá zóna 40-70
-  const evmCtx = `EVM token scan ${chain}/${address}:\nScore: ${scanResult.score}\nRecommendation: ${scanResult.recommendation}\nFindings:\n${scanResult.findings.map(f=>`[${f.severity}] ${f.label}`).join('\n')}\nMeta: ${JSON.stringify(scanResult.meta)}`;
+  const evmCtx = () => `EVM token scan ${chain}/${address}:\nScore: ${scanResult.score}\nRecommendation: ${scanResult.recommendation}\nFindings:\n${scanResult.findings.map(f=>`[${f.severity}] ${f.label}`).join('\n')}\nMeta: ${JSON.stringify(scanResult.meta)}`;
   const adv = await runAdvisorIfGreyZone({ score: scanResult.score, context: evmCtx, scanType: 'evm-token' });
 
   // Sign: pokud advisor běžel, podepíše jeho text; jinak původní reportText
@@ -2346,7 +2461,7 @@ app.post('/scan/evm-token', trackFunnel('evm-token'), requireApiKey, requirePaym
     report:          adv?.text || reportText,
     advisor:         adv ? { text: adv.text, advisor_used: adv.advisorUsed, provider: adv.provider } : null,
     signed:          signedEnvelope,
-    timestamp:       new Date().toISOString()
+    timestamp:       scannedAt
   });
 });
 
@@ -2379,9 +2494,11 @@ app.get('/scan/evm/:address', trackFunnel('evm-scan'), evmPreValidate, requireAp
   }
 
   // Build report text
+  // Jeden okamžik pro podepsaný report i timestamp odpovědi
+  const scannedAt = new Date().toISOString();
   const reportLines = [
     '=== integrity.molt EVM Token Scan ===',
-    `Date:     ${new Date().toISOString()}`,
+    `Date:     ${scannedAt}`,
     `Chain:    ${chain} (${scanResult.meta.chainLabel || chain})`,
     `Address:  ${address}`,
     '',
@@ -2412,7 +2529,7 @@ app.get('/scan/evm/:address', trackFunnel('evm-scan'), evmPreValidate, requireAp
   const reportText = reportLines.join('\n');
 
   // Advisor — šedá zóna
-  const evmCtx2 = `EVM token scan ${chain}/${address}:\nScore: ${scanResult.score}\nRecommendation: ${scanResult.recommendation}\nFindings:\n${scanResult.findings.map(f=>`[${f.severity}] ${f.label}`).join('\n')}\nMeta: ${JSON.stringify(scanResult.meta)}`;
+  const evmCtx2 = () => `EVM token scan ${chain}/${address}:\nScore: ${scanResult.score}\nRecommendation: ${scanResult.recommendation}\nFindings:\n${scanResult.findings.map(f=>`[${f.severity}] ${f.label}`).join('\n')}\nMeta: ${JSON.stringify(scanResult.meta)}`;
   const adv2 = await runAdvisorIfGreyZone({ score: scanResult.score, context: evmCtx2, scanType: 'evm-scan' });
 
   let signedEnvelope = adv2?.signed || null;
@@ -2433,51 +2550,65 @@ app.get('/scan/evm/:address', trackFunnel('evm-scan'), evmPreValidate, requireAp
     report:          adv2?.text || reportText,
     advisor:         adv2 ? { text: adv2.text, advisor_used: adv2.advisorUsed, provider: adv2.provider } : null,
     signed:          signedEnvelope,
-    timestamp:       new Date().toISOString()
+    timestamp:       scannedAt
   });
 });
 
+// Contract audit — sdílené mezi placeným /scan/contract a /internal/bot/contract
+const CONTRACT_REPO_URL_RE = /^https?:\/\/(github\.com|gitlab\.com)\/[a-zA-Z0-9_.\-]+\/[a-zA-Z0-9_.\-]+(\.git)?(\/?|\/tree\/[^\s]*)$/;
+const CONTRACT_DEEP_SCAN   = '/root/bounty-hunter/deep-scan.sh';
+
+function parseContractAuditBody(body) {
+  const rawUrl   = (body?.github_url || '').trim();
+  const projName = (body?.project_name || '').trim().replace(/[^a-zA-Z0-9_\- ]/g, '').slice(0, 64) || 'unknown';
+  return { rawUrl, projName };
+}
+
+/**
+ * Spustí bounty-hunter/deep-scan.sh a načte výstupní JSON report.
+ * @returns {Promise<{ report: object|null, stderr: string }>}
+ */
+async function runContractDeepScan(rawUrl, projName, tag) {
+  const { stdout, stderr } = await runScript('bash', [CONTRACT_DEEP_SCAN, rawUrl, projName], 600_000);
+  // Parsuj výstupní cestu z stdout: "  → Output: /path/to/file.json"
+  const outMatch = stdout.match(/→ Output:\s*(\S+\.json)/);
+  let report = null;
+  if (outMatch?.[1]) {
+    try {
+      report = JSON.parse(fs.readFileSync(outMatch[1], 'utf-8'));
+    } catch (e) {
+      console.error(`[${tag}] Failed to read output JSON:`, e.message);
+    }
+  }
+  return { report, stderr };
+}
+
 // Contract Audit - paid endpoint (5.00 USDC = 5000000 micro-USDC)
 // POST /scan/contract
 // Body: { github_url, project_name? }
 // Spouští bounty-hunter/deep-scan.sh: cargo-audit + clippy + semgrep + LLM verification
 app.post('/scan/contract', trackFunnel('contract'), requireApiKey, requirePayment(contractAuditPaymentAccepts, PRICING.contract), express.json(), async (req, res) => {
-  const rawUrl     = (req.body?.github_url || '').trim();
-  const projName   = (req.body?.project_name || '').trim().replace(/[^a-zA-Z0-9_\- ]/g, '').slice(0, 64) || 'unknown';
+  const { rawUrl, projName } = parseContractAuditBody(req.body);
 
   if (!rawUrl) return res.status(400).json({ error: 'Missing github_url field' });
 
   // Povolíme jen github.com a gitlab.com URL
-  if (!/^https?:\/\/(github\.com|gitlab\.com)\/[a-zA-Z0-9_.\-]+\/[a-zA-Z0-9_.\-]+(\.git)?(\/?|\/tree\/[^\s]*)$/.test(rawUrl)) {
+  if (!CONTRACT_REPO_URL_RE.test(rawUrl)) {
     return res.status(400).json({ error: 'Invalid GitHub/GitLab URL. Expected: https://github.com/owner/repo' });
   }
 
-  const DEEP_SCAN = '/root/bounty-hunter/deep-scan.sh';
   const t0 = Date.now();
   console.log(`[scan/contract] starting: ${rawUrl} (${projName})`);
 
   try {
-    const { stdout, stderr } = await runScript('bash', [DEEP_SCAN, rawUrl, projName], 600_000);
+    const { report, stderr } = await runContractDeepScan(rawUrl, projName, 'scan/contract');
     const elapsed = Date.now() - t0;
     console.log(`[scan/contract] done in ${elapsed}ms: ${rawUrl}`);
 
-    // Parsuj výstupní cestu z stdout: "  → Output: /path/to/file.json"
-    const outMatch = stdout.match(/→ Output:\s*(\S+\.json)/);
-    let report = null;
-    let signature = null;
-
-    if (outMatch?.[1]) {
-      try {
-        report = JSON.parse(fs.readFileSync(outMatch[1], 'utf-8'));
-        signature = report.signature || null;
-      } catch (e) {
-        console.error('[scan/contract] Failed to read output JSON:', e.message);
-      }
-    }
-
     if (!report) {
       return res.status(500).json({ error: 'Scan completed but output not found', detail: stderr.slice(0, 300) });
     }
+    const signature = report.signature || null;
 
     res.json({
       status:       'complete',
@@ -2627,10 +2758,15 @@ app.post(
         key_risks:   auditResult.key_risks
       };
       const prevSnap = getLatestSnapshot(safeMint, 'token-audit');
-      const snapMeta = saveSnapshot(safeMint, 'token-audit', snapshotData);
+      let snapMeta = null;
+      try {
+        snapMeta = await saveSnapshot(safeMint, 'token-audit', snapshotData);
+      } catch (e) {
+        console.error('[scan/token-audit] snapshot save failed:', e.message);
+      }
 
       let deltaSection = null;
-      if (prevSnap) {
+      if (prevSnap && snapMeta) {
         try {
           const newSnap = { data: snapshotData, address: safeMint, scanType: 'token-audit', timestamp: snapMeta.timestamp, contentHash: snapMeta.contentHash };
           deltaSection  = await buildDeltaReport(prevSnap, newSnap);
@@ -3009,7 +3145,13 @@ app.get(
     const oldSnap = getLatestSnapshot(safeAddress, scanType);
 
     // Save the new snapshot regardless
-    const newMeta = saveSnapshot(safeAddress, scanType, freshReport);
+    let newMeta;
+    try {
+      newMeta = await saveSnapshot(safeAddress, scanType, freshReport);
+    } catch (e) {
+      console.error('[delta] snapshot save failed:', e.message);
+      return res.status(500).json({ error: 'Snapshot save failed', detail: e.message });
+    }
     const newSnap = { data: freshReport, address: safeAddress, scanType, timestamp: newMeta.timestamp, contentHash: newMeta.contentHash };
 
     if (!oldSnap) {
@@ -3144,8 +3286,8 @@ app.post('/watchlist/add', express.json(), async (req, res) => {
       .catch(() => {});
     res.json({ ok: true, id: entry.id, address: entry.address, created_at: entry.created_at });
     // Synchronizuj novou adresu do Helius webhooku (non-blocking)
-    const { syncWatchlistToWebhook } = require('./src/monitor/webhook-manager');
-    syncWatchlistToWebhook().catch(e => console.error('[monitor] webhook sync after add failed:', e.message));
+    const { scheduleWatchlistSync } = require('./src/monitor/webhook-manager');
+    scheduleWatchlistSync().catch(e => console.error('[monitor] webhook sync after add failed:', e.message));
   } catch (e) {
     res.status(500).json({ error: 'Failed to add watchlist entry', detail: e.message });
   }
@@ -3192,29 +3334,45 @@ const SCAN_PRICES_USD = {
 const paidScanCache = new Map();
 
 // Cache výsledků free scanů — L1: in-memory (rychlost), L2: DB (persistence po restartu)
+// L1 je LRU s pevným stropem: plné výsledky scanů jsou velké a L2 je stejně drží,
+// takže vyhozený záznam stojí jen jeden DB lookup. Pořadí Map = pořadí použití.
 const freeScanCache = new Map();
 const FREE_SCAN_CACHE_TTL = 3_600_000; // 1h
+const FREE_SCAN_CACHE_MAX = 500;
 
 function freeScanCacheKey(address, type, chain) {
   return `${address.toLowerCase()}:${type}:${chain}`;
 }
 
+function putFreeScanCache(key, entry) {
+  freeScanCache.delete(key);
+  freeScanCache.set(key, entry);
+  while (freeScanCache.size > FREE_SCAN_CACHE_MAX) {
+    freeScanCache.delete(freeScanCache.keys().next().value);
+  }
+}
+
 function setCachedScan(address, type, chain, result) {
-  const key = freeScanCacheKey(address, type, chain);
-  freeScanCache.set(key, { result, cachedAt: Date.now() });
-  setTimeout(() => freeScanCache.delete(key), FREE_SCAN_CACHE_TTL);
+  putFreeScanCache(freeScanCacheKey(address, type, chain), { result, cachedAt: Date.now() });
 }
 
 async function getCachedScan(address, type, chain) {
   // L1: in-memory
-  const entry = freeScanCache.get(freeScanCacheKey(address, type, chain));
-  if (entry && Date.now() - entry.cachedAt <= FREE_SCAN_CACHE_TTL) return entry.result;
+  const key   = freeScanCacheKey(address, type, chain);
+  const entry = freeScanCache.get(key);
+  if (entry) {
+    if (Date.now() - entry.cachedAt <= FREE_SCAN_CACHE_TTL) {
+      putFreeScanCache(key, entry); // LRU: posunout na konec
+      return entry.result;
+    }
+    freeScanCache.delete(key);
+  }
   // L2: DB (po restartu serveru)
   try {
     const dbResult = await db.getCachedScanFromDb(address, type, FREE_SCAN_CACHE_TTL);
     if (dbResult) {
       // Natáhnout zpět do L1 cache
-      freeScanCache.set(freeScanCacheKey(address, type, chain), { result: dbResult, cachedAt: Date.now() });
+      putFreeScanCache(key, { result: dbResult, cachedAt: Date.now() });
       return dbResult;
     }
   } catch {}
@@ -3261,12 +3419,11 @@ app.post('/scan/checkout', express.json(), async (req, res) => {
     }
   }
 
-  const stripeKey = process.env.STRIPE_SECRET_KEY;
+  const stripeKey = STRIPE_SECRET_KEY;
   if (!stripeKey) return res.status(503).json({ error: 'Stripe not configured' });
 
   const stripe   = Stripe(stripeKey);
   const priceUsd = SCAN_PRICES_USD[safeType];
-  const APP_URL  = process.env.APP_URL || 'https://intmolt.org';
   const typeName = safeType.charAt(0).toUpperCase() + safeType.slice(1);
 
   try {
@@ -3342,7 +3499,7 @@ app.post('/scan/report', express.json({ limit: '2mb' }), async (req, res) => {
 // GET /scan/paid — po Stripe redirectu ověří platbu, spustí scan, zobrazí výsledek
 app.get('/scan/paid', async (req, res) => {
   const sessionId = req.query.session_id;
-  const stripeKey = process.env.STRIPE_SECRET_KEY;
+  const stripeKey = STRIPE_SECRET_KEY;
   if (!sessionId || !stripeKey) return res.redirect('/scan');
 
   // Cachovaný výsledek — zabraňuje opakovanému spuštění scanu při refreshi
@@ -3379,7 +3536,7 @@ app.get('/scan/paid', async (req, res) => {
     const slug = address.substring(0, 10).toLowerCase();
     let data = null;
     try { data = JSON.parse(stdout.trim()); } catch {}
-    const { reportText, signedEnvelope } = loadLatestReport('/root/scanner/reports', slug, prefix);
+    const { reportText, signedEnvelope } = await loadLatestReport('/root/scanner/reports', slug, prefix);
     // Prefer signed envelope as data if stdout wasn't structured JSON
     const effectiveData = data || signedEnvelope || null;
     result = { status: 'complete', type: scanType, address, data: effectiveData, report: (!effectiveData && (reportText || stdout)) || null };
@@ -3716,7 +3873,7 @@ app.post('/subscribe/:tier', express.json(), async (req, res) => {
   if (!email || !/^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(email)) {
     return res.status(400).json({ error: 'Valid email is required' });
   }
-  const stripeKey = process.env.STRIPE_SECRET_KEY;
+  const stripeKey = STRIPE_SECRET_KEY;
   if (!stripeKey || !STRIPE_PRICE_IDS[tier]) {
     return res.status(503).json({ error: 'Stripe not configured — set STRIPE_SECRET_KEY and STRIPE_PRICE_' + tier.toUpperCase() });
   }
@@ -3729,8 +3886,8 @@ app.post('/subscribe/:tier', express.json(), async (req, res) => {
       line_items: [{ price: STRIPE_PRICE_IDS[tier], quantity: 1 }],
       customer_email: email,
       metadata: { tier, telegram_chat_id: telegram_chat_id || '' },
-      success_url: success_url || `${process.env.APP_URL || 'https://intmolt.org'}/subscribe/success?session_id={CHECKOUT_SESSION_ID}`,
-      cancel_url:  cancel_url  || `${process.env.APP_URL || 'https://intmolt.org'}/#plans`
+      success_url: success_url || `${APP_URL}/subscribe/success?session_id={CHECKOUT_SESSION_ID}`,
+      cancel_url:  cancel_url  || `${APP_URL}/#plans`
     });
     db.logEvent({ name: 'subscription_started', resource: tier, ip: req.ip })
       .catch(() => {});
@@ -3744,8 +3901,8 @@ app.post('/subscribe/:tier', express.json(), async (req, res) => {
 app.post('/stripe/webhook',
   express.raw({ type: 'application/json' }),
   async (req, res) => {
-    const stripeKey = process.env.STRIPE_SECRET_KEY;
-    const webhookSecret = process.env.STRIPE_WEBHOOK_SECRET;
+    const stripeKey = STRIPE_SECRET_KEY;
+    const webhookSecret = STRIPE_WEBHOOK_SECRET;
     if (!stripeKey) return res.status(503).send('Stripe not configured');
 
     const stripe = Stripe(stripeKey);
@@ -3810,7 +3967,7 @@ app.post('/stripe/webhook',
 // GET /subscribe/success — potvrzovací stránka po zaplacení
 app.get('/subscribe/success', async (req, res) => {
   const sessionId = req.query.session_id;
-  const stripeKey = process.env.STRIPE_SECRET_KEY;
+  const stripeKey = STRIPE_SECRET_KEY;
   if (!stripeKey || !sessionId) {
     return res.send('<html><body><h2>Subscription confirmed!</h2><p><a href="/">Back to home</a></p></body></html>');
   }
@@ -3864,7 +4021,7 @@ app.get('/unsubscribe', async (req, res) => {
     // Nastav příznak digest_unsubscribed na subscriptions záznamu
     try { db.db.prepare('UPDATE subscriptions SET digest_unsubscribed = 1 WHERE lower(email) = ?').run(email.toLowerCase()); } catch (_) {}
     // Zaloguj event
-    await db.logEvent({ name: 'digest_unsubscribed', resource: email, ip: req.ip }).catch(() => {});
+    db.logEvent({ name: 'digest_unsubscribed', resource: email, ip: req.ip }).catch(() => {});
     console.log(`[mailer] unsubscribe: ${email}`);
     res.send(`<!DOCTYPE html><html><head><meta charset="utf-8"><title>Odhlášení — integrity.molt</title></head>
 <body style="font-family:system-ui,sans-serif;background:#0a0a0f;color:#d0d8e8;display:flex;align-items:center;justify-content:center;min-height:100vh;margin:0">
@@ -4054,18 +4211,27 @@ app.get('/scan/cached', async (req, res) => {
 });
 
 // GET /scan/captcha-challenge — generuje HMAC-signed matematickou CAPTCHA otázku
-const { createHmac, timingSafeEqual } = require('node:crypto');
+const { createHmac, createSecretKey, timingSafeEqual } = require('node:crypto');
 const CAPTCHA_SECRET = process.env.CAPTCHA_SECRET || 'changeme-local-dev';
 const CAPTCHA_TTL_MS = 15 * 60 * 1000; // 15 minut
+// HMAC klíč připravený jednou — ne import secret stringu při každém challenge/verify
+const CAPTCHA_KEY = createSecretKey(Buffer.from(CAPTCHA_SECRET, 'utf8'));
+
+// Raw 32B digest — verify porovnává bajty, hex se dělá jen pro token v challenge
+function captchaMacBytes(answer, ts) {
+  return createHmac('sha256', CAPTCHA_KEY).update(`${answer}:${ts}`).digest();
+}
+
+function captchaMac(answer, ts) {
+  return captchaMacBytes(answer, ts).toString('hex');
+}
 
 app.get('/scan/captcha-challenge', (req, res) => {
   const a = Math.floor(Math.random() * 10) + 1;  // 1–10
   const b = Math.floor(Math.random() * 10) + 1;  // 1–10
   const answer = String(a + b);
   const ts = Date.now();
-  const token = createHmac('sha256', CAPTCHA_SECRET)
-    .update(`${answer}:${ts}`)
-    .digest('hex') + ':' + ts;
+  const token = captchaMac(answer, ts) + ':' + ts;
   res.json({ question: `${a} + ${b}`, token });
 });
 
@@ -4089,14 +4255,9 @@ function verifyCaptcha(token, answer) {
   if (parts.length !== 2) return false;
   const [hmac, ts] = parts;
   if (Date.now() - Number(ts) > CAPTCHA_TTL_MS) return false;
-  const expected = createHmac('sha256', CAPTCHA_SECRET)
-    .update(`${answer.trim()}:${ts}`)
-    .digest('hex');
-  try {
-    return timingSafeEqual(Buffer.from(hmac, 'hex'), Buffer.from(expected, 'hex'));
-  } catch {
-    return false; // malformed hex / length mismatch
-  }
+  const expected = captchaMacBytes(answer.trim(), ts);
+  const given    = Buffer.from(hmac, 'hex'); // malformed hex → kratší buffer
+  return given.length === expected.length && timingSafeEqual(given, expected);
 }
 
 app.post('/scan/free', express.json(), checkBlacklist, async (req, res) => {
@@ -4257,7 +4418,7 @@ app.post('/scan/free', express.json(), checkBlacklist, async (req, res) => {
       console.log(`[scan/free] EVM address=${safeAddress} chain=${chain} scan=${scanMs}ms total=${Date.now()-t0}ms`);
 
       // Advisor — šedá zóna
-      const evmFreeCtx = `Free EVM token scan ${chain}/${safeAddress}:\nScore: ${evmResult.score}\nRecommendation: ${evmResult.recommendation}\nFindings:\n${evmResult.findings.map(f=>`[${f.severity}] ${f.label}`).join('\n')}`;
+      const evmFreeCtx = () => `Free EVM token scan ${chain}/${safeAddress}:\nScore: ${evmResult.score}\nRecommendation: ${evmResult.recommendation}\nFindings:\n${evmResult.findings.map(f=>`[${f.severity}] ${f.label}`).join('\n')}`;
       const evmAdv = await runAdvisorIfGreyZone({ score: evmResult.score, context: evmFreeCtx, scanType: 'free-evm' });
 
       const result = {
@@ -4333,18 +4494,16 @@ app.post('/scan/free', express.json(), checkBlacklist, async (req, res) => {
 
   try {
     const t1 = Date.now();
-    const { stdout } = await runScript(script, [safeAddress], timeout);
-    const scriptMs = Date.now() - t1;
+    const { stdout, data, adv: freeAdv } = await runFreeScanShared(type, safeAddress, script, timeout);
+    const scanMs = Date.now() - t1;
 
     const t2 = Date.now();
     const slug       = safeAddress.substring(0, 10).toLowerCase();
-    let data = null;
-    try { data = JSON.parse(stdout.trim()); } catch {}
-    const { reportText, signedEnvelope } = loadLatestReport('/root/scanner/reports', slug, prefix);
+    const { reportText, signedEnvelope } = await loadLatestReport('/root/scanner/reports', slug, prefix);
     const reportMs = Date.now() - t2;
 
     const totalMs = Date.now() - t0;
-    console.log(`[scan/free] type=${type} address=${safeAddress} script=${scriptMs}ms report_load=${reportMs}ms total=${totalMs}ms`);
+    console.log(`[scan/free] type=${type} address=${safeAddress} scan=${scanMs}ms report_load=${reportMs}ms total=${totalMs}ms`);
 
     // Shell script returned error JSON (e.g. token not found on Solana)
     if (data?.error) {
@@ -4358,10 +4517,6 @@ app.post('/scan/free', express.json(), checkBlacklist, async (req, res) => {
       });
     }
 
-    // Advisor — šedá zóna 40-70
-    const freeCtx = `${type} scan pro adresu ${safeAddress}:\n${JSON.stringify(data || { raw: stdout.slice(0, 2000) }, null, 2)}`;
-    const freeAdv = await runAdvisorIfGreyZone({ score: data?.risk_score, context: freeCtx, scanType: `free-${type}` });
-
     const freeSigned = freeAdv?.signed
       || (data?.signed ? { signature: data.signature, key_id: data.key_id, algorithm: 'Ed25519' } : signedEnvelope)
       || null;
@@ -4428,13 +4583,12 @@ app.get('/subscribe/:tier', async (req, res) => {
   const email = req.user?.email;
   if (!email) return res.redirect('/login');
 
-  const stripeKey = process.env.STRIPE_SECRET_KEY;
+  const stripeKey = STRIPE_SECRET_KEY;
   if (!stripeKey || !STRIPE_PRICE_IDS[tier]) {
     return res.redirect('/#plans');
   }
 
   const stripe = Stripe(stripeKey);
-  const APP_URL = process.env.APP_URL || 'https://intmolt.org';
 
   try {
     // Get or create Stripe customer for this user
@@ -4481,8 +4635,17 @@ app.get('/scan/history', requireApiKey, async (req, res) => {
   if (!email) return res.status(401).json({ error: 'Authentication required' });
 
   const limit = Math.min(parseInt(req.query.limit) || 50, 200);
-  const rows = await db.getScanHistory(email, limit).catch(() => []);
-  res.json({ history: rows });
+  // Kurzor `before` = "<created_at>|<id>" z next_before předchozí odpovědi
+  let before = null;
+  if (typeof req.query.before === 'string') {
+    const sep = req.query.before.lastIndexOf('|');
+    const id  = parseInt(req.query.before.slice(sep + 1));
+    if (sep <= 0 || !Number.isInteger(id)) return res.status(400).json({ error: 'Invalid before cursor' });
+    before = { created_at: req.query.before.slice(0, sep), id };
+  }
+  const rows = await db.getScanHistory(email, limit, before).catch(() => []);
+  const last = rows.length === limit ? rows[rows.length - 1] : null;
+  res.json({ history: rows, next_before: last ? `${last.created_at}|${last.id}` : null });
 });
 
 // Public shareable scan URL — MUST be defined AFTER all specific /scan/xxx routes
@@ -4543,7 +4706,7 @@ app.get('/scan/:address', async (req, res) => {
     console.warn('[scan/:address] IRIS fetch failed:', err.message);
   }
 
-  const template = fs.readFileSync(path.join(__dirname, 'public', 'scan-view.html'), 'utf8');
+  const template = await fs.promises.readFile(path.join(__dirname, 'public', 'scan-view.html'), 'utf8');
   const html = template
     .replace(/\{\{TITLE\}\}/g,          escapeHtml(meta.TITLE))
     .replace(/\{\{DESCRIPTION\}\}/g,    escapeHtml(meta.DESCRIPTION))
@@ -4616,8 +4779,8 @@ app.post('/watchlist/user/add', express.json(), requireApiKey, async (req, res)
     const entry = await db.addUserWatchlistEntry({ email, address, label, notify_email: notifyEmail });
     res.json({ ok: true, id: entry?.id, entry });
     // Synchronizuj novou adresu do Helius webhooku (non-blocking)
-    const { syncWatchlistToWebhook } = require('./src/monitor/webhook-manager');
-    syncWatchlistToWebhook().catch(e => console.error('[monitor] webhook sync after user add failed:', e.message));
+    const { scheduleWatchlistSync } = require('./src/monitor/webhook-manager');
+    scheduleWatchlistSync().catch(e => console.error('[monitor] webhook sync after user add failed:', e.message));
   } catch (e) {
     res.status(500).json({ error: 'Failed to add', detail: e.message });
   }
@@ -4639,9 +4802,18 @@ app.delete('/watchlist/user/:id', requireApiKey, async (req, res) => {
 const WATCHLIST_INTERVAL_MS = 24 * 60 * 60 * 1000; // 24 hodin (real-time via webhook, polling jen jako sanity check)
 const WATCHLIST_BATCH_DELAY = 2000;                // 2s mezi scany (rate limiting)
 
+// Token se resolvuje jednou (env → secrets soubor), ne při každém alertu.
+let _watchlistTelegramToken = null;
+function getWatchlistTelegramToken() {
+  if (!_watchlistTelegramToken) {
+    _watchlistTelegramToken = process.env.TELEGRAM_BOT_TOKEN
+      || (() => { try { return require('fs').readFileSync('/root/.secrets/telegram_bot_token', 'utf8').trim(); } catch { return null; } })();
+  }
+  return _watchlistTelegramToken;
+}
+
 async function sendTelegramAlert(chatId, message) {
-  const token = process.env.TELEGRAM_BOT_TOKEN
-    || (() => { try { return require('fs').readFileSync('/root/.secrets/telegram_bot_token', 'utf8').trim(); } catch { return null; } })();
+  const token = getWatchlistTelegramToken();
   if (!token || !chatId) return;
   try {
     await new Promise((resolve, reject) => {
@@ -4668,6 +4840,7 @@ function getEmailTransporter() {
   const user = process.env.SMTP_USER;
   const pass = process.env.SMTP_PASS;
   if (!host || !user || !pass) return null;
+  const nodemailer = require('nodemailer');
   _emailTransporter = nodemailer.createTransport({
     host,
     port: parseInt(process.env.SMTP_PORT || '587'),
@@ -4716,8 +4889,10 @@ async function runWatchlistMonitor() {
           + `${data.summary || ''}\n`
           + `🔍 <a href="https://intmolt.org/scan?address=${entry.address}&type=quick">View full scan</a>`;
 
+        // Kanály jsou nezávislé — odeslat souběžně (stejně jako monitor/notifications sendAlert)
+        const sends = [];
         if (entry.notify_telegram_chat) {
-          await sendTelegramAlert(entry.notify_telegram_chat, msg);
+          sends.push(sendTelegramAlert(entry.notify_telegram_chat, msg));
         }
         if (entry.notify_email) {
           const shortAddr = entry.address.slice(0, 8) + '…';
@@ -4739,12 +4914,13 @@ async function runWatchlistMonitor() {
               </a>
               <p style="margin:20px 0 0;font-size:11px;color:#3a3f54">integrity.molt — AI-native Solana security · <a href="https://intmolt.org" style="color:#4da6ff">intmolt.org</a></p>
             </div>`;
-          await sendEmail(
+          sends.push(sendEmail(
             entry.notify_email,
             `[integrity.molt] Risk change: ${shortAddr} ${prevLevel.toUpperCase()} → ${newLevel.toUpperCase()}`,
             emailHtml
-          );
+          ));
         }
+        await Promise.allSettled(sends);
         console.log(`[watchlist-monitor] risk change ${entry.address}: ${prevLevel} → ${newLevel}`);
       }
     } catch (e) {
@@ -4876,11 +5052,10 @@ app.post('/api/v1/create-checkout-session', express.json(), async (req, res) =>
   if (!PLAN_PRICES[plan]) {
     return res.status(400).json({ error: `Unknown plan: ${plan}. Use pro_trader, builder, or team.` });
   }
-  const stripeKey = process.env.STRIPE_SECRET_KEY;
+  const stripeKey = STRIPE_SECRET_KEY;
   if (!stripeKey) return res.status(503).json({ error: 'Stripe not configured' });
 
   const stripe = Stripe(stripeKey);
-  const APP = process.env.APP_URL || 'https://intmolt.org';
   try {
     const session = await stripe.checkout.sessions.create({
       mode: 'subscription',
@@ -4895,8 +5070,8 @@ app.post('/api/v1/create-checkout-session', express.json(), async (req, res) =>
         }
       }],
       metadata: { plan },
-      success_url: `${APP}/dashboard?session_id={CHECKOUT_SESSION_ID}`,
-      cancel_url:  `${APP}/#pricing`
+      success_url: `${APP_URL}/dashboard?session_id={CHECKOUT_SESSION_ID}`,
+      cancel_url:  `${APP_URL}/#pricing`
     });
     db.logEvent({ name: 'checkout_session_created', resource: plan, ip: req.ip }).catch(() => {});
     res.json({ url: session.url });
@@ -4907,12 +5082,14 @@ app.post('/api/v1/create-checkout-session', express.json(), async (req, res) =>
 });
 
 // POST /api/v1/stripe-webhook — ověření podpisu + logování do JSON souboru
-const STRIPE_EVENTS_FILE = path.join(__dirname, 'data', 'stripe_events.json');
+// Append-only JSONL (jeden event na řádek) — dřív se celý JSON soubor při každém
+// webhooku načetl, naparsoval a znovu serializoval, takže cena rostla s historií.
+const STRIPE_EVENTS_FILE = path.join(__dirname, 'data', 'stripe_events.jsonl');
 app.post('/api/v1/stripe-webhook',
   express.raw({ type: 'application/json' }),
   async (req, res) => {
-    const stripeKey     = process.env.STRIPE_SECRET_KEY;
-    const webhookSecret = process.env.STRIPE_WEBHOOK_SECRET;
+    const stripeKey     = STRIPE_SECRET_KEY;
+    const webhookSecret = STRIPE_WEBHOOK_SECRET;
     if (!stripeKey) return res.status(503).send('Stripe not configured');
 
     const stripe = Stripe(stripeKey);
@@ -4926,12 +5103,11 @@ app.post('/api/v1/stripe-webhook',
       return res.status(400).send(`Webhook Error: ${e.message}`);
     }
 
-    // Append event to JSON log file
+    // Append event to JSONL log file
     try {
-      let events = [];
-      try { events = JSON.parse(fs.readFileSync(STRIPE_EVENTS_FILE, 'utf-8')); } catch {}
-      events.push({ ts: new Date().toISOString(), type: event.type, id: event.id, data: event.data?.object });
-      fs.writeFileSync(STRIPE_EVENTS_FILE, JSON.stringify(events, null, 2));
+      fs.appendFileSync(STRIPE_EVENTS_FILE, JSON.stringify({
+        ts: new Date().toISOString(), type: event.type, id: event.id, data: event.data?.object
+      }) + '\n', 'utf8');
     } catch (e) {
       console.error('[stripe/v1] event log write error:', e.message);
     }
@@ -5226,7 +5402,7 @@ app.post('/internal/bot/evm', requireBotKey, express.json(), async (req, res) =>
     const evmRes = await scanEVMToken(address, chain);
     db.logEvent({ name: 'bot_evm_scan', resource: chain, ip: req.ip }).catch(() => {});
 
-    const evmBotCtx = `EVM token scan ${chain}/${address}:\nScore: ${evmRes.score}\nRecommendation: ${evmRes.recommendation}\nFindings:\n${evmRes.findings.map(f=>`[${f.severity}] ${f.label}`).join('\n')}`;
+    const evmBotCtx = () => `EVM token scan ${chain}/${address}:\nScore: ${evmRes.score}\nRecommendation: ${evmRes.recommendation}\nFindings:\n${evmRes.findings.map(f=>`[${f.severity}] ${f.label}`).join('\n')}`;
     const inGrey = typeof evmRes.score === 'number' && evmRes.score >= 40 && evmRes.score <= 70;
 
     if (chatId && inGrey) {
@@ -5302,21 +5478,17 @@ app.post('/internal/bot/evm', requireBotKey, express.json(), async (req, res) =>
 // POST /internal/bot/contract — smart contract audit pro Telegram bot (bez platby)
 // Body: { github_url, project_name? }
 app.post('/internal/bot/contract', requireBotKey, express.json(), async (req, res) => {
-  const rawUrl   = (req.body?.github_url || '').trim();
-  const projName = (req.body?.project_name || '').trim().replace(/[^a-zA-Z0-9_\- ]/g, '').slice(0, 64) || 'unknown';
+  const { rawUrl, projName } = parseContractAuditBody(req.body);
 
   if (!rawUrl) return res.status(400).json({ error: 'Missing github_url' });
-  if (!/^https?:\/\/(github\.com|gitlab\.com)\/[a-zA-Z0-9_.\-]+\/[a-zA-Z0-9_.\-]+(\.git)?(\/?|\/tree\/[^\s]*)$/.test(rawUrl))
+  if (!CONTRACT_REPO_URL_RE.test(rawUrl))
     return res.status(400).json({ error: 'Invalid GitHub/GitLab URL. Expected: https://github.com/owner/repo' });
 
-  const DEEP_SCAN = '/root/bounty-hunter/deep-scan.sh';
   db.logEvent({ name: 'bot_contract_audit', resource: rawUrl.slice(0, 100), ip: req.ip }).catch(() => {});
   try {
-    const { stdout, stderr } = await runScript('bash', [DEEP_SCAN, rawUrl, projName], 600_000);
-    const outMatch = stdout.match(/→ Output:\s*(\S+\.json)/);
-    if (!outMatch?.[1]) return res.status(500).json({ error: 'Scan completed but output not found', detail: stderr.slice(0, 300) });
+    const { report, stderr } = await runContractDeepScan(rawUrl, projName, 'bot/contract');
+    if (!report) return res.status(500).json({ error: 'Scan completed but output not found', detail: stderr.slice(0, 300) });
 
-    const report = JSON.parse(fs.readFileSync(outMatch[1], 'utf-8'));
     res.json({ status: 'complete', github_url: rawUrl, project_name: report.metadata?.project_name || projName, language: report.metadata?.language, pipeline: report.metadata?.pipeline || [], stats: report.stats || {}, findings: report.findings || [] });
   } catch (e) {
     console.error('[bot/contract] audit error:', e.message);
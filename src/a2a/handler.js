@@ -1,8 +1,11 @@
 'use strict';
 const fs = require('fs');
 const _VERIFY_KEY_PATH = process.env.VERIFY_KEY_PATH || '/root/.secrets/verify_key.bin';
+let _verifyKeyB64 = null; // cached after first successful read
 function _getVerifyKeyBase64() {
-  try { return fs.readFileSync(_VERIFY_KEY_PATH).toString('base64'); } catch { return null; }
+  if (_verifyKeyB64) return _verifyKeyB64;
+  try { _verifyKeyB64 = fs.readFileSync(_VERIFY_KEY_PATH).toString('base64'); } catch { return null; }
+  return _verifyKeyB64;
 }
 // src/a2a/handler.js — Google A2A (Agent-to-Agent) protocol implementation
 // Spec: https://google.github.io/A2A/specification
@@ -545,6 +548,31 @@ function sseWrite(res, event, data) {
   res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
 }
 
+// One shared 5 s ticker drives keepalives for every open SSE stream instead of
+// a setInterval per connection; it only runs while at least one stream is open.
+const SSE_KEEPALIVE_MS = 5000;
+const _sseKeepalives   = new Set();
+let   _sseKeepaliveTimer = null;
+
+function startKeepalive(tick) {
+  _sseKeepalives.add(tick);
+  if (!_sseKeepaliveTimer) {
+    _sseKeepaliveTimer = setInterval(() => {
+      for (const fn of _sseKeepalives) {
+        try { fn(); } catch { /* closed stream — removed by its own close handler */ }
+      }
+    }, SSE_KEEPALIVE_MS);
+    if (_sseKeepaliveTimer.unref) _sseKeepaliveTimer.unref();
+  }
+  return function stopKeepalive() {
+    _sseKeepalives.delete(tick);
+    if (_sseKeepalives.size === 0 && _sseKeepaliveTimer) {
+      clearInterval(_sseKeepaliveTimer);
+      _sseKeepaliveTimer = null;
+    }
+  };
+}
+
 /**
  * tasks/sendSubscribe — A2A 0.4.1 JSON-RPC SSE streaming.
  * POST /a2a s method="tasks/sendSubscribe" → SSE stream.
@@ -619,21 +647,21 @@ async function handleTasksSendSubscribe(rpcId, params, req, res) {
 
   updateTask(task.id, { status: { state: 'working' } });
 
-  const keepalive = setInterval(() => {
+  const stopKeepalive = startKeepalive(() => {
     sseWrite(res, 'task_working', rpcResult(rpcId, {
       id:         task.id,
       status:     { state: 'working' },
       elapsed_ms: Date.now() - startMs,
     }));
-  }, 5000);
+  });
 
-  req.on('close', () => clearInterval(keepalive));
+  req.on('close', stopKeepalive);
 
   try {
     const scanResult   = await executeSkill(skillId, address, metadata?.options || {}, paymentHeader);
     const artifactData = flattenScanResult(scanResult);
 
-    clearInterval(keepalive);
+    stopKeepalive();
 
     const completedArtifacts = [{ name: `${skillId}_result`, mimeType: 'application/json', parts: [{ type: 'data', data: artifactData }] }];
     updateTask(task.id, { status: { state: 'completed' }, artifacts: completedArtifacts });
@@ -652,7 +680,7 @@ async function handleTasksSendSubscribe(rpcId, params, req, res) {
     await postCallback(task.id, callbackUrl, { taskId: task.id, skillId, address, status: { state: 'completed' }, artifacts: completedArtifacts });
 
   } catch (e) {
-    clearInterval(keepalive);
+    stopKeepalive();
     console.error(`[a2a/sendSubscribe] task ${task.id} (${skillId}) failed:`, e.message);
     const errStatus = { state: 'failed', message: e.message.slice(0, 300) };
     if (e.status === 402) {
@@ -717,15 +745,13 @@ async function handleA2ASubscribe(req, res) {
   // Send initial event
   sseWrite(res, 'task_created', { taskId: task.id, skillId, address });
 
-  // Keepalive interval — every 5 seconds
-  const keepalive = setInterval(() => {
+  // Keepalive — every 5 seconds via the shared ticker
+  const stopKeepalive = startKeepalive(() => {
     sseWrite(res, 'task_working', { taskId: task.id, elapsed_ms: Date.now() - startMs });
-  }, 5000);
+  });
 
   // Clean up on client disconnect
-  req.on('close', () => {
-    clearInterval(keepalive);
-  });
+  req.on('close', stopKeepalive);
 
   // Execute skill
   updateTask(task.id, { status: { state: 'working' } });
@@ -734,7 +760,7 @@ async function handleA2ASubscribe(req, res) {
     const scanResult = await executeSkill(skillId, address, metadata?.options || {}, paymentHeader);
     const artifactData = flattenScanResult(scanResult);
 
-    clearInterval(keepalive);
+    stopKeepalive();
 
     updateTask(task.id, {
       status:    { state: 'completed' },
@@ -749,7 +775,7 @@ async function handleA2ASubscribe(req, res) {
     res.end();
 
   } catch (e) {
-    clearInterval(keepalive);
+    stopKeepalive();
 
     console.error(`[a2a/sse] task ${task.id} (${skillId}) failed:`, e.message);
     const failStatus = { state: 'failed', message: e.message.slice(0, 300) };
@@ -769,6 +795,53 @@ async function handleA2ASubscribe(req, res) {
 
 // ── Main entry point ──────────────────────────────────────────────────────────
 
+// JSON-RPC 2.0 batch: only the cheap lookup methods, so one HTTP round-trip can
+// poll/cancel several tasks. Scans (tasks/send, sendSubscribe) stay one per request.
+const A2A_BATCH_MAX     = 20;
+const A2A_BATCH_METHODS = new Set(['tasks/get', 'tasks/cancel']);
+
+// Routes a single JSON-RPC call to its method handler.
+async function dispatchRpc(body, headers) {
+  const { id: rpcId, method, params } = body;
+  switch (method) {
+    case 'tasks/send':
+      return handleTasksSend(rpcId, params, headers);
+    case 'tasks/get':
+      return handleTasksGet(rpcId, params);
+    case 'tasks/cancel':
+      return handleTasksCancel(rpcId, params);
+    default:
+      return rpcError(rpcId, -32601, `Method not found: ${method}`, {
+        available: ['tasks/send', 'tasks/get', 'tasks/cancel', 'tasks/sendSubscribe']
+      });
+  }
+}
+
+function handleA2ABatch(batch, res) {
+  if (batch.length === 0 || batch.length > A2A_BATCH_MAX) {
+    return res.status(400).json(rpcError(null, -32600, `Invalid Request — batch must contain 1–${A2A_BATCH_MAX} calls`));
+  }
+  const responses = batch.map(call => {
+    if (!call || call.jsonrpc !== '2.0' || !call.method) {
+      return rpcError(call?.id ?? null, -32600, 'Invalid Request — expected JSON-RPC 2.0');
+    }
+    if (!A2A_BATCH_METHODS.has(call.method)) {
+      return rpcError(call.id ?? null, -32600, `Method not allowed in batch: ${call.method}`, {
+        batchable: [...A2A_BATCH_METHODS]
+      });
+    }
+    try {
+      return call.method === 'tasks/get'
+        ? handleTasksGet(call.id, call.params)
+        : handleTasksCancel(call.id, call.params);
+    } catch (e) {
+      console.error('[a2a] batch call error:', e.message);
+      return rpcError(call.id ?? null, -32603, 'Internal error', e.message.slice(0, 200));
+    }
+  });
+  return res.json(responses);
+}
+
 /**
  * Express handler for POST /a2a.
  * Dispatches JSON-RPC 2.0 requests to the appropriate method.
@@ -776,6 +849,8 @@ async function handleA2ASubscribe(req, res) {
 async function handleA2ARequest(req, res) {
   const body = req.body;
 
+  if (Array.isArray(body)) return handleA2ABatch(body, res);
+
   // Validate JSON-RPC envelope
   if (!body || body.jsonrpc !== '2.0' || !body.method) {
     return res.status(400).json(rpcError(body?.id ?? null, -32600, 'Invalid Request — expected JSON-RPC 2.0'));
@@ -789,23 +864,7 @@ async function handleA2ARequest(req, res) {
   }
 
   try {
-    let response;
-    switch (method) {
-      case 'tasks/send':
-        response = await handleTasksSend(rpcId, params, req.headers);
-        break;
-      case 'tasks/get':
-        response = handleTasksGet(rpcId, params);
-        break;
-      case 'tasks/cancel':
-        response = handleTasksCancel(rpcId, params);
-        break;
-      default:
-        response = rpcError(rpcId, -32601, `Method not found: ${method}`, {
-          available: ['tasks/send', 'tasks/get', 'tasks/cancel', 'tasks/sendSubscribe']
-        });
-    }
-    return res.json(response);
+    return res.json(await dispatchRpc(body, req.headers));
   } catch (e) {
     console.error('[a2a] unhandled error:', e.message);
     return res.status(500).json(rpcError(rpcId, -32603, 'Internal error', e.message.slice(0, 200)));
@@ -814,6 +873,66 @@ async function handleA2ARequest(req, res) {
 
 // ── Agent card ────────────────────────────────────────────────────────────────
 
+// Base-independent part of the agent card, derived once from SKILLS instead of
+// re-mapping every skill (pricing + examples) on each agent.json request.
+const AGENT_CARD_STATIC = Object.freeze({
+  skills: Object.entries(SKILLS).map(([id, s]) => ({
+    id,
+    name:        s.name,
+    description: s.description,
+    tags:        s.tags,
+    inputModes:  s.inputModes,
+    outputModes: s.outputModes,
+    pricing:     s.priceUSDC === 0
+      ? { type: 'free' }
+      : { type: 'per_call', amount: s.priceUSDC, currency: 'USDC', protocol: 'x402' },
+    examples: [
+      {
+        description: `${s.name} of a Solana address`,
+        input: {
+          message: {
+            role: 'user',
+            parts: [{ type: 'text', text: 'Scan address 9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM' }]
+          },
+          metadata: { skill: id }
+        }
+      }
+    ]
+  })),
+  // Canonical endpoint list for A2A oracle callers
+  endpoints: [
+    { path: '/verify/v1/signed-receipt',     method: 'POST', auth: 'none',  description: 'Server-side Ed25519 receipt verification' },
+    { path: '/scan/v1/:address',             method: 'GET',  auth: 'none',  description: 'Quick Solana address IRIS risk scan (free)' },
+    { path: '/monitor/v1/governance-change', method: 'POST', auth: 'x402',  description: 'Detect governance changes in Solana program (0.15 USDC)' },
+    { path: '/feed/v1/new-spl-tokens',       method: 'GET',  auth: 'none',  description: 'Pull feed of new SPL token mints (free)' },
+    { path: '/a2a',                          method: 'POST', auth: 'x402',  description: 'A2A JSON-RPC 2.0 — tasks/send, tasks/get, tasks/cancel' },
+    { path: '/a2a/subscribe',                method: 'POST', auth: 'x402',  description: 'A2A SSE streaming subscription' },
+  ],
+  // Pricing tiers for discovery
+  pricing_tiers: {
+    discovery: {
+      price: 'free',
+      endpoints: ['/scan/v1/:address', '/feed/v1/new-spl-tokens', '/.well-known/*'],
+    },
+    attestation: {
+      price: '0.10-0.25 USDC',
+      endpoints: ['/monitor/v1/governance-change'],
+    },
+    forensic: {
+      price: 'existing deep scan prices',
+      endpoints: ['/api/v1/scan/deep', '/api/v1/adversarial/simulate'],
+    },
+  },
+  // Live usage example
+  examples: [
+    {
+      description: 'Scan known SPL Token program',
+      input: { address: 'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA' },
+      endpoint: 'GET /scan/v1/:address',
+    }
+  ],
+});
+
 function buildAgentCard(baseUrl) {
   const base = baseUrl || 'https://intmolt.org';
   return {
@@ -838,61 +957,7 @@ function buildAgentCard(baseUrl) {
     },
     defaultInputModes:  ['text/plain', 'application/json'],
     defaultOutputModes: ['application/json'],
-    skills: Object.entries(SKILLS).map(([id, s]) => ({
-      id,
-      name:        s.name,
-      description: s.description,
-      tags:        s.tags,
-      inputModes:  s.inputModes,
-      outputModes: s.outputModes,
-      pricing:     s.priceUSDC === 0
-        ? { type: 'free' }
-        : { type: 'per_call', amount: s.priceUSDC, currency: 'USDC', protocol: 'x402' },
-      examples: [
-        {
-          description: `${s.name} of a Solana address`,
-          input: {
-            message: {
-              role: 'user',
-              parts: [{ type: 'text', text: 'Scan address 9WzDXwBbmkg8ZTbNMqUxvQRAyrZzDsGYdLVL9zYtAWWM' }]
-            },
-            metadata: { skill: id }
-          }
-        }
-      ]
-    })),
-    // Canonical endpoint list for A2A oracle callers
-    endpoints: [
-      { path: '/verify/v1/signed-receipt',     method: 'POST', auth: 'none',  description: 'Server-side Ed25519 receipt verification' },
-      { path: '/scan/v1/:address',             method: 'GET',  auth: 'none',  description: 'Quick Solana address IRIS risk scan (free)' },
-      { path: '/monitor/v1/governance-change', method: 'POST', auth: 'x402',  description: 'Detect governance changes in Solana program (0.15 USDC)' },
-      { path: '/feed/v1/new-spl-tokens',       method: 'GET',  auth: 'none',  description: 'Pull feed of new SPL token mints (free)' },
-      { path: '/a2a',                          method: 'POST', auth: 'x402',  description: 'A2A JSON-RPC 2.0 — tasks/send, tasks/get, tasks/cancel' },
-      { path: '/a2a/subscribe',                method: 'POST', auth: 'x402',  description: 'A2A SSE streaming subscription' },
-    ],
-    // Pricing tiers for discovery
-    pricing_tiers: {
-      discovery: {
-        price: 'free',
-        endpoints: ['/scan/v1/:address', '/feed/v1/new-spl-tokens', '/.well-known/*'],
-      },
-      attestation: {
-        price: '0.10-0.25 USDC',
-        endpoints: ['/monitor/v1/governance-change'],
-      },
-      forensic: {
-        price: 'existing deep scan prices',
-        endpoints: ['/api/v1/scan/deep', '/api/v1/adversarial/simulate'],
-      },
-    },
-    // Live usage example
-    examples: [
-      {
-        description: 'Scan known SPL Token program',
-        input: { address: 'TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA' },
-        endpoint: 'GET /scan/v1/:address',
-      }
-    ],
+    ...AGENT_CARD_STATIC,
     metaplex_registry: METAPLEX_REGISTRY_BLOCK,
     verifyKey: _getVerifyKeyBase64(),
     reportSigning: {
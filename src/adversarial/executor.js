@@ -165,17 +165,20 @@ async function checkAccountOwnerConsistency(rpcUrl, pubkeys) {
 /**
  * Snapshot SOL and token balances of all accounts before running other attacks.
  * Used to detect any unexpected fund movements.
+ * Balance reads are independent, so they run concurrently; the result map is
+ * filled after all of them settle to keep key order deterministic.
  */
 async function snapshotBalances(rpcUrl, pubkeys) {
   try {
-    const conn = newConnection(rpcUrl);
-    const out  = {};
-    for (const pk of pubkeys.slice(0, 20)) {
-      try {
-        const bal = await conn.getBalance(new PublicKey(pk));
-        out[pk] = bal;
-      } catch {}
-    }
+    const conn    = newConnection(rpcUrl);
+    const targets = pubkeys.slice(0, 20);
+    const settled = await Promise.allSettled(
+      targets.map(async pk => conn.getBalance(new PublicKey(pk)))
+    );
+    const out = {};
+    settled.forEach((r, i) => {
+      if (r.status === 'fulfilled') out[targets[i]] = r.value;
+    });
     return out;
   } catch { return {}; }
 }
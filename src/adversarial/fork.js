@@ -163,6 +163,14 @@ async function discoverAccounts(programId) {
  * @returns {Promise<{ validator: ChildProcess, rpcUrl: string, ledgerDir: string, cleanup: () => void }>}
  */
 async function forkState(programId, options = {}) {
+  // Presence check without spawning — a missing binary would otherwise cost a
+  // failed spawn plus the full readiness poll before analysis-only fallback.
+  try {
+    fs.accessSync(VALIDATOR_BIN, fs.constants.X_OK);
+  } catch {
+    throw new Error(`solana-test-validator not found at ${VALIDATOR_BIN}`);
+  }
+
   const rpcPort   = options.rpcPort  || DEFAULT_RPC_PORT;
   const timeoutMs = options.timeoutMs || DEFAULT_TIMEOUT_MS;
   const ledgerDir = path.join(os.tmpdir(), `adversarial-ledger-${crypto.randomBytes(6).toString('hex')}`);
@@ -217,9 +225,11 @@ async function forkState(programId, options = {}) {
   ];
 
   console.log(`[adversarial/fork] starting validator: ${VALIDATOR_BIN} (port ${rpcPort})`);
+  // stdout is never read — discard it instead of piping, so validator output
+  // can't buffer in the parent or stall the child once the pipe fills.
   const validator = spawn(VALIDATOR_BIN, args, {
     env:   process.env,
-    stdio: ['ignore', 'pipe', 'pipe']
+    stdio: ['ignore', 'ignore', 'pipe']
   });
 
   validator.stderr.on('data', d => {
@@ -227,10 +237,19 @@ async function forkState(programId, options = {}) {
     if (line) console.log(`[validator] ${line.slice(0, 120)}`);
   });
 
-  // Wait for validator to be ready
-  let ready = false;
-  for (let i = 0; i < READY_MAX_POLLS; i++) {
-    await new Promise(r => setTimeout(r, READY_POLL_MS));
+  // Wait for validator to be ready. An early exit (bad clone, port in use)
+  // wakes the wait immediately instead of polling out the full startup budget.
+  let ready  = false;
+  let exited = false;
+  let wake   = null;
+  validator.once('exit', () => { exited = true; if (wake) wake(); });
+  for (let i = 0; i < READY_MAX_POLLS && !exited; i++) {
+    await new Promise(r => {
+      const t = setTimeout(r, READY_POLL_MS);
+      wake = () => { clearTimeout(t); r(); };
+    });
+    wake = null;
+    if (exited) break;
     try {
       await rpcCall(rpcUrl, 'getHealth', []);
       ready = true;
@@ -241,7 +260,9 @@ async function forkState(programId, options = {}) {
   if (!ready) {
     validator.kill('SIGTERM');
     try { fs.rmSync(ledgerDir, { recursive: true, force: true }); } catch {}
-    throw new Error('solana-test-validator did not become ready in time');
+    throw new Error(exited
+      ? 'solana-test-validator exited before becoming ready'
+      : 'solana-test-validator did not become ready in time');
   }
 
   console.log(`[adversarial/fork] validator ready at ${rpcUrl}`);
@@ -340,11 +340,23 @@ async function executePlaybook(playbook, forkInfo, programId, accounts, programA
 // ── Report signing ────────────────────────────────────────────────────────────
 
 function buildUnsignedReport(programId, accounts, programAnalysis, playbookResults, meta) {
-  const findings = playbookResults.filter(r =>
-    ['VULNERABLE', 'LIKELY_VULNERABLE'].includes(r.analysis.verdict)
-  );
-  const critical = findings.filter(r => r.severity === 'critical').length;
-  const high     = findings.filter(r => r.severity === 'high').length;
+  // One pass tallies verdicts and finding severities for the summary
+  let vulnerable = 0, likelyVulnerable = 0, protectedCount = 0, inconclusive = 0;
+  let critical = 0, high = 0;
+  for (const r of playbookResults) {
+    const verdict = r.analysis.verdict;
+    if (verdict === 'VULNERABLE' || verdict === 'LIKELY_VULNERABLE') {
+      if (verdict === 'VULNERABLE') vulnerable++;
+      else likelyVulnerable++;
+      if (r.severity === 'critical') critical++;
+      else if (r.severity === 'high') high++;
+    } else if (verdict === 'PROTECTED') {
+      protectedCount++;
+    } else if (verdict === 'INCONCLUSIVE') {
+      inconclusive++;
+    }
+  }
+  const findingsCount = vulnerable + likelyVulnerable;
 
   return {
     type:         'adversarial_simulation_report',
@@ -366,13 +378,13 @@ function buildUnsignedReport(programId, accounts, programAnalysis, playbookResul
     playbook_results: playbookResults,
     summary: {
       playbooks_run:    playbookResults.length,
-      vulnerable:       findings.filter(r => r.analysis.verdict === 'VULNERABLE').length,
-      likely_vulnerable:findings.filter(r => r.analysis.verdict === 'LIKELY_VULNERABLE').length,
-      protected:        playbookResults.filter(r => r.analysis.verdict === 'PROTECTED').length,
-      inconclusive:     playbookResults.filter(r => r.analysis.verdict === 'INCONCLUSIVE').length,
+      vulnerable,
+      likely_vulnerable:likelyVulnerable,
+      protected:        protectedCount,
+      inconclusive,
       critical,
       high,
-      overall_risk:     critical > 0 ? 'CRITICAL' : high > 0 ? 'HIGH' : findings.length > 0 ? 'MEDIUM' : 'LOW'
+      overall_risk:     critical > 0 ? 'CRITICAL' : high > 0 ? 'HIGH' : findingsCount > 0 ? 'MEDIUM' : 'LOW'
     }
   };
 }
@@ -0,0 +1,29 @@
+'use strict';
+/**
+ * src/crypto/sha256.js — SHA-256 digest helper
+ *
+ * Uses the one-shot crypto.hash() (Node ≥ 20.12), which skips allocating a Hash
+ * object per call — this matters for the PDA bump search in the scanners, which
+ * may hash up to 256 times per derivation. Older Node falls back to createHash.
+ *
+ * Usage:
+ *   const { sha256 } = require('./src/crypto/sha256');
+ *   sha256(buf);           // Buffer
+ *   sha256(str, 'hex');    // hex string
+ */
+
+const crypto = require('crypto');
+
+/**
+ * @param {string|Buffer} data
+ * @param {'buffer'|'hex'|'base64'} [encoding='buffer']
+ * @returns {Buffer|string}
+ */
+const sha256 = crypto.hash
+  ? (data, encoding = 'buffer') => crypto.hash('sha256', data, encoding)
+  : (data, encoding = 'buffer') => {
+    const h = crypto.createHash('sha256').update(data);
+    return encoding === 'buffer' ? h.digest() : h.digest(encoding);
+  };
+
+module.exports = { sha256 };
@@ -17,6 +17,7 @@ const { spawn } = require('child_process');
 const SIGN_SCRIPT = '/root/scanner/sign-report.py';
 const SIGN_TIMEOUT_MS = 10_000;
 const SIGN_CONCURRENCY = 8; // max concurrent python3 processes
+const SIGN_STDERR_MAX  = 1024; // only the head of stderr is ever reported
 
 // Simple counting semaphore to bound concurrent subprocesses.
 let _active = 0;
@@ -53,7 +54,7 @@ async function asyncSign(reportText) {
     let stdout = '';
     let stderr = '';
     proc.stdout.on('data', d => { stdout += d; });
-    proc.stderr.on('data', d => { stderr += d; });
+    proc.stderr.on('data', d => { if (stderr.length < SIGN_STDERR_MAX) stderr += d; });
     proc.on('close', code => {
       if (code === 0) {
         try {
@@ -77,22 +78,51 @@ async function asyncSign(reportText) {
  * Both sign and verify sides must use this to ensure byte-identical output
  * regardless of key insertion order or consumer language.
  *
+ * Written as a single pass into one parts array that is joined once, instead
+ * of building a sorted copy of every object and concatenating a string per
+ * nesting level. Output is byte-identical to the previous implementation,
+ * including its key order: integer-like keys first in numeric order (object
+ * property order of the old sorted copy), then the rest sorted, `__proto__`
+ * dropped, and undefined/function values rendered as `undefined`.
+ *
  * @param {*} obj  Any JSON-serializable value
  * @returns {string}
  */
 function canonicalJSON(obj) {
+  // Top-level undefined/function stays `undefined` (not the string), as before
   if (obj === null || typeof obj !== 'object' || Array.isArray(obj)) {
     return JSON.stringify(obj);
   }
-  const sorted = Object.keys(obj).sort().reduce((acc, k) => {
-    acc[k] = obj[k];
-    return acc;
-  }, {});
-  // Recurse into values (shallow sort is enough for 1-level report payloads,
-  // but full recursion prevents future footguns from nested objects)
-  return '{' + Object.keys(sorted).map(k =>
-    JSON.stringify(k) + ':' + canonicalJSON(sorted[k])
-  ).join(',') + '}';
+  const out = [];
+  _writeCanonical(obj, out);
+  return out.join('');
+}
+
+const ARRAY_INDEX_RE = /^(?:0|[1-9]\d*)$/;
+function _isArrayIndex(k) {
+  return ARRAY_INDEX_RE.test(k) && Number(k) < 4294967295;
+}
+
+function _writeCanonical(value, out) {
+  if (value === null || typeof value !== 'object' || Array.isArray(value)) {
+    out.push(String(JSON.stringify(value)));
+    return;
+  }
+  // Object.keys already lists array-index keys first, ascending
+  const keys = Object.keys(value);
+  let n = 0;
+  while (n < keys.length && _isArrayIndex(keys[n])) n++;
+  const ordered = n === 0 ? keys.sort() : keys.slice(0, n).concat(keys.slice(n).sort());
+  out.push('{');
+  let first = true;
+  for (const k of ordered) {
+    if (k === '__proto__') continue;
+    if (!first) out.push(',');
+    first = false;
+    out.push(JSON.stringify(k), ':');
+    _writeCanonical(value[k], out);
+  }
+  out.push('}');
 }
 
 module.exports = { asyncSign, canonicalJSON, SIGN_SCRIPT };
@@ -138,21 +138,23 @@ async function computeDelta(oldSnapshot, newSnapshot) {
   }
 
   // ── 4. New instructions / findings ────────────────────────────────────────
-  const oldFindingKeys = (old.findings || []).map(f => `${f.category}:${f.label}`);
-  const newFindingKeys = (cur.findings || []).map(f => `${f.category}:${f.label}`);
+  const oldFindings    = old.findings || [];
+  const newFindings    = cur.findings || [];
+  const oldFindingKeys = new Set(oldFindings.map(f => `${f.category}:${f.label}`));
+  const newFindingKeys = new Set(newFindings.map(f => `${f.category}:${f.label}`));
 
-  for (const f of (cur.findings || [])) {
+  for (const f of newFindings) {
     const key = `${f.category}:${f.label}`;
-    if (oldFindingKeys.includes(key)) continue;
+    if (oldFindingKeys.has(key)) continue;
     const explanation = await explainChange('new finding', 'absent', f.label);
     const severity = f.severity === 'critical' ? 'critical' : f.severity === 'high' ? 'warning' : 'info';
     changes.push({ category: 'new_instructions', field: `New Finding: ${f.label}`, old_value: 'absent', new_value: f.label, severity, explanation });
   }
 
   // ── 5. Removed checks / findings ──────────────────────────────────────────
-  for (const f of (old.findings || [])) {
+  for (const f of oldFindings) {
     const key = `${f.category}:${f.label}`;
-    if (newFindingKeys.includes(key)) continue;
+    if (newFindingKeys.has(key)) continue;
     const explanation = await explainChange('removed finding', f.label, 'absent');
     // Removing an access/validation check is suspicious; removing a warning finding is neutral
     const isAccessCheck = /check|valid|access|control|guard/i.test(key);
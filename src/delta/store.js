@@ -5,16 +5,39 @@
 
 const fs     = require('fs');
 const path   = require('path');
-const crypto = require('crypto');
+const { sha256 } = require('../crypto/sha256');
 
 const SNAPSHOTS_DIR = path.join(__dirname, '../../data/snapshots');
 
-function ensureDir(dir) {
-  try { fs.mkdirSync(dir, { recursive: true }); } catch {}
+function contentHash(data) {
+  return sha256(JSON.stringify(data), 'hex');
 }
 
-function contentHash(data) {
-  return crypto.createHash('sha256').update(JSON.stringify(data)).digest('hex');
+// Directory listings keyed by snapshot dir. A compare request reads the same
+// dir twice and delta-check reads it before saving, so reuse the listing while
+// the dir mtime is unchanged; saveSnapshot() also drops the entry explicitly.
+// Filenames start with the ISO timestamp, so the listing is sorted newest-first
+// once here and readers just filter/slice it.
+const LISTING_CACHE_MAX = 500;
+const _listingCache = new Map(); // dir → { mtimeMs, files }
+
+function listSnapshotFiles(dir) {
+  const { mtimeMs } = fs.statSync(dir);
+  const hit = _listingCache.get(dir);
+  if (hit && hit.mtimeMs === mtimeMs) {
+    // Re-insert so eviction below drops the least recently used dir, not the oldest
+    _listingCache.delete(dir);
+    _listingCache.set(dir, hit);
+    return hit.files;
+  }
+
+  const files = fs.readdirSync(dir).sort().reverse();
+  _listingCache.delete(dir);
+  _listingCache.set(dir, { mtimeMs, files });
+  if (_listingCache.size > LISTING_CACHE_MAX) {
+    _listingCache.delete(_listingCache.keys().next().value);
+  }
+  return files;
 }
 
 // Convert ISO timestamp to a filename-safe string.
@@ -27,18 +50,22 @@ function tsToFilename(ts) {
  * @param {string} address
  * @param {string} scanType  e.g. 'token-audit', 'quick', 'evm-token'
  * @param {object} reportData  full scan result object
- * @returns {{ timestamp, contentHash, filename }}
+ * @returns {Promise<{ timestamp, contentHash, filename }>}  resolves once the file is on disk
  */
-function saveSnapshot(address, scanType, reportData) {
+async function saveSnapshot(address, scanType, reportData) {
   const dir = path.join(SNAPSHOTS_DIR, address);
-  ensureDir(dir);
 
   const timestamp = new Date().toISOString();
   const hash      = contentHash(reportData);
   const snapshot  = { version: 1, address, scanType, timestamp, contentHash: hash, data: reportData };
 
   const filename = `${tsToFilename(timestamp)}_${scanType}.json`;
-  fs.writeFileSync(path.join(dir, filename), JSON.stringify(snapshot, null, 2), 'utf-8');
+  // Compact JSON — snapshots are only read back by this module, never by hand.
+  // fs.promises keeps the event loop free during the write; callers await it so
+  // the snapshot is never reported as stored before it is readable.
+  await fs.promises.mkdir(dir, { recursive: true });
+  await fs.promises.writeFile(path.join(dir, filename), JSON.stringify(snapshot), 'utf-8');
+  _listingCache.delete(dir);
   console.log(`[delta/store] saved address=${address} type=${scanType} hash=${hash.slice(0, 12)}`);
   return { timestamp, contentHash: hash, filename };
 }
@@ -49,16 +76,12 @@ function saveSnapshot(address, scanType, reportData) {
 function getLatestSnapshot(address, scanType) {
   const dir = path.join(SNAPSHOTS_DIR, address);
   let files;
-  try { files = fs.readdirSync(dir); } catch { return null; }
+  try { files = listSnapshotFiles(dir); } catch { return null; }
 
-  const matching = files
-    .filter(f => f.endsWith(`_${scanType}.json`))
-    .sort()
-    .reverse();
-
-  if (!matching.length) return null;
+  const latest = files.find(f => f.endsWith(`_${scanType}.json`));
+  if (!latest) return null;
   try {
-    return JSON.parse(fs.readFileSync(path.join(dir, matching[0]), 'utf-8'));
+    return JSON.parse(fs.readFileSync(path.join(dir, latest), 'utf-8'));
   } catch { return null; }
 }
 
@@ -69,7 +92,7 @@ function getLatestSnapshot(address, scanType) {
 function getSnapshotByTimestamp(address, timestamp) {
   const dir = path.join(SNAPSHOTS_DIR, address);
   let files;
-  try { files = fs.readdirSync(dir); } catch { return null; }
+  try { files = listSnapshotFiles(dir); } catch { return null; }
 
   const prefix = tsToFilename(timestamp);
   const match  = files.find(f => f.startsWith(prefix));
@@ -88,21 +111,41 @@ function getSnapshotByTimestamp(address, timestamp) {
 function getSnapshotHistory(address, limit = 10) {
   const dir = path.join(SNAPSHOTS_DIR, address);
   let files;
-  try { files = fs.readdirSync(dir); } catch { return []; }
+  try { files = listSnapshotFiles(dir); } catch { return []; }
 
   return files
     .filter(f => f.endsWith('.json'))
-    .sort()
-    .reverse()
     .slice(0, limit)
     .map(f => {
       try {
         const { version, timestamp, scanType, contentHash: h, address: a } =
-          JSON.parse(fs.readFileSync(path.join(dir, f), 'utf-8'));
+          readSnapshotMeta(path.join(dir, f));
         return { version, timestamp, scanType, contentHash: h, address: a };
       } catch { return null; }
     })
     .filter(Boolean);
 }
 
+// Metadata fields are written before `data` (see saveSnapshot), so history
+// listings only need the head of each file — the scan payload behind it can be
+// tens of KB and is never parsed here. Falls back to a full read if the head
+// doesn't contain the `data` key (unexpected layout or oversized metadata).
+const META_HEAD_BYTES = 1024;
+const DATA_KEY_RE     = /,\s*"data"\s*:/;
+
+function readSnapshotMeta(file) {
+  const fd = fs.openSync(file, 'r');
+  let head;
+  try {
+    const buf = Buffer.alloc(META_HEAD_BYTES);
+    const n   = fs.readSync(fd, buf, 0, META_HEAD_BYTES, 0);
+    head = buf.toString('utf-8', 0, n);
+  } finally {
+    fs.closeSync(fd);
+  }
+  const m = DATA_KEY_RE.exec(head);
+  if (m) return JSON.parse(head.slice(0, m.index) + '}');
+  return JSON.parse(fs.readFileSync(file, 'utf-8'));
+}
+
 module.exports = { saveSnapshot, getLatestSnapshot, getSnapshotByTimestamp, getSnapshotHistory };
@@ -125,8 +125,11 @@ function calculateAggregatedRisk(rugcheck, tracker, extensions) {
     }
 
     // Danger risks z RugCheck
-    const dangerCount = (rugcheck.risks || []).filter(r => r.level === 'danger').length;
-    const warnCount   = (rugcheck.risks || []).filter(r => r.level === 'warn').length;
+    let dangerCount = 0, warnCount = 0;
+    for (const r of rugcheck.risks || []) {
+      if (r.level === 'danger') dangerCount++;
+      else if (r.level === 'warn') warnCount++;
+    }
     if (dangerCount > 0) {
       score += dangerCount * 10;
       flags.push(`rugcheck_danger_risks_${dangerCount}`);
@@ -0,0 +1,37 @@
+'use strict';
+/**
+ * src/enrichment/mem-cache.js
+ *
+ * Sdílená in-memory cache pro enrichment moduly (rugcheck, solana-tracker,
+ * token-extensions): TTL podle času zápisu + strop počtu položek.
+ *
+ * Expirované položky se mažou jen při čtení, takže mapa bez stropu rostla s každým
+ * novým mintem. Po překročení `max` se vyhazuje nejstarší zápis — Map drží pořadí
+ * vložení a set() klíč přesune na konec.
+ */
+
+/**
+ * @param {{ ttlMs: number, max: number }} opts
+ * @returns {{ get(key: string): *, set(key: string, data: *): void }}
+ *   get() vrací undefined pro chybějící/expirovanou položku (null je platná hodnota)
+ */
+function createMemCache({ ttlMs, max }) {
+  /** @type {Map<string, {data: *, ts: number}>} */
+  const map = new Map();
+
+  return {
+    get(key) {
+      const hit = map.get(key);
+      if (!hit) return undefined;
+      if (Date.now() - hit.ts > ttlMs) { map.delete(key); return undefined; }
+      return hit.data;
+    },
+    set(key, data) {
+      map.delete(key);
+      map.set(key, { data, ts: Date.now() });
+      if (map.size > max) map.delete(map.keys().next().value);
+    },
+  };
+}
+
+module.exports = { createMemCache };
@@ -10,6 +10,7 @@
  */
 
 const fs = require('fs');
+const { createMemCache } = require('./mem-cache');
 const db = require('../../db');
 
 // ── Config ────────────────────────────────────────────────────────────────────
@@ -17,6 +18,7 @@ const db = require('../../db');
 const RUGCHECK_BASE   = 'https://api.rugcheck.xyz/v1/tokens';
 const TIMEOUT_MS      = 10_000;
 const MEM_TTL_MS      = 5  * 60_000; // 5 minut in-memory
+const MEM_MAX         = 5_000;        // strop položek in-memory cache
 const DB_TTL_MS       = 24 * 60_000 * 60; // 24 hodin SQLite (sdílené s lookup.js)
 
 // API klíč z env (volitelný — veřejné endpointy fungují i bez něj)
@@ -42,18 +44,14 @@ function acquireSlot() {
 
 // ── In-memory cache ───────────────────────────────────────────────────────────
 
-/** @type {Map<string, {data: object, ts: number}>} */
-const _memCache = new Map();
+const _memCache = createMemCache({ ttlMs: MEM_TTL_MS, max: MEM_MAX });
 
 function memGet(mint) {
-  const hit = _memCache.get(mint);
-  if (!hit) return null;
-  if (Date.now() - hit.ts > MEM_TTL_MS) { _memCache.delete(mint); return null; }
-  return hit.data;
+  return _memCache.get(mint) ?? null;
 }
 
 function memSet(mint, data) {
-  _memCache.set(mint, { data, ts: Date.now() });
+  _memCache.set(mint, data);
 }
 
 // ── RugCheck fetch ────────────────────────────────────────────────────────────
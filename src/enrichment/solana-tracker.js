@@ -12,30 +12,29 @@
  */
 
 const fs = require('fs');
+const { createMemCache } = require('./mem-cache');
 
 // ── Config ────────────────────────────────────────────────────────────────────
 
 const BASE_URL   = 'https://data.solanatracker.io';
 const TIMEOUT_MS = 10_000;
 const MEM_TTL_MS = 2 * 60_000; // 2 minuty
+const MEM_MAX    = 5_000;      // strop položek in-memory cache
 
 const API_KEY = process.env.SOLANA_TRACKER_API_KEY
   || (() => { try { return fs.readFileSync('/root/.secrets/solana_tracker_api_key', 'utf-8').trim(); } catch { return ''; } })();
 
 // ── In-memory cache ───────────────────────────────────────────────────────────
 
-/** @type {Map<string, {data: object|null, ts: number}>} */
-const _memCache = new Map();
+const _memCache = createMemCache({ ttlMs: MEM_TTL_MS, max: MEM_MAX });
 
+// undefined = no cache entry, null = cached "no data" response
 function memGet(mint) {
-  const hit = _memCache.get(mint);
-  if (!hit) return undefined; // undefined = no cache entry
-  if (Date.now() - hit.ts > MEM_TTL_MS) { _memCache.delete(mint); return undefined; }
-  return hit.data; // null = cached "no data" response
+  return _memCache.get(mint);
 }
 
 function memSet(mint, data) {
-  _memCache.set(mint, { data, ts: Date.now() });
+  _memCache.set(mint, data);
 }
 
 // ── Fetch helper ──────────────────────────────────────────────────────────────
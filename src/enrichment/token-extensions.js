@@ -16,6 +16,7 @@
  */
 
 const fs = require('fs');
+const { createMemCache } = require('./mem-cache');
 const { SOLANA_RPC_URL: SOLANA_RPC } = require('../rpc');
 
 // ── Config ────────────────────────────────────────────────────────────────────
@@ -23,21 +24,18 @@ const { SOLANA_RPC_URL: SOLANA_RPC } = require('../rpc');
 const TOKEN_2022_PROG  = 'TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb';
 const TIMEOUT_MS       = 10_000;
 const MEM_TTL_MS       = 30 * 60_000; // 30 minut
+const MEM_MAX          = 5_000;        // strop položek in-memory cache
 
 // ── In-memory cache ───────────────────────────────────────────────────────────
 
-/** @type {Map<string, {data: object, ts: number}>} */
-const _memCache = new Map();
+const _memCache = createMemCache({ ttlMs: MEM_TTL_MS, max: MEM_MAX });
 
 function memGet(mint) {
-  const hit = _memCache.get(mint);
-  if (!hit) return null;
-  if (Date.now() - hit.ts > MEM_TTL_MS) { _memCache.delete(mint); return null; }
-  return hit.data;
+  return _memCache.get(mint) ?? null;
 }
 
 function memSet(mint, data) {
-  _memCache.set(mint, { data, ts: Date.now() });
+  _memCache.set(mint, data);
 }
 
 // ── RPC helper ────────────────────────────────────────────────────────────────
@@ -1,18 +1,80 @@
 'use strict';
 
 const fs = require('fs');
-const Anthropic = require('@anthropic-ai/sdk');
 
 let _client = null;
 function getClient() {
   if (!_client) {
     const apiKey = process.env.ANTHROPIC_API_KEY;
     if (!apiKey) throw new Error('ANTHROPIC_API_KEY not set');
+    // SDK se načte až s prvním klientem — bez ANTHROPIC_API_KEY jede vše
+    // přes OpenRouter fallback a SDK se nikdy nepotřebuje
+    const Anthropic = require('@anthropic-ai/sdk');
     _client = new Anthropic.default({ apiKey });
   }
   return _client;
 }
 
+// ── Token budget (admission control) ─────────────────────────────────────────
+// Kreditový semafor: každé volání Anthropic API si předem odečte odhad tokenů
+// (vstup + max výstup) a kredity se vrátí až po CREDIT_REFUND_MS — tj. klouzavé
+// minutové okno. Při burstu scanů se požadavky krátce řadí do fronty místo
+// 429 + retry. Fronta je omezená délkou (ADVISOR_QUEUE_MAX) i čekáním
+// (ADVISOR_QUEUE_WAIT_MS) — po překročení se volání odmítne a volající
+// pokračuje bez advisora, místo aby HTTP request visel přes timeout klienta.
+const ADVISOR_TOKENS_PER_MIN = parseInt(process.env.ADVISOR_TOKENS_PER_MIN || '400000', 10);
+const ADVISOR_QUEUE_MAX      = parseInt(process.env.ADVISOR_QUEUE_MAX || '50', 10);
+const ADVISOR_QUEUE_WAIT_MS  = parseInt(process.env.ADVISOR_QUEUE_WAIT_MS || '20000', 10);
+const ADVISOR_MAX_TOKENS     = 8192;
+const CREDIT_REFUND_MS       = 60_000;
+
+let _credits = ADVISOR_TOKENS_PER_MIN;
+const _creditQueue = []; // pořadí příchodu: { need, resolve, reject, timer }
+
+function _acquireCredits(estimate) {
+  // Požadavek větší než celá kapacita projde, jakmile je okno prázdné
+  const need = Math.min(estimate, ADVISOR_TOKENS_PER_MIN);
+  if (need <= _credits) {
+    _credits -= need;
+    return Promise.resolve(need);
+  }
+  if (_creditQueue.length >= ADVISOR_QUEUE_MAX) {
+    return Promise.reject(new Error(`advisor token budget exhausted (${_creditQueue.length} requests queued)`));
+  }
+  return new Promise((resolve, reject) => {
+    const waiter = { need, resolve, reject, timer: null };
+    waiter.timer = setTimeout(() => {
+      _creditQueue.splice(_creditQueue.indexOf(waiter), 1);
+      reject(new Error(`advisor token budget: no capacity within ${ADVISOR_QUEUE_WAIT_MS}ms`));
+    }, ADVISOR_QUEUE_WAIT_MS);
+    _creditQueue.push(waiter);
+  });
+}
+
+// First-fit: velký požadavek na začátku fronty neblokuje menší za ním —
+// sám čeká nejdéle ADVISOR_QUEUE_WAIT_MS.
+function _releaseCredits(amount) {
+  _credits += amount;
+  for (let i = 0; i < _creditQueue.length && _credits > 0;) {
+    const waiter = _creditQueue[i];
+    if (waiter.need > _credits) { i++; continue; }
+    _creditQueue.splice(i, 1);
+    clearTimeout(waiter.timer);
+    _credits -= waiter.need;
+    waiter.resolve(waiter.need);
+  }
+}
+
+function _refundCredits(amount) {
+  const timer = setTimeout(() => _releaseCredits(amount), CREDIT_REFUND_MS);
+  if (timer.unref) timer.unref();
+}
+
+function _estimateTokens(systemPrompt, userMessage) {
+  // ~4 znaky na token + rezerva na plný výstup
+  return Math.ceil(((systemPrompt || '').length + (userMessage || '').length) / 4) + ADVISOR_MAX_TOKENS;
+}
+
 // ── OpenRouter fallback (když ANTHROPIC_API_KEY chybí) ───────────────────────
 // Volá OpenRouter bez advisor nástroje — vrací stejný tvar výsledku.
 async function _runWithOpenRouter({ systemPrompt, userMessage }) {
@@ -73,12 +135,22 @@ async function _runWithOpenRouter({ systemPrompt, userMessage }) {
  *
  * @returns {{ text, advisorUsed, usage, rawContent, stopReason, provider }}
  */
-async function runWithAdvisor({ systemPrompt, userMessage, tools = [], maxAdvisorUses = 3 }) {
+async function runWithAdvisor(opts) {
   if (!process.env.ANTHROPIC_API_KEY) {
     console.warn('[advisor] ANTHROPIC_API_KEY není nastaven — přepínám na OpenRouter fallback');
-    return _runWithOpenRouter({ systemPrompt, userMessage });
+    return _runWithOpenRouter(opts);
+  }
+
+  // Rozpočet se týká jen Anthropic limitu — OpenRouter fallback ho nečerpá
+  const debited = await _acquireCredits(_estimateTokens(opts.systemPrompt, opts.userMessage));
+  try {
+    return await _runWithAdvisor(opts);
+  } finally {
+    _refundCredits(debited);
   }
+}
 
+async function _runWithAdvisor({ systemPrompt, userMessage, tools = [], maxAdvisorUses = 3 }) {
   const client = getClient();
 
   const allTools = [
@@ -94,7 +166,7 @@ async function runWithAdvisor({ systemPrompt, userMessage, tools = [], maxAdviso
   // Použití beta.messages.create — automaticky nastaví anthropic-beta header.
   const response = await client.beta.messages.create({
     model:      'claude-sonnet-4-6',
-    max_tokens: 8192,
+    max_tokens: ADVISOR_MAX_TOKENS,
     system:     systemPrompt,
     tools:      allTools,
     messages:   [{ role: 'user', content: userMessage }],
@@ -120,4 +192,4 @@ async function runWithAdvisor({ systemPrompt, userMessage, tools = [], maxAdviso
   };
 }
 
-module.exports = { runWithAdvisor };
+module.exports = { runWithAdvisor, _acquireCredits, _releaseCredits };
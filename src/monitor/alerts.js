@@ -1,6 +1,6 @@
 'use strict';
 
-const crypto = require('crypto');
+const { sha256 } = require('../crypto/sha256');
 
 // Známé bezpečné programy — nebudou triggrovovat suspicious_cpi
 const KNOWN_PROGRAMS = new Set([
@@ -29,31 +29,31 @@ const LARGE_TRANSFER_TOKEN_AMOUNT  = 10_000;           // 10k tokenů (pro USDC
 const LARGE_TRANSFER_USDC_DECIMALS = 6;
 const USDC_MINT = 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v';
 
+// Authority klíčová slova, předkompilovaná jednou místo lowercase + substring
+// scanu per keyword per instrukce. Parsed type je bez podtržítka
+// (setAuthority → setauthority), raw data s podtržítkem (set_authority).
+const AUTHORITY_TYPE_RE = /(?:set|change|transfer|update)authority/i;
+const AUTHORITY_DATA_RE = /(?:set|change|transfer|update)_authority/i;
+const AUTHORITY_EVENT_TYPES = new Set(['SET_AUTHORITY', 'UPDATE_AUTHORITY', 'CHANGE_AUTHORITY']);
+
 /**
  * Detekce authority change — hledá klíčová slova v instruction datech nebo parsed events.
  */
 function detectAuthorityChange(parsed, address) {
-  const authorityKeywords = [
-    'set_authority', 'setAuthority', 'change_authority', 'changeAuthority',
-    'transfer_authority', 'transferAuthority', 'update_authority', 'updateAuthority',
-  ];
-
   for (const ix of parsed.instructions) {
     // Helius parsed events
     if (ix._event === 'set_authority') return true;
-    if (ix.parsed?.type && authorityKeywords.some(kw => ix.parsed.type.toLowerCase().includes(kw.replace('_', '')))) {
+    if (ix.parsed?.type && AUTHORITY_TYPE_RE.test(ix.parsed.type)) {
       return true;
     }
     // Base58 data heuristic — hledej v instrukci zda accounts obsahuje sledovanou adresu
     if (ix.accounts && ix.accounts.includes(address)) {
-      const dataStr = String(ix.data || '');
-      if (authorityKeywords.some(kw => dataStr.toLowerCase().includes(kw))) return true;
+      if (AUTHORITY_DATA_RE.test(String(ix.data || ''))) return true;
     }
   }
 
   // Helius type
-  if (['SET_AUTHORITY', 'UPDATE_AUTHORITY', 'CHANGE_AUTHORITY']
-      .includes((parsed.type || '').toUpperCase())) return true;
+  if (AUTHORITY_EVENT_TYPES.has((parsed.type || '').toUpperCase())) return true;
 
   return false;
 }
@@ -172,11 +172,8 @@ function detectSuspiciousCPI(parsed, address) {
  * Generuje unikátní ID alertu.
  */
 function generateAlertId(txSig, rule, address) {
-  return crypto
-    .createHash('sha256')
-    .update(`${txSig}:${rule}:${address}`)
-    .digest('hex')
-    .slice(0, 16);
+  const input = `${txSig}:${rule}:${address}`;
+  return sha256(input, 'hex').slice(0, 16);
 }
 
 /**
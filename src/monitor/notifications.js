@@ -13,6 +13,10 @@ const rateWindows = new Map();
 /** Telegram batch queue: chatId → [{ alert, timestamp }] */
 const telegramBatchQueue = new Map();
 
+// Logy potlačených alertů (duplicita, rate limit) — při Helius retry floodu jich
+// chodí stovky za sekundu, proto se vypisují jen s MONITOR_DEBUG=1
+const DEBUG_SUPPRESSED  = process.env.MONITOR_DEBUG === '1';
+
 const RATE_LIMIT_MAX    = 10;    // max alertů per adresa per hodinu
 const RATE_LIMIT_WINDOW = 3600_000; // 1 hodina v ms
 const BATCH_WINDOW      = 5 * 60_000; // 5 minut pro warning batching
@@ -44,22 +48,34 @@ function isDuplicate(alert) {
 
 function isRateLimited(address) {
   const now  = Date.now();
-  const key  = address;
-  const hits = (rateWindows.get(key) || []).filter(ts => now - ts < RATE_LIMIT_WINDOW);
+  let hits   = rateWindows.get(address);
+  if (!hits) {
+    hits = [];
+    rateWindows.set(address, hits);
+  }
+  // Timestamps jsou přidávány chronologicky — prošlé jsou vždy na začátku,
+  // stačí je uříznout z hlavy místo filtrování (a kopírování) celého okna
+  let expired = 0;
+  while (expired < hits.length && now - hits[expired] >= RATE_LIMIT_WINDOW) expired++;
+  if (expired) hits.splice(0, expired);
   if (hits.length >= RATE_LIMIT_MAX) return true;
   hits.push(now);
-  rateWindows.set(key, hits);
   return false;
 }
 
 // ── Telegram ──────────────────────────────────────────────────────────────────
 
+// Token se resolvuje jednou (env → secrets soubor) a drží se pro další zprávy.
+// Null se necachuje, aby pozdější doplnění tokenu nevyžadovalo restart.
+let _telegramToken = null;
 function getTelegramToken() {
-  return process.env.TELEGRAM_BOT_TOKEN
+  if (_telegramToken) return _telegramToken;
+  _telegramToken = process.env.TELEGRAM_BOT_TOKEN
     || (() => {
       try { return require('fs').readFileSync('/root/.secrets/telegram_bot_token', 'utf8').trim(); }
       catch { return null; }
     })();
+  return _telegramToken;
 }
 
 async function sendTelegramMessage(chatId, text) {
@@ -243,13 +259,13 @@ async function sendWebhookCallback(url, alert) {
 async function sendAlert(alert, channels = []) {
   // 1. Deduplikace
   if (isDuplicate(alert)) {
-    console.log(`[monitor/notifications] Duplicate alert skipped: ${alert.id}`);
+    if (DEBUG_SUPPRESSED) console.log(`[monitor/notifications] Duplicate alert skipped: ${alert.id}`);
     return;
   }
 
   // 2. Rate limit
   if (isRateLimited(alert.address)) {
-    console.log(`[monitor/notifications] Rate limit hit for ${alert.address}`);
+    if (DEBUG_SUPPRESSED) console.log(`[monitor/notifications] Rate limit hit for ${alert.address}`);
     return;
   }
 
@@ -20,7 +20,7 @@ const TOKEN22_PROGRAM  = 'TokenzQdBNbLqP5VEhdkAS6EPFLC1PHnBqCXEpPxuEb';
 
 const POLL_INTERVAL_MS = 5 * 60 * 1000; // 5 minut
 const BATCH_SIZE       = 100;
-const RPC_BATCH        = 5; // getTransaction paralelně najednou
+const RPC_BATCH        = 5; // max. souběžných getTransaction
 
 let _db    = null;
 let _timer = null;
@@ -93,17 +93,17 @@ async function _pollProgram(rpcUrl, programId, label) {
     return 0;
   }
 
+  // RPC_BATCH workerů si bere další signaturu hned, jak doběhne předchozí —
+  // pomalý getTransaction tak neblokuje celý zbytek dávky jako u slice + Promise.all
   let inserted = 0;
-  for (let i = 0; i < validSigs.length; i += RPC_BATCH) {
-    const chunk = validSigs.slice(i, i + RPC_BATCH);
-    const txs = await Promise.all(
-      chunk.map(sig => _rpc(rpcUrl, 'getTransaction', [
+  let next = 0;
+  const worker = async () => {
+    while (next < validSigs.length) {
+      const sig = validSigs[next++];
+      const tx  = await _rpc(rpcUrl, 'getTransaction', [
         sig,
         { encoding: 'jsonParsed', maxSupportedTransactionVersion: 0 },
-      ]).catch(() => null))
-    );
-    for (let j = 0; j < txs.length; j++) {
-      const tx = txs[j];
+      ]).catch(() => null);
       if (!tx) continue;
       const mint = _extractInitializeMint(tx);
       if (!mint) continue;
@@ -111,13 +111,14 @@ async function _pollProgram(rpcUrl, programId, label) {
         _db.prepare(`
           INSERT OR IGNORE INTO spl_mints (mint, tx_sig, slot, block_time, source)
           VALUES (?, ?, ?, ?, ?)
-        `).run(mint, chunk[j], tx.slot ?? null, (tx.blockTime ?? 0) * 1000, label);
+        `).run(mint, sig, tx.slot ?? null, (tx.blockTime ?? 0) * 1000, label);
         inserted++;
       } catch (e) {
         if (!e.message.includes('UNIQUE')) console.error('[spl-mint-poller] insert error:', e.message);
       }
     }
-  }
+  };
+  await Promise.all(Array.from({ length: Math.min(RPC_BATCH, validSigs.length) }, worker));
 
   _updateCursor(newCursorSig);
   return inserted;
@@ -2,11 +2,10 @@
 
 const fs   = require('fs');
 const path = require('path');
-const { getWebhookStatus } = require('./webhook-manager');
+const { getWebhookStatus, loadConfig } = require('./webhook-manager');
 
 const EVENTS_FILE       = path.join(__dirname, '../../data/monitor/events.jsonl');
 const WATCHLIST_DIR     = path.join(__dirname, '../../data/watchlist');
-const WEBHOOK_CFG_FILE  = path.join(__dirname, '../../data/monitor/webhook-config.json');
 
 // ── helpers ───────────────────────────────────────────────────────────────────
 
@@ -168,8 +167,7 @@ async function getWebhookInfo() {
   if (_webhookInfoCache && (Date.now() - _webhookInfoCacheTs) < WEBHOOK_INFO_TTL_MS) {
     return _webhookInfoCache;
   }
-  let cfg = {};
-  try { cfg = JSON.parse(fs.readFileSync(WEBHOOK_CFG_FILE, 'utf8')); } catch { /* nový soubor */ }
+  const cfg = loadConfig();
 
   const webhookId = cfg.webhookId || null;
 
@@ -29,17 +29,37 @@ function getApiKey() {
   return key;
 }
 
+// Parsovaný config držený podle mtime+size — init, sync i admin status ho čtou
+// opakovaně, parsujeme jen když se soubor skutečně změnil.
+let _configCache = null; // { mtimeMs, size, config }
+
 function loadConfig() {
   try {
-    return JSON.parse(fs.readFileSync(CONFIG_FILE, 'utf8'));
+    const st = fs.statSync(CONFIG_FILE);
+    if (!_configCache || _configCache.mtimeMs !== st.mtimeMs || _configCache.size !== st.size) {
+      const config = JSON.parse(fs.readFileSync(CONFIG_FILE, 'utf8'));
+      _configCache = { mtimeMs: st.mtimeMs, size: st.size, config };
+    }
+    // Volající config mutují před saveConfig — vracej kopii, ne sdílený objekt
+    return { ..._configCache.config };
   } catch {
+    _configCache = null;
     return {};
   }
 }
 
+// Atomický zápis (tmp + rename ve stejném adresáři). Roztržený soubor by
+// loadConfig() přečetl jako {} a další sync by založil duplicitní webhook.
 function saveConfig(config) {
   fs.mkdirSync(path.dirname(CONFIG_FILE), { recursive: true });
-  fs.writeFileSync(CONFIG_FILE, JSON.stringify(config, null, 2), 'utf8');
+  const tmp = `${CONFIG_FILE}.${process.pid}.tmp`;
+  try {
+    fs.writeFileSync(tmp, JSON.stringify(config, null, 2), 'utf8');
+    fs.renameSync(tmp, CONFIG_FILE);
+  } catch (e) {
+    try { fs.unlinkSync(tmp); } catch {}
+    throw e;
+  }
 }
 
 /**
@@ -251,12 +271,43 @@ async function syncWatchlistToWebhook() {
   }
 }
 
+// ── Coalesced sync ────────────────────────────────────────────────────────────
+// Každé přidání do watchlistu by jinak spustilo vlastní GET + PUT na Helius
+// (a souběžné synce si můžou přepsat adresy navzájem). Změny v okně
+// SYNC_COALESCE_MS se sloučí do jednoho syncu; pokud zrovna nějaký běží,
+// naplánovaný počká na jeho dokončení, takže běží vždy nejvýš jeden.
+const SYNC_COALESCE_MS = 2000;
+let _pendingSync = null; // naplánovaný, ještě nespuštěný sync
+let _runningSync = null;
+let _syncFn      = syncWatchlistToWebhook; // testy nahrazují přes _setSyncFn
+
+function scheduleWatchlistSync() {
+  if (_pendingSync) return _pendingSync;
+  _pendingSync = new Promise((resolve, reject) => {
+    const timer = setTimeout(async () => {
+      if (_runningSync) await _runningSync.catch(() => {});
+      _pendingSync = null; // změny od teď potřebují další sync
+      const run = _syncFn();
+      _runningSync = run;
+      try { resolve(await run); } catch (e) { reject(e); } finally {
+        if (_runningSync === run) _runningSync = null;
+      }
+    }, SYNC_COALESCE_MS);
+    if (timer.unref) timer.unref();
+  });
+  return _pendingSync;
+}
+
+function _setSyncFn(fn) { _syncFn = fn || syncWatchlistToWebhook; }
+
 module.exports = {
   setupWebhook,
   addAddresses,
   removeAddresses,
   getWebhookStatus,
   syncWatchlistToWebhook,
+  scheduleWatchlistSync,
+  _setSyncFn,
   loadConfig,
   HeliusLimitError,
 };
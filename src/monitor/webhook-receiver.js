@@ -161,11 +161,18 @@ function rotateEventsFile() {
   }
 }
 
-function logEvent(parsed) {
+/**
+ * Zapíše celou dávku událostí jedním appendFileSync — Helius posílá více
+ * transakcí v jednom webhooku, takže jeden syscall místo jednoho na tx.
+ */
+function logEvents(parsedList) {
+  if (!parsedList.length) return;
   try {
-    // Kontrola velikosti každých 100 volání — rotace při překročení capu
-    if (logEvent._callCount === undefined) logEvent._callCount = 0;
-    if (++logEvent._callCount % 100 === 0) {
+    // Kontrola velikosti každých ~100 událostí — rotace při překročení capu
+    if (logEvents._count === undefined) logEvents._count = 0;
+    const before = logEvents._count;
+    logEvents._count += parsedList.length;
+    if (Math.floor(before / 100) !== Math.floor(logEvents._count / 100)) {
       try {
         const size = fs.statSync(EVENTS_FILE).size;
         if (size > EVENTS_MAX_BYTES) {
@@ -174,14 +181,17 @@ function logEvent(parsed) {
       } catch { /* soubor neexistuje — OK */ }
     }
 
-    const line = JSON.stringify({
-      sig:       parsed.signature,
-      ts:        parsed.timestamp,
-      type:      parsed.type,
-      accounts:  parsed.accounts.slice(0, 10), // limituj pro úsporu místa
-      programs:  parsed.programs,
-    }) + '\n';
-    fs.appendFileSync(EVENTS_FILE, line, 'utf8');
+    let payload = '';
+    for (const parsed of parsedList) {
+      payload += JSON.stringify({
+        sig:       parsed.signature,
+        ts:        parsed.timestamp,
+        type:      parsed.type,
+        accounts:  parsed.accounts.slice(0, 10), // limituj pro úsporu místa
+        programs:  parsed.programs,
+      }) + '\n';
+    }
+    fs.appendFileSync(EVENTS_FILE, payload, 'utf8');
   } catch (e) {
     console.error('[monitor] Failed to log event:', e.message);
   }
@@ -226,15 +236,16 @@ function detectOwnWalletPayment(parsed) {
 
   const totalLamports = incoming.reduce((s, t) => s + t.amount, 0);
   const sol = (totalLamports / 1e9).toFixed(6);
-  const blockTs = parsed.timestamp
+  const recordedAt = new Date().toISOString();
+  const blockTs    = parsed.timestamp
     ? new Date(parsed.timestamp).toISOString()
-    : new Date().toISOString();
+    : recordedAt;
 
   console.log(`[monitor] PAYMENT: sig=${parsed.signature?.slice(0,20)}... +${sol} SOL at ${blockTs}`);
 
   const entry = JSON.stringify({
     timestamp:   blockTs,
-    recorded_at: new Date().toISOString(),
+    recorded_at: recordedAt,
     source:      'helius_webhook',
     signature:   parsed.signature,
     lamports:    totalLamports,
@@ -273,12 +284,20 @@ async function handleHeliusWebhook(req, res) {
   const watched = await getWatchedAddresses();
   const watchedSet = new Map(watched.map(w => [w.address, w.entry]));
 
+  const parsedList = [];
   for (const rawTx of txList) {
     try {
       const parsed = parseEnhancedTransaction(rawTx);
       if (isDuplicate(parsed.signature)) continue;
-      logEvent(parsed);
+      parsedList.push(parsed);
+    } catch (e) {
+      console.error('[monitor] Error processing tx:', e.message);
+    }
+  }
+  logEvents(parsedList);
 
+  for (const parsed of parsedList) {
+    try {
       // Detekce příchozí platby na vlastní wallet (bez RPC pollingu)
       detectOwnWalletPayment(parsed);
 
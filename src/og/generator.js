@@ -1,17 +1,22 @@
 'use strict';
 
-const puppeteer = require('puppeteer');
 const fs        = require('fs').promises;
 const path      = require('path');
 
 let browser = null;
-const cache   = new Map(); // address -> { buffer, timestamp }
+// address -> { buffer, timestamp }. Map insertion order doubles as LRU order:
+// hits are re-inserted at the end, so the first key is always the eviction victim.
+const cache   = new Map();
+const CACHE_MAX    = 100;
 const CACHE_TTL_MS = 5 * 60 * 1000; // 5 min
 
 const CIRC = 2 * Math.PI * 130; // r=130 → 816.81
 
 async function getBrowser() {
   if (browser && browser.connected) return browser;
+  // Lazy require (same as report-generator.js) — server.js loads this module at
+  // startup, but puppeteer is only needed once the first OG image is rendered.
+  const puppeteer = require('puppeteer');
   browser = await puppeteer.launch({
     headless: true,
     args: [
@@ -85,6 +90,8 @@ function buildHtml(template, data, address) {
 async function generateOgImage(address) {
   const cached = cache.get(address);
   if (cached && Date.now() - cached.timestamp < CACHE_TTL_MS) {
+    cache.delete(address);
+    cache.set(address, cached);
     return cached.buffer;
   }
 
@@ -119,11 +126,11 @@ async function generateOgImage(address) {
     });
     const buffer = Buffer.from(shot);
 
+    cache.delete(address);
     cache.set(address, { buffer, timestamp: Date.now() });
-    // Evict oldest when cache exceeds 100 entries
-    if (cache.size > 100) {
-      const [oldest] = [...cache.entries()].sort((a, b) => a[1].timestamp - b[1].timestamp);
-      cache.delete(oldest[0]);
+    // Evict least recently used when cache exceeds CACHE_MAX entries
+    if (cache.size > CACHE_MAX) {
+      cache.delete(cache.keys().next().value);
     }
 
     return buffer;
@@ -184,10 +184,13 @@ function validateSolanaParam(paramName) {
 
 // ── Verify Key loader ─────────────────────────────────────────────────────────
 // Loaded lazily so the module can be required without the key being on disk yet.
+// Cached after the first successful read — every verify request pins against it.
 const VERIFY_KEY_PATH = process.env.VERIFY_KEY_PATH || '/root/.secrets/verify_key.bin';
+let _verifyKeyBytes = null;
 
 function getVerifyKeyBytes() {
-  return fs.readFileSync(VERIFY_KEY_PATH); // 32 raw bytes
+  if (!_verifyKeyBytes) _verifyKeyBytes = fs.readFileSync(VERIFY_KEY_PATH); // 32 raw bytes
+  return _verifyKeyBytes;
 }
 
 // ── POST /verify/v1/signed-receipt ────────────────────────────────────────────
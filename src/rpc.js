@@ -13,11 +13,11 @@
  *   const { SOLANA_RPC_URL } = require('../src/rpc');
  *
  * Použití s @solana/web3.js:
- *   const { connection } = require('../src/rpc');
+ *   const { getConnection } = require('../src/rpc');
+ *   const connection = getConnection();
  */
 
 const fs = require('fs');
-const { Connection } = require('@solana/web3.js');
 
 // ── Resolve RPC URL ───────────────────────────────────────────────────────────
 
@@ -62,11 +62,25 @@ if (rpcProvider === 'public') {
 }
 
 // ── @solana/web3.js Connection (pro kód který jej potřebuje) ──────────────────
+// Vytváří se až při prvním použití — scannery a server importují jen URL,
+// takže načtení @solana/web3.js a konstrukce Connection se při startu neplatí.
 
-const connection = new Connection(SOLANA_RPC_URL, {
-  commitment:                      'confirmed',
-  confirmTransactionInitialTimeout: 30_000,
-  disableRetryOnRateLimit:          false,
-});
+let _connection = null;
 
-module.exports = { SOLANA_RPC_URL, connection, rpcProvider };
+function getConnection() {
+  if (!_connection) {
+    const { Connection } = require('@solana/web3.js');
+    _connection = new Connection(SOLANA_RPC_URL, {
+      commitment:                      'confirmed',
+      confirmTransactionInitialTimeout: 30_000,
+      disableRetryOnRateLimit:          false,
+    });
+  }
+  return _connection;
+}
+
+module.exports = { SOLANA_RPC_URL, getConnection, rpcProvider };
+
+// Zpětná kompatibilita: `const { connection } = require(...)` stále funguje,
+// jen spustí lazy inicializaci.
+Object.defineProperty(module.exports, 'connection', { enumerable: true, get: getConnection });
@@ -1,14 +1,17 @@
 'use strict';
 const { PublicKey } = require('@solana/web3.js');
 
+const EVM_ADDRESS_RE    = /^0x[a-fA-F0-9]{40}$/;
+// Base58 alphabet has no '0', so this also rejects every 0x-prefixed EVM address.
+const SOLANA_ADDRESS_RE = /^[1-9A-HJ-NP-Za-km-z]{32,44}$/;
+
 function isEvmAddress(addr) {
-  return /^0x[a-fA-F0-9]{40}$/.test(addr);
+  return EVM_ADDRESS_RE.test(addr);
 }
 
 function isSolanaAddress(addr) {
   if (typeof addr !== 'string') return false;
-  if (isEvmAddress(addr)) return false;
-  if (!/^[1-9A-HJ-NP-Za-km-z]{32,44}$/.test(addr)) return false;
+  if (!SOLANA_ADDRESS_RE.test(addr)) return false;
   try {
     new PublicKey(addr);
     return true;
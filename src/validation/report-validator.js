@@ -21,7 +21,8 @@ function validateReport(llmReport, rawOnChainData) {
   if (!llmReport || typeof llmReport !== 'object') {
     return { valid: false, issues: [{ check: 'input_guard', action: 'escalate', message: 'llmReport is null or not an object' }] };
   }
-  const issues = [];
+  const issues   = [];
+  const findings = _indexFindings(llmReport.findings);
 
   _checkAddressNotFound(llmReport, issues);
   if (llmReport.status === 'address_not_found') {
@@ -30,8 +31,8 @@ function validateReport(llmReport, rawOnChainData) {
 
   _checkScoreBounds(llmReport, issues);
   _checkScoreLevelConsistency(llmReport, issues);
-  _checkMintAuthorityConsistency(llmReport, rawOnChainData, issues);
-  _checkTokenTypeConsistency(llmReport, rawOnChainData, issues);
+  _checkMintAuthorityConsistency(llmReport, rawOnChainData, issues, findings);
+  _checkTokenTypeConsistency(llmReport, rawOnChainData, issues, findings);
   _checkScamDbMatchScore(llmReport, issues);
   _checkProxyDetection(llmReport, issues);
   _checkHolderCountSanity(llmReport, rawOnChainData, issues);
@@ -40,6 +41,25 @@ function validateReport(llmReport, rawOnChainData) {
   return { valid: issues.length === 0, issues };
 }
 
+/**
+ * One pass over report.findings: categories as a Set and all labels lowercased
+ * into one string, so checks don't re-lowercase every label per lookup.
+ */
+function _indexFindings(findings) {
+  const categories = new Set();
+  const labels     = [];
+  for (const f of Array.isArray(findings) ? findings : []) {
+    if (!f) continue;
+    if (f.category) categories.add(f.category);
+    if (f.label) labels.push(String(f.label).toLowerCase());
+  }
+  return { categories, labels: labels.join('\n') };
+}
+
+function _hasFinding(findings, category, labelNeedle) {
+  return findings.categories.has(category) || findings.labels.includes(labelNeedle);
+}
+
 // ── Check #0: Address not found — score must be null ─────────────────────────
 
 function _checkAddressNotFound(report, issues) {
@@ -111,7 +131,7 @@ function _checkScoreLevelConsistency(report, issues) {
 
 // ── Check #3: Mint authority consistency ─────────────────────────────────────
 
-function _checkMintAuthorityConsistency(report, raw, issues) {
+function _checkMintAuthorityConsistency(report, raw, issues, findings) {
   if (!raw?.mint_info) return;
 
   const mintAuth  = raw.mint_info.mint_authority;
@@ -129,9 +149,7 @@ function _checkMintAuthorityConsistency(report, raw, issues) {
   }
 
   // If active mint authority is not mentioned in findings at all → escalate
-  const hasMintFinding = (report.findings || []).some(
-    f => f.category === 'mint-authority' || (f.label || '').toLowerCase().includes('mint authority')
-  );
+  const hasMintFinding = _hasFinding(findings, 'mint-authority', 'mint authority');
   if (isActive && !hasMintFinding) {
     issues.push({
       check:   'mint_authority_consistency',
@@ -143,7 +161,7 @@ function _checkMintAuthorityConsistency(report, raw, issues) {
 
 // ── Check #4: Token type consistency ─────────────────────────────────────────
 
-function _checkTokenTypeConsistency(report, raw, issues) {
+function _checkTokenTypeConsistency(report, raw, issues, findings) {
   if (!raw?.mint_info) return;
 
   const isToken2022 = raw.mint_info.is_token_2022;
@@ -152,9 +170,7 @@ function _checkTokenTypeConsistency(report, raw, issues) {
   // If Token-2022 but no mention in findings AND transfer fee extensions present
   const hasTransferFee = extensions.some(e => e.name === 'transferFeeConfig' || e.name === 'transfer_fee_config');
   if (isToken2022 && hasTransferFee) {
-    const hasFeeFinding = (report.findings || []).some(
-      f => f.category === 'transfer-fee' || (f.label || '').toLowerCase().includes('transfer fee')
-    );
+    const hasFeeFinding = _hasFinding(findings, 'transfer-fee', 'transfer fee');
     if (!hasFeeFinding) {
       issues.push({
         check:   'token_type_consistency',
@@ -262,18 +278,36 @@ function _checkFabricatedAddresses(report, raw, issues) {
   }
 
   // No EVM-style 0x addresses should appear in a Solana report
-  const allText = JSON.stringify(report);
-  const evmPattern = /\b0x[0-9a-fA-F]{40}\b/;
-  if (evmPattern.test(allText)) {
-    const matches = allText.match(/0x[0-9a-fA-F]{40}/g) || [];
+  const matches = new Set();
+  _collectEvmAddresses(report, matches);
+  if (matches.size > 0) {
     issues.push({
       check:   'fabricated_addresses',
       action:  'escalate',
-      message: `EVM-style address(es) found in Solana report: ${[...new Set(matches)].slice(0, 3).join(', ')}`,
+      message: `EVM-style address(es) found in Solana report: ${[...matches].slice(0, 3).join(', ')}`,
     });
   }
 }
 
+const EVM_ADDRESS_GLOBAL_RE = /\b0x[0-9a-fA-F]{40}\b/g;
+
+// Walks the parsed report once and scans string keys/leaves directly, instead of
+// re-serializing the whole report with JSON.stringify and regex-scanning it twice.
+function _collectEvmAddresses(node, out) {
+  if (typeof node === 'string') {
+    if (node.length >= 42 && node.includes('0x')) {
+      for (const m of node.match(EVM_ADDRESS_GLOBAL_RE) || []) out.add(m);
+    }
+  } else if (Array.isArray(node)) {
+    for (const v of node) _collectEvmAddresses(v, out);
+  } else if (node && typeof node === 'object') {
+    for (const k of Object.keys(node)) {
+      _collectEvmAddresses(k, out);
+      _collectEvmAddresses(node[k], out);
+    }
+  }
+}
+
 // ── Corrections ───────────────────────────────────────────────────────────────
 
 /**
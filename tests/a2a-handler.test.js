@@ -395,6 +395,25 @@ async function main() {
       assert.strictEqual(res.body.error?.code, -32601);
     });
 
+    await test('batch of tasks/get returns one response per call, in order', async () => {
+      const res = await httpPost(TEST_PORT, '/a2a', [
+        rpc('tasks/get', { id: 'nonexistent-batch-a' }, 1),
+        rpc('tasks/cancel', {}, 2),
+        rpc('tasks/send', {}, 3),
+      ]);
+      assert.strictEqual(res.statusCode, 200);
+      assert.ok(Array.isArray(res.body), 'Expected array response');
+      assert.deepStrictEqual(res.body.map(r => r.id), [1, 2, 3]);
+      assert.strictEqual(res.body[0].error?.code, -32001);
+      assert.strictEqual(res.body[1].error?.code, -32602);
+      assert.strictEqual(res.body[2].error?.code, -32600, 'tasks/send must not be batchable');
+    });
+
+    await test('empty batch returns HTTP 400', async () => {
+      const res = await httpPost(TEST_PORT, '/a2a', []);
+      assert.strictEqual(res.statusCode, 400);
+    });
+
     await test('missing jsonrpc field returns HTTP 400', async () => {
       const res = await httpPost(TEST_PORT, '/a2a', { method: 'tasks/get', params: {}, id: 1 });
       assert.strictEqual(res.statusCode, 400, `Expected 400, got ${res.statusCode}`);
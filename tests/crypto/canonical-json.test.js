@@ -0,0 +1,143 @@
+'use strict';
+/**
+ * tests/crypto/canonical-json.test.js
+ *
+ * Golden test for canonicalJSON() in src/crypto/sign.js. Signed receipts are
+ * verified against this exact byte sequence, so the single-pass serializer
+ * must match the original recursive implementation (kept below verbatim) on:
+ *   - nested objects and arrays (objects inside arrays are not re-sorted)
+ *   - integer-like keys (numeric order, before string keys)
+ *   - `__proto__` own keys (dropped)
+ *   - undefined / function values (bare `undefined` token)
+ *   - randomly generated payloads
+ *
+ * Pure function tests — no signing script, no network.
+ *
+ * Run: node tests/crypto/canonical-json.test.js
+ */
+
+const assert = require('assert');
+const { canonicalJSON } = require('../../src/crypto/sign');
+
+// Baseline implementation before the single-pass rewrite — do not "fix".
+function baselineCanonicalJSON(obj) {
+  if (obj === null || typeof obj !== 'object' || Array.isArray(obj)) {
+    return JSON.stringify(obj);
+  }
+  const sorted = Object.keys(obj).sort().reduce((acc, k) => {
+    acc[k] = obj[k];
+    return acc;
+  }, {});
+  return '{' + Object.keys(sorted).map(k =>
+    JSON.stringify(k) + ':' + baselineCanonicalJSON(sorted[k])
+  ).join(',') + '}';
+}
+
+let passed = 0;
+let failed = 0;
+
+async function test(name, fn) {
+  try {
+    await fn();
+    console.log(`  ✓ ${name}`);
+    passed++;
+  } catch (e) {
+    console.error(`  ✗ ${name}\n    ${e.message}`);
+    failed++;
+  }
+}
+
+function same(value) {
+  assert.strictEqual(canonicalJSON(value), baselineCanonicalJSON(value));
+}
+
+// Deterministický PRNG (mulberry32), aby případné selhání šlo zopakovat
+function rng(seed) {
+  return () => {
+    seed = (seed + 0x6D2B79F5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const KEY_POOL = ['a', 'b', 'Z', '0', '1', '10', '2', '01', '-1', '1.5', '4294967294', '4294967295',
+  '__proto__', 'constructor', 'é', ' ', '', 'risk_score', 'findings'];
+
+function randomValue(rand, depth) {
+  const r = rand();
+  if (depth > 3 || r < 0.35) {
+    const leaves = [null, true, false, 0, -1.5, 1e21, 'x', 'ü"\\\n', undefined, () => 1, NaN];
+    return leaves[Math.floor(rand() * leaves.length)];
+  }
+  if (r < 0.55) {
+    const len = Math.floor(rand() * 4);
+    return Array.from({ length: len }, () => randomValue(rand, depth + 1));
+  }
+  const obj = {};
+  const n = Math.floor(rand() * 6);
+  for (let i = 0; i < n; i++) {
+    const k = KEY_POOL[Math.floor(rand() * KEY_POOL.length)];
+    Object.defineProperty(obj, k, { value: randomValue(rand, depth + 1), enumerable: true, configurable: true, writable: true });
+  }
+  return obj;
+}
+
+async function run() {
+  console.log('\n── canonicalJSON Golden Tests ─────────────────────────────────────────────────\n');
+
+  await test('pinned output for a nested receipt payload', async () => {
+    const payload = {
+      verdict: 'SAFE',
+      address: 'Mint1111',
+      meta:    { z: 1, a: [ { y: 2, x: 1 } ], m: null },
+      score:   12.5,
+    };
+    const expected = '{"address":"Mint1111","meta":{"a":[{"y":2,"x":1}],"m":null,"z":1},"score":12.5,"verdict":"SAFE"}';
+    assert.strictEqual(canonicalJSON(payload), expected);
+    same(payload);
+  });
+
+  await test('integer-like keys come first in numeric order', async () => {
+    const value = { b: 1, 10: 'ten', 2: 'two', a: 0, '01': 'lead', '-1': 'neg' };
+    assert.strictEqual(
+      canonicalJSON(value),
+      '{"2":"two","10":"ten","-1":"neg","01":"lead","a":0,"b":1}'
+    );
+    same(value);
+  });
+
+  await test('keys at the array-index boundary', async () => {
+    same({ 4294967294: 'max-index', 4294967295: 'not-index', 1: 'one', a: 'a' });
+  });
+
+  await test('own __proto__ key is dropped', async () => {
+    const value = JSON.parse('{"__proto__":{"polluted":true},"b":1,"a":{"__proto__":2,"c":3}}');
+    assert.strictEqual(canonicalJSON(value), '{"a":{"c":3},"b":1}');
+    same(value);
+  });
+
+  await test('undefined and function values render as bare undefined', async () => {
+    const value = { a: undefined, b: () => 1, c: [undefined, () => 1] };
+    assert.strictEqual(canonicalJSON(value), '{"a":undefined,"b":undefined,"c":[null,null]}');
+    same(value);
+  });
+
+  await test('top-level primitives and arrays', async () => {
+    for (const v of [null, 0, 'str', true, [], [3, { b: 1, a: 2 }], undefined]) same(v);
+  });
+
+  await test('random payloads match the baseline (2000 cases)', async () => {
+    const rand = rng(0xC0FFEE);
+    for (let i = 0; i < 2000; i++) {
+      const v = randomValue(rand, 0);
+      const got = canonicalJSON(v), want = baselineCanonicalJSON(v);
+      assert.strictEqual(got, want, `case ${i}: ${want}`);
+    }
+  });
+
+  console.log(`\nResults: ${passed} passed, ${failed} failed\n`);
+  if (failed > 0) process.exit(1);
+}
+
+run().catch(e => { console.error(e); process.exit(1); });
@@ -0,0 +1,87 @@
+'use strict';
+/**
+ * tests/db-api-keys.test.js
+ *
+ * validateApiKey() cache in db.js:
+ *   - returns only the authorization fields (id, email, tier, active)
+ *   - revokeApiKey() takes effect on the very next validation (no TTL wait)
+ *   - revoking one key leaves other cached keys valid
+ *   - usage counters are read from the table, not from the cache
+ *
+ * Uses an in-memory SQLite database — no running server required.
+ *
+ * Run: node tests/db-api-keys.test.js
+ */
+
+process.env.SQLITE_DB_PATH = ':memory:';
+const assert = require('assert');
+let pass = 0, fail = 0;
+async function test(name, fn) {
+  try { await fn(); console.log('  ✓', name); pass++; }
+  catch (e) { console.error('  ✗', name, '\n   ', e.message); fail++; }
+}
+
+const db = require('../db');
+
+const EMAIL = 'keys@test.com';
+
+async function main() {
+  await db.initSchema();
+
+  console.log('\n── API key cache tests ──\n');
+
+  const k1 = await db.createApiKey({ email: EMAIL, tier: 'pro', label: 'one' });
+  const k2 = await db.createApiKey({ email: EMAIL, tier: 'pro', label: 'two' });
+
+  await test('validateApiKey returns only authorization fields', async () => {
+    const rec = await db.validateApiKey(k1.key);
+    assert.deepStrictEqual(rec, { id: k1.id, email: EMAIL, tier: 'pro', active: 1 });
+  });
+
+  await test('unknown and malformed keys are rejected', async () => {
+    assert.strictEqual(await db.validateApiKey('im_' + '0'.repeat(64)), null);
+    assert.strictEqual(await db.validateApiKey('sk_nope'), null);
+    assert.strictEqual(await db.validateApiKey(''), null);
+  });
+
+  await test('revoke takes effect immediately for a cached key', async () => {
+    assert.ok(await db.validateApiKey(k1.key), 'key should be valid and cached');
+    assert.ok(await db.validateApiKey(k2.key), 'second key should be valid and cached');
+    assert.strictEqual(await db.revokeApiKey(k1.id, EMAIL), true);
+    assert.strictEqual(await db.validateApiKey(k1.key), null, 'revoked key must not be served from cache');
+  });
+
+  await test('revoking one key keeps the other valid', async () => {
+    const rec = await db.validateApiKey(k2.key);
+    assert.ok(rec);
+    assert.strictEqual(rec.id, k2.id);
+  });
+
+  await test('revoke by string id (route params) also invalidates', async () => {
+    assert.ok(await db.validateApiKey(k2.key));
+    assert.strictEqual(await db.revokeApiKey(String(k2.id), EMAIL), true);
+    assert.strictEqual(await db.validateApiKey(k2.key), null);
+  });
+
+  await test('revoke with the wrong email does not touch the cache', async () => {
+    const k3 = await db.createApiKey({ email: EMAIL, tier: 'pro' });
+    assert.ok(await db.validateApiKey(k3.key));
+    assert.strictEqual(await db.revokeApiKey(k3.id, 'other@test.com'), false);
+    assert.ok(await db.validateApiKey(k3.key));
+  });
+
+  await test('usage counters come from the table after validation', async () => {
+    const k4 = await db.createApiKey({ email: 'usage@test.com', tier: 'pro' });
+    const rec = await db.validateApiKey(k4.key);
+    await db.incrementApiKeyUsage(rec.id);
+    await db.incrementApiKeyUsage(rec.id);
+    const [listed] = await db.listApiKeys('usage@test.com');
+    assert.strictEqual(listed.usage_count, 2);
+    assert.ok(listed.last_used_at);
+  });
+
+  console.log(`\nVýsledek: ${pass} passed, ${fail} failed`);
+  if (fail > 0) process.exit(1);
+}
+
+main().catch(e => { console.error('[FATAL]', e); process.exit(1); });
@@ -0,0 +1,107 @@
+'use strict';
+/**
+ * tests/db-events.test.js
+ *
+ * Buffered logEvent() / flushEvents() in db.js:
+ *   - events below EVENT_FLUSH_MAX wait in the buffer until flushEvents()
+ *   - reaching EVENT_FLUSH_MAX writes the batch synchronously
+ *   - the logEvent() promise settles only after its batch is written
+ *   - /stats readers of the events table (getFunnelStats, getPageviewStats)
+ *     see buffered events
+ *   - a failed insert rejects the promise instead of resolving silently
+ *
+ * Uses an in-memory SQLite database — no running server required.
+ *
+ * Run: node tests/db-events.test.js
+ */
+
+process.env.SQLITE_DB_PATH = ':memory:';
+const assert = require('assert');
+let pass = 0, fail = 0;
+async function test(name, fn) {
+  try { await fn(); console.log('  ✓', name); pass++; }
+  catch (e) { console.error('  ✗', name, '\n   ', e.message); fail++; }
+}
+
+const db = require('../db');
+
+const EVENT_FLUSH_MAX = 200;
+
+function countEvents(name) {
+  return db.db.prepare('SELECT COUNT(*) AS n FROM events WHERE name = ?').get(name).n;
+}
+
+async function main() {
+  await db.initSchema();
+
+  console.log('\n── Event buffer tests ──\n');
+
+  await test('logEvent buffers until flushEvents()', async () => {
+    let settled = false;
+    const p = db.logEvent({ name: 'buf_small', ip: '1.1.1.1' }).then(() => { settled = true; });
+    await new Promise(r => setImmediate(r));
+    assert.strictEqual(countEvents('buf_small'), 0, 'event should still be buffered');
+    assert.strictEqual(settled, false, 'promise must not resolve before the write');
+    db.flushEvents();
+    await p;
+    assert.strictEqual(countEvents('buf_small'), 1);
+  });
+
+  await test('reaching EVENT_FLUSH_MAX flushes the batch synchronously', async () => {
+    const promises = [];
+    for (let i = 0; i < EVENT_FLUSH_MAX - 1; i++) {
+      promises.push(db.logEvent({ name: 'buf_threshold', resource: String(i) }));
+    }
+    assert.strictEqual(countEvents('buf_threshold'), 0, 'below threshold nothing is written');
+    promises.push(db.logEvent({ name: 'buf_threshold', resource: 'last' }));
+    assert.strictEqual(countEvents('buf_threshold'), EVENT_FLUSH_MAX, 'threshold write is synchronous');
+    await Promise.all(promises);
+  });
+
+  await test('partial batch is written without an explicit flushEvents()', async () => {
+    const p = db.logEvent({ name: 'buf_timer' });
+    await p;
+    assert.strictEqual(countEvents('buf_timer'), 1);
+  });
+
+  await test('getFunnelStats sees buffered events (/stats)', async () => {
+    const p = db.logEvent({ name: 'buf_funnel', ip: '2.2.2.2' });
+    const rows = await db.getFunnelStats(1);
+    const row  = rows.find(r => r.name === 'buf_funnel');
+    assert.ok(row, 'buffered event missing from funnel stats');
+    assert.strictEqual(row.total, 1);
+    await p;
+  });
+
+  await test('getPageviewStats sees buffered page views (/stats)', async () => {
+    const p = db.logEvent({ name: 'page_view', ip: '3.3.3.3', meta: { path: '/buf-test' } });
+    const rows = await db.getPageviewStats(1);
+    const row  = rows.find(r => r.path === '/buf-test');
+    assert.ok(row, 'buffered page view missing from pageview stats');
+    assert.strictEqual(row.views, 1);
+    await p;
+  });
+
+  await test('meta is stored as JSON with the enqueue timestamp', async () => {
+    const before = new Date().toISOString().replace('T', ' ').slice(0, 19);
+    const p = db.logEvent({ name: 'buf_meta', meta: { path: '/x' } });
+    db.flushEvents();
+    await p;
+    const row = db.db.prepare("SELECT meta, created_at FROM events WHERE name = 'buf_meta'").get();
+    assert.deepStrictEqual(JSON.parse(row.meta), { path: '/x' });
+    assert.ok(row.created_at >= before, `created_at ${row.created_at} < ${before}`);
+  });
+
+  // Musí běžet poslední — zahodí tabulku events
+  await test('failed insert rejects the logEvent promise', async () => {
+    db.db.exec('DROP TABLE events');
+    const p = db.logEvent({ name: 'buf_fail' });
+    db.flushEvents();
+    await assert.rejects(p, /no such table/);
+  });
+
+  console.log(`\nVýsledek: ${pass} passed, ${fail} failed`);
+  if (fail > 0) process.exit(1);
+}
+
+main().catch(e => { console.error('[FATAL]', e); process.exit(1); });
@@ -0,0 +1,120 @@
+'use strict';
+/**
+ * tests/llm/advisor-budget.test.js
+ *
+ * Token budget (admission control) in src/llm/anthropic-advisor.js:
+ *   - requests within the budget are admitted immediately
+ *   - a waiting request is rejected after ADVISOR_QUEUE_WAIT_MS
+ *   - the queue is bounded by ADVISOR_QUEUE_MAX
+ *   - a large request at the head does not block smaller ones behind it
+ *   - released credits admit queued requests
+ *   - the OpenRouter fallback does not consume the Anthropic budget
+ *
+ * No network — global fetch is replaced for the OpenRouter case.
+ *
+ * Run: node tests/llm/advisor-budget.test.js
+ */
+
+const BUDGET = 20_000;
+process.env.ADVISOR_TOKENS_PER_MIN = String(BUDGET);
+process.env.ADVISOR_QUEUE_MAX      = '2';
+process.env.ADVISOR_QUEUE_WAIT_MS  = '100';
+
+const assert = require('assert');
+const {
+  runWithAdvisor,
+  _acquireCredits,
+  _releaseCredits,
+} = require('../../src/llm/anthropic-advisor');
+
+let passed = 0;
+let failed = 0;
+
+async function test(name, fn) {
+  try {
+    await fn();
+    console.log(`  ✓ ${name}`);
+    passed++;
+  } catch (e) {
+    console.error(`  ✗ ${name}\n    ${e.message}`);
+    failed++;
+  }
+}
+
+/** Resolves to 'pending' if p has not settled by the next macrotask. */
+function state(p) {
+  return Promise.race([
+    p.then(() => 'resolved', () => 'rejected'),
+    new Promise(r => setImmediate(() => r('pending'))),
+  ]);
+}
+
+async function run() {
+  console.log('\n── Advisor Token Budget Tests ─────────────────────────────────────────────────\n');
+
+  await test('request within budget is admitted immediately', async () => {
+    const p = _acquireCredits(15_000);
+    assert.strictEqual(await state(p), 'resolved');
+    assert.strictEqual(await p, 15_000);
+  });
+
+  // 5 000 kreditů zbývá
+  await test('waiting request is rejected after ADVISOR_QUEUE_WAIT_MS', async () => {
+    const t0 = Date.now();
+    await assert.rejects(_acquireCredits(10_000), /no capacity within 100ms/);
+    assert.ok(Date.now() - t0 >= 90, 'should wait before rejecting');
+  });
+
+  await test('queue length is bounded by ADVISOR_QUEUE_MAX', async () => {
+    const a = _acquireCredits(10_000);
+    const b = _acquireCredits(10_000);
+    await assert.rejects(_acquireCredits(10_000), /budget exhausted \(2 requests queued\)/);
+    await assert.rejects(a);
+    await assert.rejects(b);
+  });
+
+  await test('large request at the head does not block a smaller one', async () => {
+    const big   = _acquireCredits(BUDGET);
+    const small = _acquireCredits(3_000);
+    assert.strictEqual(await state(big), 'pending');
+    assert.strictEqual(await state(small), 'resolved');
+    await assert.rejects(big);
+  });
+
+  // 2 000 kreditů zbývá
+  await test('released credits admit queued requests first-fit', async () => {
+    const big   = _acquireCredits(BUDGET);
+    const mid   = _acquireCredits(8_000);
+    assert.strictEqual(await state(mid), 'pending');
+    _releaseCredits(6_000); // 8 000 volných → mid projde, big dál čeká
+    assert.strictEqual(await state(mid), 'resolved');
+    assert.strictEqual(await state(big), 'pending');
+    _releaseCredits(15_000 + 3_000 + 8_000 - 6_000); // vše zpět → big projde
+    assert.strictEqual(await big, BUDGET);
+    _releaseCredits(BUDGET);
+  });
+
+  await test('OpenRouter fallback does not consume the budget', async () => {
+    delete process.env.ANTHROPIC_API_KEY;
+    process.env.OPENROUTER_API_KEY = 'test-key';
+    const realFetch = global.fetch;
+    global.fetch = async () => ({
+      ok:   true,
+      json: async () => ({ choices: [{ message: { content: 'ok' } }], usage: {} }),
+    });
+    try {
+      const result = await runWithAdvisor({ systemPrompt: 's', userMessage: 'x'.repeat(400_000) });
+      assert.strictEqual(result.provider, 'openrouter');
+    } finally {
+      global.fetch = realFetch;
+    }
+    const full = _acquireCredits(BUDGET);
+    assert.strictEqual(await state(full), 'resolved', 'full budget should still be available');
+    _releaseCredits(await full);
+  });
+
+  console.log(`\nResults: ${passed} passed, ${failed} failed\n`);
+  if (failed > 0) process.exit(1);
+}
+
+run().catch(e => { console.error(e); process.exit(1); });
@@ -279,6 +279,52 @@ async function main() {
     assert.strictEqual(parsed.tokenTransfers[0].amount, 5000);
   });
 
+  // ── [4] Webhook Manager — sloučený sync ──────────────────────────────────
+  console.log('\n[4] Webhook Manager — sloučený sync watchlistu\n');
+
+  const { scheduleWatchlistSync, _setSyncFn } = require('../src/monitor/webhook-manager');
+  const sleep = ms => new Promise(r => setTimeout(r, ms));
+  // Timery syncu jsou unref() — bez ref'd intervalu by proces skončil dřív
+  const keepAlive = setInterval(() => {}, 1000);
+
+  await test('scheduleWatchlistSync — přidání v jednom okně → jeden sync', async () => {
+    let calls = 0;
+    _setSyncFn(async () => { calls++; });
+    const promises = [];
+    for (let i = 0; i < 5; i++) promises.push(scheduleWatchlistSync());
+    assert(promises.every(p => p === promises[0]), 'Volání v okně musí sdílet jeden promise');
+    assert.strictEqual(calls, 0, 'Sync se nesmí spustit před koncem okna');
+    await Promise.all(promises);
+    assert.strictEqual(calls, 1);
+  });
+
+  await test('scheduleWatchlistSync — během běžícího syncu čeká další na jeho konec', async () => {
+    let calls = 0, running = 0, maxRunning = 0;
+    _setSyncFn(async () => {
+      calls++; running++; maxRunning = Math.max(maxRunning, running);
+      await sleep(2500);
+      running--;
+    });
+    const first = scheduleWatchlistSync();
+    await sleep(2100); // první sync právě běží
+    const second = scheduleWatchlistSync();
+    assert.notStrictEqual(second, first, 'Po spuštění syncu se plánuje nový');
+    await Promise.all([first, second]);
+    assert.strictEqual(calls, 2);
+    assert.strictEqual(maxRunning, 1, 'Souběžně smí běžet nejvýš jeden sync');
+  });
+
+  await test('scheduleWatchlistSync — chyba syncu dorazí ke všem volajícím', async () => {
+    _setSyncFn(async () => { throw new Error('helius down'); });
+    const a = scheduleWatchlistSync();
+    const b = scheduleWatchlistSync();
+    await assert.rejects(a, /helius down/);
+    await assert.rejects(b, /helius down/);
+  });
+
+  _setSyncFn(null);
+  clearInterval(keepAlive);
+
   // ── Výsledky ──────────────────────────────────────────────────────────────
   console.log(`\n${'─'.repeat(50)}`);
   console.log(`Tests: ${passed + failed} total, ${passed} passed, ${failed} failed`);
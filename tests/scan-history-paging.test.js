@@ -0,0 +1,106 @@
+'use strict';
+/**
+ * tests/scan-history-paging.test.js
+ *
+ * Keyset pagination of getScanHistory() (GET /scan/history?before=<created_at>|<id>):
+ *   - first page is newest-first, ties on created_at broken by id
+ *   - paging with the last row's (created_at, id) cursor visits every row once,
+ *     including rows that share the same created_at across a page boundary
+ *   - other users' rows never leak into the page
+ *   - the per-email index serves the query without a temp sort
+ *
+ * Uses an in-memory SQLite database — no running server required.
+ *
+ * Run: node tests/scan-history-paging.test.js
+ */
+
+process.env.SQLITE_DB_PATH = ':memory:';
+const assert = require('assert');
+let pass = 0, fail = 0;
+async function test(name, fn) {
+  try { await fn(); console.log('  ✓', name); pass++; }
+  catch (e) { console.error('  ✗', name, '\n   ', e.message); fail++; }
+}
+
+const db = require('../db');
+
+const EMAIL = 'pager@test.com';
+
+function insertRow(email, created_at) {
+  return db.db.prepare(
+    'INSERT INTO scan_history (email, address, scan_type, created_at) VALUES (?, ?, ?, ?)'
+  ).run(email, 'Addr' + Math.random().toString(36).slice(2), 'quick', created_at).lastInsertRowid;
+}
+
+// Stejná logika jako route — kurzor z posledního řádku plné stránky
+async function pageAll(email, limit) {
+  const pages = [];
+  let before = null;
+  for (;;) {
+    const rows = await db.getScanHistory(email, limit, before);
+    pages.push(rows);
+    if (rows.length < limit) return pages;
+    const last = rows[rows.length - 1];
+    before = { created_at: last.created_at, id: last.id };
+  }
+}
+
+async function main() {
+  await db.initSchema();
+
+  // 3 řádky se stejným created_at, aby hranice stránky (limit 2) padla doprostřed
+  const ids = [
+    insertRow(EMAIL, '2026-01-01 10:00:00'),
+    insertRow(EMAIL, '2026-01-02 10:00:00'),
+    insertRow(EMAIL, '2026-01-02 10:00:00'),
+    insertRow(EMAIL, '2026-01-02 10:00:00'),
+    insertRow(EMAIL, '2026-01-03 10:00:00'),
+  ];
+  insertRow('other@test.com', '2026-01-02 10:00:00');
+
+  console.log('\n── Scan history keyset paging tests ──\n');
+
+  await test('first page is newest-first with id tie-break', async () => {
+    const rows = await db.getScanHistory(EMAIL, 3);
+    assert.deepStrictEqual(rows.map(r => r.id), [ids[4], ids[3], ids[2]]);
+  });
+
+  await test('cursor resumes inside a run of equal created_at values', async () => {
+    const rows = await db.getScanHistory(EMAIL, 10, { created_at: '2026-01-02 10:00:00', id: ids[3] });
+    assert.deepStrictEqual(rows.map(r => r.id), [ids[2], ids[1], ids[0]]);
+  });
+
+  await test('paging visits every row exactly once', async () => {
+    const pages = await pageAll(EMAIL, 2);
+    const seen  = pages.flat().map(r => r.id);
+    assert.deepStrictEqual(seen, [ids[4], ids[3], ids[2], ids[1], ids[0]]);
+    assert.strictEqual(pages.length, 3);
+  });
+
+  await test('exact multiple of limit ends with an empty page', async () => {
+    const pages = await pageAll(EMAIL, 5);
+    assert.strictEqual(pages[0].length, 5);
+    assert.deepStrictEqual(pages[1], []);
+  });
+
+  await test('other users are not included', async () => {
+    const rows = await db.getScanHistory(EMAIL, 50);
+    assert.strictEqual(rows.length, ids.length);
+  });
+
+  await test('query plan uses the per-email index without a temp sort', async () => {
+    const plan = db.db.prepare(`
+      EXPLAIN QUERY PLAN
+      SELECT id, address, scan_type, risk_score, risk_level, summary, cached, created_at
+      FROM scan_history WHERE email = ? AND (created_at, id) < (?, ?)
+      ORDER BY created_at DESC, id DESC LIMIT ?
+    `).all(EMAIL, '2026-01-02 10:00:00', 1, 2).map(r => r.detail).join('\n');
+    assert.ok(plan.includes('scan_history_email_page'), plan);
+    assert.ok(!plan.includes('TEMP B-TREE'), plan);
+  });
+
+  console.log(`\nVýsledek: ${pass} passed, ${fail} failed`);
+  if (fail > 0) process.exit(1);
+}
+
+main().catch(e => { console.error('[FATAL]', e); process.exit(1); });
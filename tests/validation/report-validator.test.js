@@ -175,6 +175,17 @@ async function run() {
     assert.strictEqual(issue.action, 'escalate');
   });
 
+  await test('EVM address nested in findings is detected once', async () => {
+    const addr   = '0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913';
+    const report = makeReport({
+      findings: [{ title: 'x', detail: `seen ${addr}` }, { refs: [addr] }],
+    });
+    const result = validateReport(report, makeRaw());
+    const issue  = result.issues.find(i => i.check === 'fabricated_addresses');
+    assert.ok(issue, 'should detect EVM address in nested findings');
+    assert.ok(issue.message.endsWith(addr), 'duplicates should be collapsed');
+  });
+
   await test('mint_address mismatch triggers fabricated_addresses escalation', async () => {
     const report = makeReport({ mint_address: 'ReportMintAddressXXXXXXXXXXXXXXXXXXXXX' });
     const raw    = makeRaw({ mint_address: 'DifferentMintAddrXXXXXXXXXXXXXXXXXXXXX' });